@@ -1,11 +1,34 @@
 """Sleep biometrics monitoring using TI IWR6843AOPEVM mmWave radar."""
 __version__ = "0.5.0"
 
-from ambient.processing.pipeline import ProcessedFrame, ProcessingPipeline
-from ambient.sensor.config import ChirpConfig, SerialConfig, create_vital_signs_config
-from ambient.sensor.frame import DetectedPoint, FrameBuffer, RadarFrame
-from ambient.sensor.radar import RadarSensor, SensorDisconnectedError
-from ambient.vitals.extractor import ChirpVitalsProcessor, VitalsExtractor, VitalSigns
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+	from ambient.processing.pipeline import ProcessedFrame, ProcessingPipeline
+	from ambient.sensor.config import ChirpConfig, SerialConfig, create_vital_signs_config
+	from ambient.sensor.frame import DetectedPoint, FrameBuffer, RadarFrame
+	from ambient.sensor.radar import RadarSensor, SensorDisconnectedError
+	from ambient.vitals.extractor import ChirpVitalsProcessor, VitalsExtractor, VitalSigns
+
+# Public name -> defining module. Resolved on first access (PEP 562), so
+# importing a light submodule such as ambient.config does not pull in
+# scipy through the processing and vitals packages.
+_EXPORTS = {
+	"RadarSensor": "ambient.sensor.radar",
+	"SensorDisconnectedError": "ambient.sensor.radar",
+	"RadarFrame": "ambient.sensor.frame",
+	"DetectedPoint": "ambient.sensor.frame",
+	"FrameBuffer": "ambient.sensor.frame",
+	"ChirpConfig": "ambient.sensor.config",
+	"SerialConfig": "ambient.sensor.config",
+	"create_vital_signs_config": "ambient.sensor.config",
+	"ProcessingPipeline": "ambient.processing.pipeline",
+	"ProcessedFrame": "ambient.processing.pipeline",
+	"VitalsExtractor": "ambient.vitals.extractor",
+	"ChirpVitalsProcessor": "ambient.vitals.extractor",
+	"VitalSigns": "ambient.vitals.extractor",
+}
 
 __all__ = [
 	"RadarSensor",
@@ -22,3 +45,16 @@ __all__ = [
 	"ChirpVitalsProcessor",
 	"VitalSigns",
 ]
+
+
+def __getattr__(name: str) -> Any:
+	module = _EXPORTS.get(name)
+	if module is None:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	value = getattr(importlib.import_module(module), name)
+	globals()[name] = value
+	return value
+
+
+def __dir__() -> list[str]:
+	return sorted([*globals(), *_EXPORTS])
@@ -8,6 +8,7 @@ import time
 from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from threading import Lock
 from typing import TYPE_CHECKING
@@ -38,19 +39,34 @@ CHIRP_DETECTION_PATTERNS = [
 	r"target detection",
 ]
 
+# Responses from standard firmware that rejected the chirp command
+_ERROR_PATTERNS = ["error", "unknown command", "invalid", "not found"]
 
-@dataclass
+# One alternation per pattern list, so detection is a single regex scan.
+# Each chirp pattern gets a named group; Match.lastgroup maps back to it.
+_CHIRP_GROUPS = {f"p{i}": pattern for i, pattern in enumerate(CHIRP_DETECTION_PATTERNS)}
+_CHIRP_RE = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in _CHIRP_GROUPS.items()), re.IGNORECASE)
+_ERROR_RE = re.compile("|".join(re.escape(pattern) for pattern in _ERROR_PATTERNS), re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
 class ChirpDetectionResult:
-	"""Result of chirp firmware detection."""
+	"""Result of chirp firmware detection (immutable, so results can be cached)."""
 	is_chirp: bool
 	response: str
 	matched_pattern: str | None = None
 	error: str | None = None
 
 
+@lru_cache(maxsize=128)
 def detect_chirp_firmware(response: str) -> ChirpDetectionResult:
 	"""Detect if response indicates chirp firmware.
 
+	Firmware repeats the same status text on every probe, so results are
+	memoized per response string. Error keywords take precedence over chirp
+	patterns; within each list, the match that occurs earliest in the
+	response is the one reported (not the first pattern in list order).
+
 	Args:
 		response: Response string from 'chirp status' command
 
@@ -64,26 +80,23 @@ def detect_chirp_firmware(response: str) -> ChirpDetectionResult:
 			error="Empty response"
 		)
 
-	response_lower = response.lower()
-
 	# Check for error responses that indicate standard firmware
-	error_patterns = ["error", "unknown command", "invalid", "not found"]
-	for pattern in error_patterns:
-		if pattern in response_lower:
-			return ChirpDetectionResult(
-				is_chirp=False,
-				response=response,
-				error=f"Error response: {pattern}"
-			)
-
-	# Check for chirp-specific patterns
-	for pattern in CHIRP_DETECTION_PATTERNS:
-		if re.search(pattern, response, re.IGNORECASE):
-			return ChirpDetectionResult(
-				is_chirp=True,
-				response=response,
-				matched_pattern=pattern
-			)
+	error = _ERROR_RE.search(response)
+	if error:
+		return ChirpDetectionResult(
+			is_chirp=False,
+			response=response,
+			error=f"Error response: {error.group(0).lower()}"
+		)
+
+	# Check for chirp-specific patterns (earliest match in the response wins)
+	match = _CHIRP_RE.search(response)
+	if match and match.lastgroup is not None:
+		return ChirpDetectionResult(
+			is_chirp=True,
+			response=response,
+			matched_pattern=_CHIRP_GROUPS[match.lastgroup]
+		)
 
 	return ChirpDetectionResult(
 		is_chirp=False,
@@ -8,6 +8,7 @@ from __future__ import annotations
 import json
 import logging
 import os
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -15,7 +16,7 @@ from typing import Any
 import structlog
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorConfig:
 	"""Sensor connection configuration.
 
@@ -33,7 +34,7 @@ class SensorConfig:
 	reconnect_delay: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class APIConfig:
 	"""API server configuration."""
 
@@ -43,7 +44,7 @@ class APIConfig:
 	log_level: str = "INFO"
 
 
-@dataclass
+@dataclass(slots=True)
 class PathsConfig:
 	"""File paths configuration."""
 
@@ -52,7 +53,7 @@ class PathsConfig:
 	log_dir: Path = field(default_factory=lambda: Path("logs"))
 
 
-@dataclass
+@dataclass(slots=True)
 class VitalsConfig:
 	"""Vital signs extraction configuration."""
 
@@ -65,7 +66,7 @@ class VitalsConfig:
 	motion_threshold: float = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceConfig:
 	"""Performance profiling configuration."""
 
@@ -74,7 +75,7 @@ class PerformanceConfig:
 	sample_rate: float = 1.0  # Sample rate for profiling (1.0 = every frame)
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamingConfig:
 	"""WebSocket streaming and broadcast configuration."""
 
@@ -108,7 +109,7 @@ class StreamingConfig:
 		return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class ChirpModeConfig:
 	"""Chirp firmware mode configuration."""
 
@@ -157,7 +158,38 @@ class ChirpModeConfig:
 		return commands
 
 
-@dataclass
+def _env_flag(value: str) -> bool:
+	return value.lower() == "true"
+
+
+# Environment variable -> (AppConfig section, field, parser), read once per from_env()
+_ENV_FIELDS: tuple[tuple[str, str, str, Callable[[str], Any]], ...] = (
+	("AMBIENT_CLI_PORT", "sensor", "cli_port", str),
+	("AMBIENT_DATA_PORT", "sensor", "data_port", str),
+	("AMBIENT_AUTO_RECONNECT", "sensor", "auto_reconnect", _env_flag),
+	("AMBIENT_API_HOST", "api", "host", str),
+	("AMBIENT_API_PORT", "api", "port", int),
+	("AMBIENT_LOG_LEVEL", "api", "log_level", str),
+	("AMBIENT_DATA_DIR", "paths", "data_dir", Path),
+	("AMBIENT_CONFIG_DIR", "paths", "config_dir", Path),
+	("AMBIENT_LOG_DIR", "paths", "log_dir", Path),
+	("AMBIENT_PERF_ENABLED", "performance", "enabled", _env_flag),
+	("AMBIENT_PERF_LOG_INTERVAL", "performance", "log_interval_frames", int),
+	("AMBIENT_CHIRP_ENABLED", "chirp", "enabled", _env_flag),
+	("AMBIENT_CHIRP_RANGE_MIN", "chirp", "target_range_min_m", float),
+	("AMBIENT_CHIRP_RANGE_MAX", "chirp", "target_range_max_m", float),
+	("AMBIENT_CHIRP_OUTPUT_MODE", "chirp", "output_mode", int),
+	("AMBIENT_STREAM_MAX_QUEUE", "streaming", "max_queue_size", int),
+	("AMBIENT_STREAM_DROP_POLICY", "streaming", "drop_policy", str),
+	("AMBIENT_STREAM_MAX_HEATMAP", "streaming", "max_heatmap_size", int),
+	("AMBIENT_STREAM_MAX_WAVEFORM", "streaming", "max_waveform_samples", int),
+	("AMBIENT_STREAM_VITALS_HZ", "streaming", "vitals_interval_hz", float),
+	("AMBIENT_STREAM_INCLUDE_RD", "streaming", "include_range_doppler", _env_flag),
+	("AMBIENT_STREAM_INCLUDE_WAVEFORMS", "streaming", "include_waveforms", _env_flag),
+)
+
+
+@dataclass(slots=True)
 class AppConfig:
 	"""Complete application configuration."""
 
@@ -171,61 +203,15 @@ class AppConfig:
 
 	@classmethod
 	def from_env(cls) -> AppConfig:
-		"""Load configuration from environment variables."""
-		config = cls()
-
-		# Sensor config
-		config.sensor.cli_port = os.environ.get("AMBIENT_CLI_PORT", config.sensor.cli_port)
-		config.sensor.data_port = os.environ.get("AMBIENT_DATA_PORT", config.sensor.data_port)
-		config.sensor.auto_reconnect = os.environ.get("AMBIENT_AUTO_RECONNECT", "").lower() == "true"
-
-		# API config
-		config.api.host = os.environ.get("AMBIENT_API_HOST", config.api.host)
-		config.api.port = int(os.environ.get("AMBIENT_API_PORT", config.api.port))
-		config.api.log_level = os.environ.get("AMBIENT_LOG_LEVEL", config.api.log_level)
-
-		# Paths config
-		if data_dir := os.environ.get("AMBIENT_DATA_DIR"):
-			config.paths.data_dir = Path(data_dir)
-		if config_dir := os.environ.get("AMBIENT_CONFIG_DIR"):
-			config.paths.config_dir = Path(config_dir)
-		if log_dir := os.environ.get("AMBIENT_LOG_DIR"):
-			config.paths.log_dir = Path(log_dir)
-
-		# Performance config
-		config.performance.enabled = os.environ.get("AMBIENT_PERF_ENABLED", "").lower() == "true"
-		if log_interval := os.environ.get("AMBIENT_PERF_LOG_INTERVAL"):
-			config.performance.log_interval_frames = int(log_interval)
-
-		# Chirp mode config
-		chirp_enabled = os.environ.get("AMBIENT_CHIRP_ENABLED", "").lower()
-		if chirp_enabled:
-			config.chirp.enabled = chirp_enabled == "true"
-		if range_min := os.environ.get("AMBIENT_CHIRP_RANGE_MIN"):
-			config.chirp.target_range_min_m = float(range_min)
-		if range_max := os.environ.get("AMBIENT_CHIRP_RANGE_MAX"):
-			config.chirp.target_range_max_m = float(range_max)
-		if output_mode := os.environ.get("AMBIENT_CHIRP_OUTPUT_MODE"):
-			config.chirp.output_mode = int(output_mode)
-
-		# Streaming config
-		if max_queue := os.environ.get("AMBIENT_STREAM_MAX_QUEUE"):
-			config.streaming.max_queue_size = int(max_queue)
-		if drop_policy := os.environ.get("AMBIENT_STREAM_DROP_POLICY"):
-			config.streaming.drop_policy = drop_policy
-		if max_heatmap := os.environ.get("AMBIENT_STREAM_MAX_HEATMAP"):
-			config.streaming.max_heatmap_size = int(max_heatmap)
-		if max_waveform := os.environ.get("AMBIENT_STREAM_MAX_WAVEFORM"):
-			config.streaming.max_waveform_samples = int(max_waveform)
-		if vitals_hz := os.environ.get("AMBIENT_STREAM_VITALS_HZ"):
-			config.streaming.vitals_interval_hz = float(vitals_hz)
-		include_rd = os.environ.get("AMBIENT_STREAM_INCLUDE_RD", "").lower()
-		if include_rd:
-			config.streaming.include_range_doppler = include_rd == "true"
-		include_wf = os.environ.get("AMBIENT_STREAM_INCLUDE_WAVEFORMS", "").lower()
-		if include_wf:
-			config.streaming.include_waveforms = include_wf == "true"
+		"""Load configuration from environment variables.
 
+		Unset or empty variables keep the default.
+		"""
+		config = cls()
+		environ = os.environ
+		for name, section, attr, parse in _ENV_FIELDS:
+			if value := environ.get(name):
+				setattr(getattr(config, section), attr, parse(value))
 		return config
 
 	@classmethod
@@ -40,11 +40,13 @@ class MovingAverageClutter(ClutterFilter):
 		self._frame_count += 1
 
 		if self._background is None:
-			self._background = data.astype(np.float64)
+			# float32 frames keep a float32 background (no float64 promotion)
+			self._background = data.astype(np.result_type(data.dtype, np.float32))
 			return data
 
 		alpha = self.config.alpha
-		self._background = alpha * data + (1 - alpha) * self._background
+		self._background *= 1 - alpha
+		self._background += alpha * data
 
 		if self._frame_count < self.config.warmup_frames:
 			return data
@@ -67,7 +69,7 @@ class MTIFilter(ClutterFilter):
 
 	def __init__(self, config: MTIConfig | None = None) -> None:
 		self.config = config or MTIConfig()
-		self._weights = np.array(self.config.weights or [1.0, -1.0])
+		self._weights = np.array(self.config.weights or [1.0, -1.0], dtype=np.float32)
 		self._history: list[NDArray] = []
 
 	def process(self, data: NDArray) -> NDArray:
@@ -80,7 +82,7 @@ class MTIFilter(ClutterFilter):
 		if len(self._history) < max_history:
 			return np.zeros_like(data)
 
-		result = np.zeros_like(data, dtype=np.float64)
+		result = np.zeros_like(data, dtype=np.result_type(data.dtype, np.float32))
 		for i, weight in enumerate(self._weights):
 			result += weight * self._history[i]
 		return result
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 import numpy as np
 import structlog
 from numpy.typing import NDArray
+from scipy import fft as sp_fft
 
 logger = structlog.get_logger(__name__)
 
@@ -55,7 +56,9 @@ class RangeFFT(FFTProcessor):
 			windowed = data
 
 		fft_size = self.config.fft_size * self.config.zero_pad_factor
-		fft_result = np.fft.fft(windowed, n=fft_size, axis=-1)
+		# Real ADC samples only need the half spectrum that is kept anyway
+		transform = sp_fft.fft if np.iscomplexobj(windowed) else sp_fft.rfft
+		fft_result = transform(windowed, n=fft_size, axis=-1, workers=-1)
 		fft_result = fft_result[:, :fft_size // 2]
 
 		if self.config.output_type == "magnitude":
@@ -98,7 +101,7 @@ class DopplerFFT(FFTProcessor):
 			windowed = data
 
 		fft_size = self.config.fft_size * self.config.zero_pad_factor
-		fft_result = np.fft.fftshift(np.fft.fft(windowed, n=fft_size, axis=0), axes=0)
+		fft_result = sp_fft.fftshift(sp_fft.fft(windowed, n=fft_size, axis=0, workers=-1), axes=0)
 
 		if self.config.output_type == "magnitude":
 			return np.abs(fft_result)
@@ -11,6 +11,7 @@ from numpy.typing import NDArray
 
 from ambient.processing.clutter import ClutterRemoval
 from ambient.processing.fft import RangeDopplerProcessor
+from ambient.utils.ring_buffer import RingBuffer
 
 if TYPE_CHECKING:
 	from ambient.sensor.frame import RadarFrame
@@ -64,7 +65,7 @@ class ProcessingPipeline:
 			alpha=self.config.clutter_alpha,
 		)
 		self._target_bin: int | None = None
-		self._phase_history: list[float] = []
+		self._phase_history = RingBuffer(200)  # target-bin magnitudes (displacement proxy)
 
 		logger.info("pipeline_init")
 
@@ -100,8 +101,9 @@ class ProcessingPipeline:
 		return result
 
 	def _detect_targets(self, range_profile: NDArray) -> list[float]:
-		threshold = np.mean(np.abs(range_profile)) + 3 * np.std(np.abs(range_profile))
-		peaks = np.where(np.abs(range_profile) > threshold)[0]
+		magnitude = np.abs(range_profile)
+		threshold = magnitude.mean() + 3 * magnitude.std()
+		peaks = np.flatnonzero(magnitude > threshold)
 
 		range_res = 0.044  # approximate
 		targets = [bin_idx * range_res for bin_idx in peaks]
@@ -127,9 +129,7 @@ class ProcessingPipeline:
 			# Subtract mean to center around zero like phase would be
 			magnitude = float(range_profile[bin_idx])
 			self._phase_history.append(magnitude)
-			if len(self._phase_history) > 200:
-				self._phase_history = self._phase_history[-200:]
-			mean_mag = np.mean(self._phase_history)
+			mean_mag = float(self._phase_history.view().mean())
 			# Scale to roughly -pi to pi range for compatibility
 			phase = (magnitude - mean_mag) * 0.1
 
@@ -9,6 +9,7 @@ from .config_parser import (
 from .frame import (
 	ChirpComplexRangeFFT,
 	ChirpMotionStatus,
+	ChirpPhaseBatch,
 	ChirpPhaseBin,
 	ChirpPhaseOutput,
 	ChirpPresence,
@@ -42,6 +43,7 @@ __all__ = [
 	# Chirp TLV types
 	"ChirpPhaseOutput",
 	"ChirpPhaseBin",
+	"ChirpPhaseBatch",
 	"ChirpTargetIQ",
 	"ChirpComplexRangeFFT",
 	"ChirpPresence",
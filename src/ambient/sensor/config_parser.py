@@ -5,12 +5,15 @@ Supports all standard TI CLI commands for IWR6843/xWR6843 devices.
 """
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+_SPEED_OF_LIGHT_M_S = 3e8
 
-@dataclass
+
+@dataclass(slots=True)
 class ChannelConfig:
 	"""Channel configuration (channelCfg)."""
 	rx_channel_en: int = 15  # Bitmask for RX channels (15 = all 4)
@@ -30,14 +33,14 @@ class ChannelConfig:
 
 	@property
 	def num_rx_channels(self) -> int:
-		return bin(self.rx_channel_en).count("1")
+		return self.rx_channel_en.bit_count()
 
 	@property
 	def num_tx_channels(self) -> int:
-		return bin(self.tx_channel_en).count("1")
+		return self.tx_channel_en.bit_count()
 
 
-@dataclass
+@dataclass(slots=True)
 class ADCConfig:
 	"""ADC configuration (adcCfg)."""
 	num_adc_bits: int = 2      # 0=12-bit, 1=14-bit, 2=16-bit
@@ -54,7 +57,7 @@ class ADCConfig:
 		return f"adcCfg {self.num_adc_bits} {self.adc_output_fmt}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileCfg:
 	"""Chirp profile configuration (profileCfg)."""
 	profile_id: int = 0
@@ -108,11 +111,15 @@ class ProfileCfg:
 	@property
 	def wavelength_m(self) -> float:
 		"""Wavelength at start frequency in meters."""
-		c = 3e8
-		return c / (self.start_freq_ghz * 1e9)
+		return _SPEED_OF_LIGHT_M_S / (self.start_freq_ghz * 1e9)
+
+	@property
+	def chirp_time_s(self) -> float:
+		"""Chirp repetition time (idle + ramp) in seconds."""
+		return (self.idle_time_us + self.ramp_end_time_us) * 1e-6
 
 
-@dataclass
+@dataclass(slots=True)
 class ChirpCfg:
 	"""Individual chirp configuration (chirpCfg)."""
 	chirp_start_idx: int = 0
@@ -145,7 +152,7 @@ class ChirpCfg:
 		)
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameCfg:
 	"""Frame configuration (frameCfg)."""
 	chirp_start_idx: int = 0
@@ -185,7 +192,7 @@ class FrameCfg:
 		return 1000.0 / self.frame_period_ms if self.frame_period_ms > 0 else 0
 
 
-@dataclass
+@dataclass(slots=True)
 class GuiMonitorCfg:
 	"""GUI monitor configuration (guiMonitor)."""
 	subframe_idx: int = -1
@@ -216,7 +223,7 @@ class GuiMonitorCfg:
 		)
 
 
-@dataclass
+@dataclass(slots=True)
 class CfarCfg:
 	"""CFAR configuration (cfarCfg)."""
 	subframe_idx: int = -1
@@ -251,7 +258,7 @@ class CfarCfg:
 		)
 
 
-@dataclass
+@dataclass(slots=True)
 class AoaFovCfg:
 	"""Angle of arrival field of view configuration (aoaFovCfg)."""
 	subframe_idx: int = -1
@@ -277,7 +284,7 @@ class AoaFovCfg:
 		)
 
 
-@dataclass
+@dataclass(slots=True)
 class CfarFovCfg:
 	"""CFAR field of view configuration (cfarFovCfg)."""
 	subframe_idx: int = -1
@@ -298,7 +305,7 @@ class CfarFovCfg:
 		return f"cfarFovCfg {self.subframe_idx} {self.proc_direction} {self.min_value} {self.max_value}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ClutterRemovalCfg:
 	"""Clutter removal configuration (clutterRemoval)."""
 	subframe_idx: int = -1
@@ -315,7 +322,7 @@ class ClutterRemovalCfg:
 		return f"clutterRemoval {self.subframe_idx} {self.enabled}"
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiObjBeamFormingCfg:
 	"""Multi-object beam forming configuration."""
 	subframe_idx: int = -1
@@ -334,7 +341,7 @@ class MultiObjBeamFormingCfg:
 		return f"multiObjBeamForming {self.subframe_idx} {self.enabled} {self.threshold}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtendedMaxVelocityCfg:
 	"""Extended max velocity configuration."""
 	subframe_idx: int = -1
@@ -351,7 +358,7 @@ class ExtendedMaxVelocityCfg:
 		return f"extendedMaxVelocity {self.subframe_idx} {self.enabled}"
 
 
-@dataclass
+@dataclass(slots=True)
 class BpmCfg:
 	"""BPM (Binary Phase Modulation) configuration."""
 	subframe_idx: int = -1
@@ -372,7 +379,7 @@ class BpmCfg:
 		return f"bpmCfg {self.subframe_idx} {self.enabled} {self.chirp0_idx} {self.chirp1_idx}"
 
 
-@dataclass
+@dataclass(slots=True)
 class LvdsStreamCfg:
 	"""LVDS streaming configuration."""
 	subframe_idx: int = -1
@@ -393,7 +400,7 @@ class LvdsStreamCfg:
 		return f"lvdsStreamCfg {self.subframe_idx} {self.enable_header} {self.data_fmt} {self.enable_sw}"
 
 
-@dataclass
+@dataclass(slots=True)
 class CompRangeBiasCfg:
 	"""Range bias and RX channel phase compensation."""
 	range_bias: float = 0.0
@@ -402,7 +409,8 @@ class CompRangeBiasCfg:
 	@classmethod
 	def from_args(cls, args: list[str]) -> CompRangeBiasCfg:
 		range_bias = float(args[0]) if len(args) > 0 else 0.0
-		rx_phase_comp = [float(x) for x in args[1:]] if len(args) > 1 else [1.0, 0.0] * 12
+		# map() converts the 24 phase terms without a per-item bytecode loop
+		rx_phase_comp = list(map(float, args[1:])) if len(args) > 1 else [1.0, 0.0] * 12
 		return cls(range_bias=range_bias, rx_phase_comp=rx_phase_comp)
 
 	def to_command(self) -> str:
@@ -410,7 +418,7 @@ class CompRangeBiasCfg:
 		return f"compRangeBiasAndRxChanPhase {self.range_bias} {phase_str}"
 
 
-@dataclass
+@dataclass(slots=True)
 class VitalSignsCfg:
 	"""Vital signs specific configuration (vitalSignsCfg)."""
 	range_start_m: float = 0.3
@@ -436,7 +444,7 @@ class VitalSignsCfg:
 		)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedConfig:
 	"""Complete parsed radar configuration."""
 	channel: ChannelConfig = field(default_factory=ChannelConfig)
@@ -460,38 +468,36 @@ class ParsedConfig:
 	dfe_output_mode: int = 1
 	raw_commands: list[str] = field(default_factory=list)
 
-	# Computed properties
+	# Computed properties. Kept live rather than cached: the configs are
+	# mutable (the parser assigns sections after construction) and slotted.
 	@property
 	def range_resolution_m(self) -> float:
 		"""Range resolution in meters."""
-		c = 3e8
 		bandwidth = self.profile.bandwidth_mhz * 1e6
-		return c / (2 * bandwidth) if bandwidth > 0 else 0
+		return _SPEED_OF_LIGHT_M_S / (2 * bandwidth) if bandwidth > 0 else 0
 
 	@property
 	def max_range_m(self) -> float:
 		"""Maximum unambiguous range in meters."""
-		c = 3e8
-		sample_rate = self.profile.sample_rate_ksps * 1e3
-		slope = self.profile.freq_slope_mhz_us * 1e12  # Hz/s
-		return (sample_rate * c) / (2 * slope) if slope > 0 else 0
+		profile = self.profile
+		sample_rate = profile.sample_rate_ksps * 1e3
+		slope = profile.freq_slope_mhz_us * 1e12  # Hz/s
+		return (sample_rate * _SPEED_OF_LIGHT_M_S) / (2 * slope) if slope > 0 else 0
 
 	@property
 	def velocity_resolution_mps(self) -> float:
 		"""Velocity resolution in m/s."""
-		wavelength = self.profile.wavelength_m
-		num_chirps = self.frame.num_chirps_per_frame
-		chirp_time = (self.profile.idle_time_us + self.profile.ramp_end_time_us) * 1e-6
-		frame_time = chirp_time * num_chirps
-		return wavelength / (2 * frame_time) if frame_time > 0 else 0
+		profile = self.profile
+		frame_time = profile.chirp_time_s * self.frame.num_chirps_per_frame
+		return profile.wavelength_m / (2 * frame_time) if frame_time > 0 else 0
 
 	@property
 	def max_velocity_mps(self) -> float:
 		"""Maximum unambiguous velocity in m/s."""
-		wavelength = self.profile.wavelength_m
-		chirp_time = (self.profile.idle_time_us + self.profile.ramp_end_time_us) * 1e-6
+		profile = self.profile
+		chirp_time = profile.chirp_time_s
 		num_tx = self.channel.num_tx_channels
-		return wavelength / (4 * chirp_time * num_tx) if chirp_time > 0 and num_tx > 0 else 0
+		return profile.wavelength_m / (4 * chirp_time * num_tx) if chirp_time > 0 and num_tx > 0 else 0
 
 	@property
 	def frame_rate_hz(self) -> float:
@@ -583,6 +589,31 @@ class ParsedConfig:
 		}
 
 
+def _parse_dfe_output_mode(args: list[str]) -> int:
+	return int(args[0]) if args else 1
+
+
+# CLI command -> (ParsedConfig attribute, parser). One dict lookup per line
+# replaces the if/elif chain; chirpCfg (appends) and the CFAR commands
+# (routed by proc_direction) are handled in _parse_command.
+_COMMAND_FIELDS: dict[str, tuple[str, Callable[[list[str]], Any]]] = {
+	"channelCfg": ("channel", ChannelConfig.from_args),
+	"adcCfg": ("adc", ADCConfig.from_args),
+	"profileCfg": ("profile", ProfileCfg.from_args),
+	"frameCfg": ("frame", FrameCfg.from_args),
+	"guiMonitor": ("gui_monitor", GuiMonitorCfg.from_args),
+	"aoaFovCfg": ("aoa_fov", AoaFovCfg.from_args),
+	"clutterRemoval": ("clutter_removal", ClutterRemovalCfg.from_args),
+	"multiObjBeamForming": ("multi_obj_beam_forming", MultiObjBeamFormingCfg.from_args),
+	"extendedMaxVelocity": ("extended_max_velocity", ExtendedMaxVelocityCfg.from_args),
+	"bpmCfg": ("bpm", BpmCfg.from_args),
+	"lvdsStreamCfg": ("lvds_stream", LvdsStreamCfg.from_args),
+	"compRangeBiasAndRxChanPhase": ("comp_range_bias", CompRangeBiasCfg.from_args),
+	"vitalSignsCfg": ("vital_signs", VitalSignsCfg.from_args),
+	"dfeDataOutputMode": ("dfe_output_mode", _parse_dfe_output_mode),
+}
+
+
 class ConfigParser:
 	"""Parser for TI mmWave .cfg files."""
 
@@ -604,13 +635,10 @@ class ConfigParser:
 		"""Parse config file content and return structured configuration."""
 		self.config = ParsedConfig()
 
-		for line in content.splitlines():
-			line = line.strip()
-			# Skip empty lines and comments
-			if not line or line.startswith("%") or line.startswith("#"):
-				continue
-
-			self.config.raw_commands.append(line)
+		# Command lines in one pass, skipping blanks and %/# comments
+		lines = [line for line in map(str.strip, content.splitlines()) if line and line[0] not in "%#"]
+		self.config.raw_commands.extend(lines)
+		for line in lines:
 			self._parse_command(line)
 
 		return self.config
@@ -624,48 +652,24 @@ class ConfigParser:
 		cmd = parts[0]
 		args = parts[1:]
 
-		if cmd == "channelCfg":
-			self.config.channel = ChannelConfig.from_args(args)
-		elif cmd == "adcCfg":
-			self.config.adc = ADCConfig.from_args(args)
-		elif cmd == "profileCfg":
-			self.config.profile = ProfileCfg.from_args(args)
+		handler = _COMMAND_FIELDS.get(cmd)
+		if handler is not None:
+			attr, parse = handler
+			setattr(self.config, attr, parse(args))
 		elif cmd == "chirpCfg":
 			self.config.chirps.append(ChirpCfg.from_args(args))
-		elif cmd == "frameCfg":
-			self.config.frame = FrameCfg.from_args(args)
-		elif cmd == "guiMonitor":
-			self.config.gui_monitor = GuiMonitorCfg.from_args(args)
 		elif cmd == "cfarCfg":
 			cfar = CfarCfg.from_args(args)
 			if cfar.proc_direction == 0:
 				self.config.cfar_range = cfar
 			else:
 				self.config.cfar_doppler = cfar
-		elif cmd == "aoaFovCfg":
-			self.config.aoa_fov = AoaFovCfg.from_args(args)
 		elif cmd == "cfarFovCfg":
 			cfar_fov = CfarFovCfg.from_args(args)
 			if cfar_fov.proc_direction == 0:
 				self.config.cfar_fov_range = cfar_fov
 			else:
 				self.config.cfar_fov_doppler = cfar_fov
-		elif cmd == "clutterRemoval":
-			self.config.clutter_removal = ClutterRemovalCfg.from_args(args)
-		elif cmd == "multiObjBeamForming":
-			self.config.multi_obj_beam_forming = MultiObjBeamFormingCfg.from_args(args)
-		elif cmd == "extendedMaxVelocity":
-			self.config.extended_max_velocity = ExtendedMaxVelocityCfg.from_args(args)
-		elif cmd == "bpmCfg":
-			self.config.bpm = BpmCfg.from_args(args)
-		elif cmd == "lvdsStreamCfg":
-			self.config.lvds_stream = LvdsStreamCfg.from_args(args)
-		elif cmd == "compRangeBiasAndRxChanPhase":
-			self.config.comp_range_bias = CompRangeBiasCfg.from_args(args)
-		elif cmd == "vitalSignsCfg":
-			self.config.vital_signs = VitalSignsCfg.from_args(args)
-		elif cmd == "dfeDataOutputMode":
-			self.config.dfe_output_mode = int(args[0]) if args else 1
 
 
 def parse_config_file(path: Path | str) -> ParsedConfig:
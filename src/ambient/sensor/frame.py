@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import struct
 import time
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from numpy.typing import NDArray
@@ -48,6 +49,30 @@ TLV_CHIRP_PRESENCE = 0x0540           # Presence detection result
 TLV_CHIRP_MOTION_STATUS = 0x0550      # Motion detection result
 TLV_CHIRP_TARGET_INFO = 0x0560        # Target selection metadata
 
+# Precompiled fixed-size record layouts used by the from_bytes parsers
+_FRAME_HEADER = struct.Struct("<8BIIIIIIII")
+_TLV_HEADER = struct.Struct("<II")
+_CHIRP_BINS_HEADER = struct.Struct("<HHI")    # PHASE_OUTPUT / TARGET_IQ
+_CHIRP_STATUS = struct.Struct("<BBHHH")       # PRESENCE / MOTION_STATUS
+_CHIRP_TARGET_INFO = struct.Struct("<HHHBBHH")
+_CHIRP_CRFFT_HEADER = struct.Struct("<HHHH")
+_CHIRP_PHASE_BIN = struct.Struct("<HhHH")
+_POINT = struct.Struct("<ffff")                # x, y, z, velocity
+_POINT_WITH_SIDE_INFO = struct.Struct("<ffffff")  # ... + snr, noise
+_VITALS_HEADER = struct.Struct("<HH")
+_VITALS_TI_VALUES = struct.Struct("<33f")
+_VITALS_LEGACY_SCALARS = struct.Struct("<6f")
+_TRACKED_OBJECT = struct.Struct("<I9f")
+_COMPRESSED_POINT = struct.Struct("<bbhHH")
+_POINT_SIDE_INFO = struct.Struct("<HH")
+
+# Per-bin records of the chirp PHASE_OUTPUT / TARGET_IQ TLVs (after the 8-byte header)
+_CHIRP_PHASE_BIN_DTYPE = np.dtype([("bin_index", "<u2"), ("phase", "<i2"), ("magnitude", "<u2"), ("flags", "<u2")])
+_CHIRP_IQ_BIN_DTYPE = np.dtype([("bin_index", "<u2"), ("imag", "<i2"), ("real", "<i2"), ("reserved", "<u2")])
+_PHASE_Q15_TO_RAD = np.pi / 32768.0  # Q15 fixed-point phase to radians
+# Below this many bins, iter_unpack beats the fixed cost of the numpy column decode
+_PHASE_BULK_DECODE_MIN_BINS = 32
+
 # Vital signs waveform size (number of samples per waveform)
 VITAL_SIGNS_WAVEFORM_SIZE = 20
 VITAL_SIGNS_TI_WAVEFORM_SIZE = 15  # TI multi-patient format uses 15 samples
@@ -55,29 +80,34 @@ VITAL_SIGNS_TI_WAVEFORM_SIZE = 15  # TI multi-patient format uses 15 samples
 
 def _parse_points(data: bytes) -> list:
 	"""Parse detected points from TLV data."""
-	points = []
-	point_size = 24 if len(data) % 24 == 0 and len(data) % 16 != 0 else 16
-	num_points = len(data) // point_size
-
-	for i in range(num_points):
-		off = i * point_size
-		if point_size == 16:
-			x, y, z, vel = struct.unpack("<ffff", data[off:off + 16])
-			snr, noise = 0.0, 0.0
-		else:
-			x, y, z, vel, snr, noise = struct.unpack("<ffffff", data[off:off + 24])
-		points.append(DetectedPoint(x=x, y=y, z=z, velocity=vel, snr=snr, noise=noise))
+	if len(data) % 24 == 0 and len(data) % 16 != 0:
+		return [
+			DetectedPoint(x=x, y=y, z=z, velocity=vel, snr=snr, noise=noise)
+			for x, y, z, vel, snr, noise in _POINT_WITH_SIDE_INFO.iter_unpack(data)
+		]
+	usable = len(data) - len(data) % 16
+	return [
+		DetectedPoint(x=x, y=y, z=z, velocity=vel, snr=0.0, noise=0.0)
+		for x, y, z, vel in _POINT.iter_unpack(data[:usable])
+	]
 
-	return points
+
+def _u16_to_db(data: bytes) -> NDArray[np.float32]:
+	"""Little-endian uint16 magnitudes as 20*log10(x + 1), decoded in one pass.
+
+	A trailing odd byte is ignored.
+	"""
+	arr = np.frombuffer(data, dtype="<u2", count=len(data) // 2).astype(np.float32)
+	arr += 1
+	np.log10(arr, out=arr)
+	arr *= 20
+	return arr
 
 
 def _parse_range_profile(data: bytes) -> NDArray[np.float32]:
 	"""Parse range profile from TLV data and convert to dB."""
-	num_bins = len(data) // 2
-	values = struct.unpack(f"<{num_bins}H", data)
-	arr = np.array(values, dtype=np.float32)
 	# Convert magnitude to dB scale (TI sends raw magnitude values)
-	return 20 * np.log10(arr + 1)
+	return _u16_to_db(data)
 
 
 def _parse_range_doppler(data: bytes) -> NDArray[np.float32] | None:
@@ -85,10 +115,7 @@ def _parse_range_doppler(data: bytes) -> NDArray[np.float32] | None:
 	num_values = len(data) // 2
 	if num_values == 0:
 		return None
-	values = struct.unpack(f"<{num_values}H", data)
-	arr = np.array(values, dtype=np.float32)
-	# Convert to dB scale
-	arr_db = 20 * np.log10(arr + 1)
+	arr_db = _u16_to_db(data)
 	side = int(np.sqrt(num_values))
 	if side * side == num_values:
 		return arr_db.reshape((side, side))
@@ -213,10 +240,10 @@ class VitalSignsTLV:
 			Offset 76:  breath_waveform[15] (15 × float32 = 60 bytes)
 		"""
 		# Parse header: patient_id + range_bin
-		patient_id, range_bin = struct.unpack("<HH", data[0:4])
+		patient_id, range_bin = _VITALS_HEADER.unpack_from(data)
 
 		# Parse vitals data (33 floats starting at offset 4)
-		vitals_data = struct.unpack("<33f", data[4:136])
+		vitals_data = _VITALS_TI_VALUES.unpack_from(data, 4)
 
 		breathing_deviation = vitals_data[0]
 		heart_rate = vitals_data[1]
@@ -254,10 +281,10 @@ class VitalSignsTLV:
 	def _parse_legacy_format(cls, data: bytes) -> VitalSignsTLV | None:
 		"""Parse legacy single-patient format (192 bytes or variable)."""
 		# Parse header: range bin index + reserved
-		range_bin_index, _ = struct.unpack("<HH", data[0:4])
+		range_bin_index, _ = _VITALS_HEADER.unpack_from(data)
 
 		# Parse scalar values (6 floats)
-		scalars = struct.unpack("<6f", data[4:28])
+		scalars = _VITALS_LEGACY_SCALARS.unpack_from(data, 4)
 		breathing_deviation = scalars[0]
 		heart_deviation = scalars[1]
 		breathing_rate = scalars[2]
@@ -276,17 +303,11 @@ class VitalSignsTLV:
 
 		breath_start = 28
 		breath_end = breath_start + waveform_size * 4
-		breathing_waveform = np.array(
-			struct.unpack(f"<{waveform_size}f", data[breath_start:breath_end]),
-			dtype=np.float32
-		)
+		breathing_waveform = np.frombuffer(data, dtype="<f4", count=waveform_size, offset=breath_start).copy()
 
 		heart_start = breath_end
 		heart_end = heart_start + waveform_size * 4
-		heart_waveform = np.array(
-			struct.unpack(f"<{waveform_size}f", data[heart_start:heart_end]),
-			dtype=np.float32
-		)
+		heart_waveform = np.frombuffer(data, dtype="<f4", count=waveform_size, offset=heart_start).copy()
 
 		# Parse unwrapped phase if present
 		unwrapped_phase = 0.0
@@ -308,7 +329,7 @@ class VitalSignsTLV:
 		)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChirpPhaseBin:
 	"""Single bin from chirp PHASE_OUTPUT TLV."""
 	bin_index: int
@@ -318,7 +339,7 @@ class ChirpPhaseBin:
 	is_valid: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ChirpPhaseOutput:
 	"""Chirp PHASE_OUTPUT TLV (0x0520) - Primary output for vital signs.
 
@@ -336,33 +357,64 @@ class ChirpPhaseOutput:
 		if len(data) < 8:
 			return None
 		try:
-			num_bins, center_bin, timestamp_us = struct.unpack("<HHI", data[0:8])
-			bins = []
-			for i in range(num_bins):
-				offset = 8 + i * 8
-				if offset + 8 > len(data):
-					break
-				bin_idx, phase_raw, magnitude, flags = struct.unpack(
-					"<HhHH", data[offset:offset + 8]
-				)
-				# Convert fixed-point phase to radians
-				phase = (phase_raw / 32768.0) * np.pi
-				bins.append(ChirpPhaseBin(
+			num_bins, center_bin, timestamp_us = _CHIRP_BINS_HEADER.unpack_from(data)
+			# Decode all complete bins; a truncated tail is dropped
+			count = min(num_bins, (len(data) - 8) // 8)
+			if count < _PHASE_BULK_DECODE_MIN_BINS:
+				# Typical frames carry a handful of bins
+				bins = [
+					ChirpPhaseBin(
+						bin_index=bin_idx,
+						phase=phase_raw * _PHASE_Q15_TO_RAD,
+						magnitude=magnitude,
+						has_motion=bool(flags & 1),
+						is_valid=bool(flags & 2),
+					)
+					for bin_idx, phase_raw, magnitude, flags in _CHIRP_PHASE_BIN.iter_unpack(data[8:8 + 8 * count])
+				]
+				return cls(num_bins=num_bins, center_bin=center_bin, timestamp_us=timestamp_us, bins=bins)
+
+			raw = np.frombuffer(data, dtype=_CHIRP_PHASE_BIN_DTYPE, count=count, offset=8)
+			flags = raw["flags"]
+			bins = [
+				ChirpPhaseBin(
 					bin_index=bin_idx,
 					phase=phase,
 					magnitude=magnitude,
-					has_motion=bool(flags & 1),
-					is_valid=bool(flags & 2),
-				))
-			return cls(
-				num_bins=num_bins,
-				center_bin=center_bin,
-				timestamp_us=timestamp_us,
-				bins=bins,
-			)
+					has_motion=has_motion,
+					is_valid=is_valid,
+				)
+				for bin_idx, phase, magnitude, has_motion, is_valid in zip(
+					raw["bin_index"].tolist(),
+					(raw["phase"] * _PHASE_Q15_TO_RAD).tolist(),
+					raw["magnitude"].tolist(),
+					(flags & 1).astype(bool).tolist(),
+					(flags & 2).astype(bool).tolist(),
+				)
+			]
+			return cls(num_bins=num_bins, center_bin=center_bin, timestamp_us=timestamp_us, bins=bins)
 		except struct.error:
 			return None
 
+	def _flags(self) -> NDArray[np.uint16]:
+		# Built from bins, the single source of truth (a handful of entries)
+		return np.array([2 * b.is_valid | b.has_motion for b in self.bins], dtype=np.uint16)
+
+	@property
+	def valid_mask(self) -> NDArray[np.bool_]:
+		"""Per-bin valid flag (bit 1), decoded for all bins at once."""
+		return (self._flags() & 2) != 0
+
+	@property
+	def motion_mask(self) -> NDArray[np.bool_]:
+		"""Per-bin motion flag (bit 0), decoded for all bins at once."""
+		return (self._flags() & 1) != 0
+
+	@property
+	def phases(self) -> NDArray[np.float32]:
+		"""Per-bin phase in radians as one float32 column."""
+		return np.array([b.phase for b in self.bins], dtype=np.float32)
+
 	def get_center_phase(self) -> float | None:
 		"""Get phase of center bin if valid.
 
@@ -370,18 +422,96 @@ class ChirpPhaseOutput:
 		Falls back to the first valid bin if center bin not found.
 		Returns None if no valid bins exist.
 		"""
-		# First try to find the center bin
-		for b in self.bins:
-			if b.bin_index == self.center_bin and b.is_valid:
-				return b.phase
-		# Fall back to first valid bin
+		# Single pass: PHASE_OUTPUT carries a handful of bins, where a Python
+		# loop beats the fixed cost of the array masks
+		first_valid = None
 		for b in self.bins:
 			if b.is_valid:
-				return b.phase
-		return None
+				if b.bin_index == self.center_bin:
+					return b.phase
+				if first_valid is None:
+					first_valid = b.phase
+		return first_valid
 
 
-@dataclass
+@dataclass(slots=True)
+class ChirpPhaseBatch:
+	"""PHASE_OUTPUT TLVs of many frames decoded as columns, one row per frame.
+
+	For replaying recorded sessions: payloads of equal length are joined
+	and decoded with a single np.frombuffer, without per-bin objects.
+	Frames with fewer bins are padded with invalid (flags 0) bins.
+	"""
+	timestamp_us: NDArray[np.uint32]
+	center_bin: NDArray[np.uint16]
+	bin_index: NDArray[np.uint16]   # (n_frames, n_bins)
+	phase: NDArray[np.float32]      # (n_frames, n_bins), radians
+	magnitude: NDArray[np.uint16]   # (n_frames, n_bins)
+	flags: NDArray[np.uint16]       # (n_frames, n_bins)
+
+	@classmethod
+	def from_payloads(cls, payloads: Sequence[bytes]) -> ChirpPhaseBatch:
+		"""Decode PHASE_OUTPUT payloads (TLV bodies, oldest first)."""
+		sizes = {len(p) for p in payloads}
+		if len(sizes) == 1 and (size := sizes.pop()) >= 8 and (size - 8) % 8 == 0:
+			n_bins = (size - 8) // 8
+			record = np.dtype([
+				("num_bins", "<u2"),
+				("center_bin", "<u2"),
+				("timestamp_us", "<u4"),
+				("bins", _CHIRP_PHASE_BIN_DTYPE, (n_bins,)),
+			])
+			rows = np.frombuffer(b"".join(payloads), dtype=record)
+			# Bins beyond a frame's declared count are not valid samples
+			declared = np.arange(n_bins) < rows["num_bins"][:, None]
+			bins = rows["bins"]
+			flags = np.where(declared, bins["flags"], 0).astype(np.uint16)
+			return cls(
+				timestamp_us=rows["timestamp_us"].copy(),
+				center_bin=rows["center_bin"].copy(),
+				bin_index=bins["bin_index"].copy(),
+				phase=(bins["phase"] * _PHASE_Q15_TO_RAD).astype(np.float32),
+				magnitude=bins["magnitude"].copy(),
+				flags=flags,
+			)
+
+		# Mixed sizes (or truncated payloads): decode each frame into padded rows
+		headers = [_CHIRP_BINS_HEADER.unpack_from(p) if len(p) >= 8 else (0, 0, 0) for p in payloads]
+		counts = [min(num_bins, (len(p) - 8) // 8) if len(p) >= 8 else 0 for (num_bins, _, _), p in zip(headers, payloads)]
+		bins = np.zeros((len(payloads), max(counts, default=0)), dtype=_CHIRP_PHASE_BIN_DTYPE)
+		for row, p, count in zip(bins, payloads, counts):
+			row[:count] = np.frombuffer(p, dtype=_CHIRP_PHASE_BIN_DTYPE, count=count, offset=8)
+		return cls(
+			timestamp_us=np.array([h[2] for h in headers], dtype=np.uint32),
+			center_bin=np.array([h[1] for h in headers], dtype=np.uint16),
+			bin_index=bins["bin_index"].copy(),
+			phase=(bins["phase"] * _PHASE_Q15_TO_RAD).astype(np.float32),
+			magnitude=bins["magnitude"].copy(),
+			flags=bins["flags"].copy(),
+		)
+
+	def __len__(self) -> int:
+		return len(self.timestamp_us)
+
+	def center_phases(self) -> tuple[NDArray[np.float32], NDArray[np.bool_]]:
+		"""Per-frame phase as ChirpPhaseOutput.get_center_phase picks it.
+
+		Returns (phases, found): the valid center bin, else the first valid
+		bin; frames without a valid bin have found False and phase NaN.
+		"""
+		if self.phase.shape[1] == 0:
+			# No bins to pick from (as get_center_phase returns None)
+			return np.full(len(self), np.nan, dtype=np.float32), np.zeros(len(self), dtype=bool)
+		valid = (self.flags & 2) != 0
+		is_center = valid & (self.bin_index == self.center_bin[:, None])
+		has_center = is_center.any(axis=1)
+		col = np.where(has_center, is_center.argmax(axis=1), valid.argmax(axis=1))
+		found = valid.any(axis=1)
+		phases = self.phase[np.arange(len(col)), col] if len(col) else np.empty(0, dtype=np.float32)
+		return np.where(found, phases, np.float32(np.nan)).astype(np.float32, copy=False), found
+
+
+@dataclass(slots=True)
 class ChirpTargetIQ:
 	"""Chirp TARGET_IQ TLV (0x0510) - I/Q for selected target bins."""
 	num_bins: int
@@ -396,28 +526,24 @@ class ChirpTargetIQ:
 		if len(data) < 8:
 			return None
 		try:
-			num_bins, center_bin, timestamp_us = struct.unpack("<HHI", data[0:8])
-			iq_values = []
-			bin_indices = []
-			for i in range(num_bins):
-				offset = 8 + i * 8
-				if offset + 8 > len(data):
-					break
-				bin_idx, imag, real, _ = struct.unpack("<HhhH", data[offset:offset + 8])
-				iq_values.append(complex(real, imag))
-				bin_indices.append(bin_idx)
+			num_bins, center_bin, timestamp_us = _CHIRP_BINS_HEADER.unpack_from(data)
+			count = min(num_bins, (len(data) - 8) // 8)
+			raw = np.frombuffer(data, dtype=_CHIRP_IQ_BIN_DTYPE, count=count, offset=8)
+			iq_data = np.empty(count, dtype=np.complex64)
+			iq_data.real = raw["real"]
+			iq_data.imag = raw["imag"]
 			return cls(
 				num_bins=num_bins,
 				center_bin=center_bin,
 				timestamp_us=timestamp_us,
-				iq_data=np.array(iq_values, dtype=np.complex64),
-				bin_indices=bin_indices,
+				iq_data=iq_data,
+				bin_indices=raw["bin_index"].tolist(),
 			)
 		except struct.error:
 			return None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChirpPresence:
 	"""Chirp PRESENCE TLV (0x0540) - Presence detection result."""
 	presence: int        # 0=absent, 1=present, 2=motion
@@ -439,9 +565,7 @@ class ChirpPresence:
 		if len(data) < 8:
 			return None
 		try:
-			presence, confidence, range_q8, target_bin, _ = struct.unpack(
-				"<BBHHH", data[0:8]
-			)
+			presence, confidence, range_q8, target_bin, _ = _CHIRP_STATUS.unpack_from(data)
 			return cls(
 				presence=presence,
 				confidence=confidence,
@@ -452,7 +576,7 @@ class ChirpPresence:
 			return None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChirpMotionStatus:
 	"""Chirp MOTION_STATUS TLV (0x0550) - Motion detection result."""
 	motion_detected: bool
@@ -467,9 +591,7 @@ class ChirpMotionStatus:
 		if len(data) < 8:
 			return None
 		try:
-			detected, level, bin_count, peak_bin, peak_delta = struct.unpack(
-				"<BBHHH", data[0:8]
-			)
+			detected, level, bin_count, peak_bin, peak_delta = _CHIRP_STATUS.unpack_from(data)
 			return cls(
 				motion_detected=bool(detected),
 				motion_level=level,
@@ -481,7 +603,7 @@ class ChirpMotionStatus:
 			return None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChirpTargetInfo:
 	"""Chirp TARGET_INFO TLV (0x0560) - Target selection metadata."""
 	primary_bin: int
@@ -498,7 +620,7 @@ class ChirpTargetInfo:
 			return None
 		try:
 			(primary_bin, primary_mag, range_q8,
-				confidence, num_targets, secondary_bin, _reserved) = struct.unpack("<HHHBBHH", data[0:12])
+				confidence, num_targets, secondary_bin, _reserved) = _CHIRP_TARGET_INFO.unpack_from(data)
 			return cls(
 				primary_bin=primary_bin,
 				primary_magnitude=primary_mag,
@@ -511,7 +633,7 @@ class ChirpTargetInfo:
 			return None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChirpComplexRangeFFT:
 	"""Chirp COMPLEX_RANGE_FFT TLV (0x0500) - Full I/Q for all range bins."""
 	num_range_bins: int
@@ -525,20 +647,18 @@ class ChirpComplexRangeFFT:
 		if len(data) < 8:
 			return None
 		try:
-			num_bins, chirp_idx, rx_ant, _ = struct.unpack("<HHHH", data[0:8])
-			# Parse I/Q pairs (imag first, then real per TI convention)
-			iq_values = []
-			for i in range(num_bins):
-				offset = 8 + i * 4
-				if offset + 4 > len(data):
-					break
-				imag, real = struct.unpack("<hh", data[offset:offset + 4])
-				iq_values.append(complex(real, imag))
+			num_bins, chirp_idx, rx_ant, _ = _CHIRP_CRFFT_HEADER.unpack_from(data)
+			# I/Q pairs are int16 (imag first, then real per TI convention)
+			count = min(num_bins, (len(data) - 8) // 4)
+			pairs = np.frombuffer(data, dtype=np.int16, count=2 * count, offset=8)
+			iq_data = np.empty(count, dtype=np.complex64)
+			iq_data.real = pairs[1::2]
+			iq_data.imag = pairs[0::2]
 			return cls(
 				num_range_bins=num_bins,
 				chirp_index=chirp_idx,
 				rx_antenna=rx_ant,
-				iq_data=np.array(iq_values, dtype=np.complex64),
+				iq_data=iq_data,
 			)
 		except struct.error:
 			return None
@@ -590,7 +710,7 @@ class TrackedObject:
 		if len(data) < offset + 40:
 			return None
 		try:
-			values = struct.unpack("<I9f", data[offset:offset + 40])
+			values = _TRACKED_OBJECT.unpack_from(data, offset)
 			return cls(
 				track_id=values[0],
 				x=values[1], y=values[2], z=values[3],
@@ -683,9 +803,7 @@ class CompressedPoint:
 		if len(data) < offset + 8:
 			return None
 		try:
-			elev_raw, azim_raw, doppler_raw, range_raw, snr_raw = struct.unpack(
-				"<bbhHH", data[offset:offset + 8]
-			)
+			elev_raw, azim_raw, doppler_raw, range_raw, snr_raw = _COMPRESSED_POINT.unpack_from(data, offset)
 			return cls(
 				elevation=elev_raw * cls.ELEVATION_UNIT,
 				azimuth=azim_raw * cls.AZIMUTH_UNIT,
@@ -779,7 +897,7 @@ class PointSideInfo:
 		if len(data) < offset + 4:
 			return None
 		try:
-			snr_raw, noise_raw = struct.unpack("<HH", data[offset:offset + 4])
+			snr_raw, noise_raw = _POINT_SIDE_INFO.unpack_from(data, offset)
 			# Convert from Q8.8 fixed point to float
 			return cls(
 				snr=snr_raw * 0.1,  # Typically 0.1 dB per unit
@@ -875,9 +993,7 @@ class AzimuthHeatmap:
 		try:
 			# Each value is uint16, convert to dB
 			num_values = len(data) // 2
-			values = struct.unpack(f"<{num_values}H", data)
-			arr = np.array(values, dtype=np.float32)
-			arr_db = 20 * np.log10(arr + 1)
+			arr_db = _u16_to_db(data)
 
 			# Try to reshape to (range_bins, angle_bins)
 			num_angle_bins = num_values // num_range_bins
@@ -915,9 +1031,7 @@ class AzimuthElevationHeatmap:
 		try:
 			# Each value is uint16, convert to dB
 			num_values = len(data) // 2
-			values = struct.unpack(f"<{num_values}H", data)
-			arr = np.array(values, dtype=np.float32)
-			arr_db = 20 * np.log10(arr + 1)
+			arr_db = _u16_to_db(data)
 
 			# Try to reshape to square matrix
 			side = int(np.sqrt(num_values))
@@ -950,10 +1064,7 @@ class GestureFeatures:
 			return None
 		try:
 			num_features = len(data) // 4
-			features = np.array(
-				struct.unpack(f"<{num_features}f", data),
-				dtype=np.float32
-			)
+			features = np.frombuffer(data, dtype="<f4", count=num_features).copy()
 			return cls(features=features, num_features=num_features)
 		except struct.error:
 			return None
@@ -1038,11 +1149,11 @@ class FrameHeader:
 	_raw_data: bytes = field(default=b"", repr=False)
 
 	@classmethod
-	def from_bytes(cls, data: bytes) -> FrameHeader:
+	def from_bytes(cls, data: bytes | bytearray | memoryview) -> FrameHeader:
 		"""Parse header from raw bytes."""
 		if len(data) < HEADER_SIZE:
 			raise ValueError(f"Data too short: {len(data)} < {HEADER_SIZE}")
-		fields = struct.unpack("<8BIIIIIIII", data[:40])
+		fields = _FRAME_HEADER.unpack_from(data)
 		return cls(
 			version=fields[8],
 			packet_length=fields[9],
@@ -1052,7 +1163,7 @@ class FrameHeader:
 			num_detected_obj=fields[13],
 			num_tlvs=fields[14],
 			subframe_number=fields[15] if len(fields) > 15 else 0,
-			_raw_data=data[:8],
+			_raw_data=bytes(data[:8]),
 		)
 
 	def validate(self) -> bool:
@@ -1060,6 +1171,36 @@ class FrameHeader:
 		return self._raw_data[:8] == MAGIC_WORD
 
 
+# TLV type -> (RadarFrame attribute, parser). One dict lookup per TLV replaces
+# a long if/elif chain (chirp PHASE_OUTPUT used to be the 20th comparison).
+# TLV_TARGET_INDEX is handled separately: it needs the frame's point count.
+_TLV_PARSERS: dict[int, tuple[str, Callable[[bytes], Any]]] = {
+	# Standard TLVs
+	TLV_DETECTED_POINTS: ("detected_points", _parse_points),
+	TLV_RANGE_PROFILE: ("range_profile", _parse_range_profile),
+	TLV_RANGE_DOPPLER: ("range_doppler_heatmap", _parse_range_doppler),
+	TLV_VITAL_SIGNS: ("vital_signs", VitalSignsTLV.from_bytes),
+	TLV_DETECTED_POINTS_SIDE_INFO: ("points_side_info", PointsSideInfo.from_bytes),
+	TLV_TEMPERATURE_STATS: ("temperature_stats", TemperatureStats.from_bytes),
+	TLV_AZIMUTH_STATIC_HEATMAP: ("azimuth_heatmap", AzimuthHeatmap.from_bytes),
+	TLV_AZIMUTH_ELEVATION_HEATMAP: ("azimuth_elevation_heatmap", AzimuthElevationHeatmap.from_bytes),
+	# Tracking TLVs
+	TLV_TRACKED_OBJECTS: ("tracked_objects", TrackedObjectList.from_bytes),
+	TLV_COMPRESSED_POINTS: ("compressed_points", CompressedPointCloud.from_bytes),
+	TLV_PRESENCE_INDICATION: ("presence_indication", PresenceIndicationTLV.from_bytes),
+	# Gesture TLVs
+	TLV_GESTURE_FEATURES: ("gesture_features", GestureFeatures.from_bytes),
+	TLV_GESTURE_OUTPUT: ("gesture_output", GestureOutput.from_bytes),
+	# Chirp custom TLVs
+	TLV_CHIRP_COMPLEX_RANGE_FFT: ("chirp_complex_fft", ChirpComplexRangeFFT.from_bytes),
+	TLV_CHIRP_TARGET_IQ: ("chirp_target_iq", ChirpTargetIQ.from_bytes),
+	TLV_CHIRP_PHASE_OUTPUT: ("chirp_phase", ChirpPhaseOutput.from_bytes),
+	TLV_CHIRP_PRESENCE: ("chirp_presence", ChirpPresence.from_bytes),
+	TLV_CHIRP_MOTION_STATUS: ("chirp_motion", ChirpMotionStatus.from_bytes),
+	TLV_CHIRP_TARGET_INFO: ("chirp_target_info", ChirpTargetInfo.from_bytes),
+}
+
+
 @dataclass
 class RadarFrame:
 	"""Complete radar frame with header and parsed data."""
@@ -1096,12 +1237,19 @@ class RadarFrame:
 	gesture_output: GestureOutput | None = None
 
 	@classmethod
-	def from_bytes(cls, data: bytes, timestamp: float | None = None) -> RadarFrame:
-		"""Parse a complete frame from raw bytes."""
+	def from_bytes(
+		cls, data: bytes, timestamp: float | None = None, header: FrameHeader | None = None
+	) -> RadarFrame:
+		"""Parse a complete frame from raw bytes.
+
+		A header already parsed from the same bytes can be passed in to
+		skip decoding it again.
+		"""
 		if len(data) < HEADER_SIZE:
 			raise ValueError(f"Data too short: {len(data)} < {HEADER_SIZE}")
 
-		header = FrameHeader.from_bytes(data)
+		if header is None:
+			header = FrameHeader.from_bytes(data)
 		frame = cls(
 			header=header,
 			raw_data=data,
@@ -1113,58 +1261,17 @@ class RadarFrame:
 		for _ in range(header.num_tlvs):
 			if offset + 8 > len(data):
 				break
-			tlv_type, tlv_length = struct.unpack("<II", data[offset:offset + 8])
+			tlv_type, tlv_length = _TLV_HEADER.unpack_from(data, offset)
 			tlv_data = data[offset + 8:offset + 8 + tlv_length]
 			offset += 8 + tlv_length
 
-			# Standard TLVs
-			if tlv_type == TLV_DETECTED_POINTS:
-				frame.detected_points = _parse_points(tlv_data)
-			elif tlv_type == TLV_RANGE_PROFILE:
-				frame.range_profile = _parse_range_profile(tlv_data)
-			elif tlv_type == TLV_RANGE_DOPPLER:
-				frame.range_doppler_heatmap = _parse_range_doppler(tlv_data)
-			elif tlv_type == TLV_VITAL_SIGNS:
-				frame.vital_signs = VitalSignsTLV.from_bytes(tlv_data)
-			elif tlv_type == TLV_DETECTED_POINTS_SIDE_INFO:
-				frame.points_side_info = PointsSideInfo.from_bytes(tlv_data)
-			elif tlv_type == TLV_TEMPERATURE_STATS:
-				frame.temperature_stats = TemperatureStats.from_bytes(tlv_data)
-			elif tlv_type == TLV_AZIMUTH_STATIC_HEATMAP:
-				frame.azimuth_heatmap = AzimuthHeatmap.from_bytes(tlv_data)
-			elif tlv_type == TLV_AZIMUTH_ELEVATION_HEATMAP:
-				frame.azimuth_elevation_heatmap = AzimuthElevationHeatmap.from_bytes(tlv_data)
-
-			# Tracking TLVs
-			elif tlv_type == TLV_TRACKED_OBJECTS:
-				frame.tracked_objects = TrackedObjectList.from_bytes(tlv_data)
+			parser = _TLV_PARSERS.get(tlv_type)
+			if parser is not None:
+				attr, parse = parser
+				setattr(frame, attr, parse(tlv_data))
 			elif tlv_type == TLV_TARGET_INDEX:
 				num_points = len(frame.detected_points)
 				frame.target_index = TargetIndex.from_bytes(tlv_data, num_points)
-			elif tlv_type == TLV_COMPRESSED_POINTS:
-				frame.compressed_points = CompressedPointCloud.from_bytes(tlv_data)
-			elif tlv_type == TLV_PRESENCE_INDICATION:
-				frame.presence_indication = PresenceIndicationTLV.from_bytes(tlv_data)
-
-			# Gesture TLVs
-			elif tlv_type == TLV_GESTURE_FEATURES:
-				frame.gesture_features = GestureFeatures.from_bytes(tlv_data)
-			elif tlv_type == TLV_GESTURE_OUTPUT:
-				frame.gesture_output = GestureOutput.from_bytes(tlv_data)
-
-			# Chirp custom TLVs
-			elif tlv_type == TLV_CHIRP_COMPLEX_RANGE_FFT:
-				frame.chirp_complex_fft = ChirpComplexRangeFFT.from_bytes(tlv_data)
-			elif tlv_type == TLV_CHIRP_TARGET_IQ:
-				frame.chirp_target_iq = ChirpTargetIQ.from_bytes(tlv_data)
-			elif tlv_type == TLV_CHIRP_PHASE_OUTPUT:
-				frame.chirp_phase = ChirpPhaseOutput.from_bytes(tlv_data)
-			elif tlv_type == TLV_CHIRP_PRESENCE:
-				frame.chirp_presence = ChirpPresence.from_bytes(tlv_data)
-			elif tlv_type == TLV_CHIRP_MOTION_STATUS:
-				frame.chirp_motion = ChirpMotionStatus.from_bytes(tlv_data)
-			elif tlv_type == TLV_CHIRP_TARGET_INFO:
-				frame.chirp_target_info = ChirpTargetInfo.from_bytes(tlv_data)
 
 		# Apply side info to detected points if available
 		if frame.points_side_info and frame.detected_points:
@@ -1177,7 +1284,11 @@ class RadarFrame:
 
 
 class FrameBuffer:
-	"""Accumulates serial data and extracts complete frames."""
+	"""Accumulates serial data and extracts complete frames.
+
+	Consumed bytes are deleted from the front of the bytearray in place,
+	which CPython does without copying the remainder.
+	"""
 
 	def __init__(self, max_size: int = 65536):
 		self._buffer = bytearray()
@@ -1189,54 +1300,46 @@ class FrameBuffer:
 		if len(self._buffer) > self._max_size:
 			idx = self._buffer.rfind(MAGIC_WORD)
 			if idx > 0:
-				self._buffer = self._buffer[idx:]
+				del self._buffer[:idx]
 			else:
-				self._buffer = self._buffer[-1024:]
+				del self._buffer[:-1024]
 
 	def extract_frame(self) -> RadarFrame | None:
 		"""Extract and parse a complete frame, or return None."""
 		idx = self._buffer.find(MAGIC_WORD)
 		if idx == -1:
 			if len(self._buffer) > 32:
-				self._buffer = self._buffer[-16:]
+				del self._buffer[:-16]
 			return None
 
 		if idx > 0:
-			self._buffer = self._buffer[idx:]
+			del self._buffer[:idx]
 
 		if len(self._buffer) < HEADER_SIZE:
 			return None
 
-		header = self._parse_header(bytes(self._buffer[:HEADER_SIZE]))
+		header = self._parse_header(self._buffer)
 		if header.packet_length > self._max_size or header.packet_length < HEADER_SIZE:
-			self._buffer = self._buffer[8:]
+			del self._buffer[:8]
 			return None
 
 		if len(self._buffer) < header.packet_length:
 			return None
 
-		frame_data = bytes(self._buffer[:header.packet_length])
-		self._buffer = self._buffer[header.packet_length:]
+		# One copy out of the buffer (slicing the bytearray first would make two)
+		with memoryview(self._buffer) as view:
+			frame_data = bytes(view[:header.packet_length])
+		del self._buffer[:header.packet_length]
 
 		return self._parse_frame(header, frame_data)
 
-	def _parse_header(self, data: bytes) -> FrameHeader:
-		fields = struct.unpack("<8BIIIIIIII", data[:40])
-		return FrameHeader(
-			version=fields[8],
-			packet_length=fields[9],
-			platform=fields[10],
-			frame_number=fields[11],
-			time_cpu_cycles=fields[12],
-			num_detected_obj=fields[13],
-			num_tlvs=fields[14],
-			subframe_number=fields[15] if len(fields) > 15 else 0,
-			_raw_data=data[:8],  # Store magic word for validation
-		)
+	def _parse_header(self, data: bytes | bytearray) -> FrameHeader:
+		# Decodes straight from the buffer; only the magic word is copied
+		return FrameHeader.from_bytes(data)
 
 	def _parse_frame(self, header: FrameHeader, data: bytes) -> RadarFrame:
-		"""Parse frame using RadarFrame.from_bytes() to avoid duplication."""
-		return RadarFrame.from_bytes(data)
+		"""Parse frame using RadarFrame.from_bytes(), reusing the parsed header."""
+		return RadarFrame.from_bytes(data, header=header)
 
 	def clear(self) -> None:
 		self._buffer.clear()
@@ -1,5 +1,6 @@
 """Utility modules for ambient SDK."""
 
 from ambient.utils.profiler import FrameProfiler, get_profiler
+from ambient.utils.ring_buffer import RingBuffer
 
-__all__ = ["FrameProfiler", "get_profiler"]
+__all__ = ["FrameProfiler", "RingBuffer", "get_profiler"]
@@ -0,0 +1,62 @@
+"""Fixed-capacity numeric ring buffer for streaming sample windows."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+
+class RingBuffer:
+	"""Fixed-capacity ring buffer with a contiguous chronological view.
+
+	Each sample is stored twice (slot i and i + capacity), so the most
+	recent samples are always one contiguous slice and view() never copies.
+	Appends are O(1) and never reallocate.
+	"""
+
+	def __init__(self, capacity: int, dtype: DTypeLike = np.float64) -> None:
+		self._capacity = max(1, capacity)
+		self._data = np.zeros(2 * self._capacity, dtype=dtype)
+		self._head = 0  # next write slot in [0, capacity)
+		self._count = 0
+
+	def __len__(self) -> int:
+		return self._count
+
+	@property
+	def capacity(self) -> int:
+		return self._capacity
+
+	def append(self, value: float) -> None:
+		# Called once per frame: plain compares instead of % and min()
+		head = self._head
+		data = self._data
+		data[head] = value
+		data[head + self._capacity] = value
+		head += 1
+		self._head = 0 if head == self._capacity else head
+		if self._count < self._capacity:
+			self._count += 1
+
+	def extend(self, values: NDArray) -> None:
+		"""Append a block of samples with at most two slice copies."""
+		values = np.asarray(values)[-self._capacity:]
+		k = len(values)
+		first = min(k, self._capacity - self._head)
+		for offset in (0, self._capacity):
+			self._data[offset + self._head:offset + self._head + first] = values[:first]
+			self._data[offset:offset + k - first] = values[first:]
+		self._head = (self._head + k) % self._capacity
+		self._count = min(self._count + k, self._capacity)
+
+	def view(self) -> NDArray:
+		"""Samples oldest to newest, as a view into the buffer.
+
+		The view is overwritten by later appends; copy it to keep it.
+		"""
+		end = self._head + self._capacity
+		return self._data[end - self._count:end]
+
+	def clear(self) -> None:
+		self._head = 0
+		self._count = 0
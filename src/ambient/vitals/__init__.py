@@ -11,6 +11,7 @@ from ambient.vitals.extractor import (
 from ambient.vitals.filters import BandpassFilter, PhaseFilter, PhaseUnwrapper
 from ambient.vitals.heart_rate import HeartRateEstimator
 from ambient.vitals.respiratory import RespiratoryRateEstimator
+from ambient.vitals.spectrum import VitalsSpectrum
 
 __all__ = [
 	"VitalsExtractor",
@@ -19,6 +20,7 @@ __all__ = [
 	"VitalSigns",
 	"HeartRateEstimator",
 	"RespiratoryRateEstimator",
+	"VitalsSpectrum",
 	"BandpassFilter",
 	"PhaseFilter",
 	"PhaseUnwrapper",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from collections import deque
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
@@ -10,9 +11,10 @@ import numpy as np
 import structlog
 from numpy.typing import NDArray
 
+from ambient.utils.ring_buffer import RingBuffer
 from ambient.vitals.filters import BandpassFilter, PhaseUnwrapper
 from ambient.vitals.heart_rate import HeartRateEstimator
-from ambient.vitals.respiratory import RespiratoryRateEstimator
+from ambient.vitals.respiratory import RespiratoryRateEstimator, RREstimationResult
 
 if TYPE_CHECKING:
 	from ambient.processing.pipeline import ProcessedFrame
@@ -21,6 +23,20 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 
 
+def _phase_delta_std(signal: NDArray[np.float32]) -> float:
+	"""Standard deviation of consecutive phase deltas (motion metric).
+
+	The deltas telescope, so their mean is (last - first) / n and the
+	variance needs only one dot product instead of np.var's passes.
+	"""
+	deltas = np.diff(signal)
+	n = len(deltas)
+	if n == 0:
+		return 0.0
+	mean = (float(signal[-1]) - float(signal[0])) / n
+	return math.sqrt(max(0.0, float(np.dot(deltas, deltas)) / n - mean * mean))
+
+
 @dataclass
 class VitalSigns:
 	heart_rate_bpm: float | None = None
@@ -96,6 +112,9 @@ class VitalsConfig:
 	min_snr_db: float = 10.0
 	motion_threshold: float = 0.5
 	motion_skip_estimation: bool = True  # Skip HR/RR estimation during motion
+	hr_welch: bool = False  # Welch-averaged HR spectrum (steadier peak, coarser bins)
+	rr_autocorr: bool = False  # Autocorrelation RR (one-sample lag resolution, no spectral SNR)
+	estimate_interval: int = 1  # Chirp path: re-estimate every N samples, carry forward between
 
 
 class VitalsExtractor:
@@ -104,8 +123,10 @@ class VitalsExtractor:
 	def __init__(self, config: VitalsConfig | None = None) -> None:
 		self.config = config or VitalsConfig()
 		self._buffer_size = int(self.config.window_seconds * self.config.sample_rate_hz)
-		self._phase_buffer: list[float] = []
-		self._timestamp_buffer: list[float] = []
+		self._phase_buffer = RingBuffer(self._buffer_size, dtype=np.float32)
+		# Running sums of consecutive phase deltas in the window (motion metric)
+		self._delta_sum = 0.0
+		self._delta_sq_sum = 0.0
 
 		self._hr_estimator = HeartRateEstimator(
 			sample_rate_hz=self.config.sample_rate_hz,
@@ -138,8 +159,14 @@ class VitalsExtractor:
 
 	@buffer_size.setter
 	def buffer_size(self, value: int) -> None:
-		"""Set buffer size."""
+		"""Set buffer size, keeping the most recent samples."""
 		self._buffer_size = value
+		window = self._phase_buffer.view()
+		self._phase_buffer = RingBuffer(value, dtype=np.float32)
+		self._phase_buffer.extend(window)
+		deltas = np.diff(self._phase_buffer.view().astype(np.float64))
+		self._delta_sum = float(deltas.sum())
+		self._delta_sq_sum = float(np.dot(deltas, deltas))
 
 	@property
 	def hr_filter(self) -> BandpassFilter:
@@ -157,31 +184,43 @@ class VitalsExtractor:
 		if phase_data is None:
 			return result
 
-		phase = float(phase_data.mean()) if isinstance(phase_data, np.ndarray) else float(phase_data)
-
-		self._phase_buffer.append(phase)
-		self._timestamp_buffer.append(timestamp)
-
-		if len(self._phase_buffer) > self._buffer_size:
-			self._phase_buffer = self._phase_buffer[-self._buffer_size:]
-			self._timestamp_buffer = self._timestamp_buffer[-self._buffer_size:]
+		# Rounded to the float32 buffer dtype up front, so the running delta
+		# sums add exactly the deltas they later evict
+		phase = float(np.float32(phase_data.mean() if isinstance(phase_data, np.ndarray) else phase_data))
+
+		buffer = self._phase_buffer
+		n = len(buffer)
+		if n:
+			window = buffer.view()
+			delta = phase - float(window[-1])
+			self._delta_sum += delta
+			self._delta_sq_sum += delta * delta
+			if n == buffer.capacity:
+				# The oldest delta leaves the window with the oldest sample
+				delta = float(window[1]) - float(window[0]) if n > 1 else delta
+				self._delta_sum -= delta
+				self._delta_sq_sum -= delta * delta
+		buffer.append(phase)
 
 		min_samples = int(self.config.sample_rate_hz * 5)
-		if len(self._phase_buffer) < min_samples:
+		if len(buffer) < min_samples:
 			return result
 
-		phase_signal = np.array(self._phase_buffer, dtype=np.float32)
-		result.phase_signal = phase_signal
-
-		# Calculate phase stability (variance of phase deltas)
-		phase_deltas = np.diff(phase_signal)
-		result.phase_stability = float(np.std(phase_deltas))
+		# Phase stability (std of phase deltas) from the running sums, so motion
+		# frames return without materializing the window
+		n_deltas = len(buffer) - 1
+		mean_delta = self._delta_sum / n_deltas
+		result.phase_stability = math.sqrt(max(0.0, self._delta_sq_sum / n_deltas - mean_delta * mean_delta))
 
 		motion_metric = result.phase_stability
-		result.motion_detected = bool(motion_metric > self.config.motion_threshold)
+		result.motion_detected = motion_metric > self.config.motion_threshold
 		if result.motion_detected:
 			return result
 
+		# A copy: the ring view changes with the next sample
+		phase_signal = buffer.view().copy()
+		result.phase_signal = phase_signal
+
 		hr_filtered = self._hr_filter.process(phase_signal)
 		result.heart_rate_waveform = hr_filtered
 
@@ -189,12 +228,18 @@ class VitalsExtractor:
 		result.respiratory_waveform = rr_filtered
 
 		# Use enhanced estimation with quality metrics
-		hr_result = self._hr_estimator.estimate_with_quality(hr_filtered)
+		if self.config.hr_welch:
+			hr_result = self._hr_estimator.estimate_with_welch(hr_filtered)
+		else:
+			hr_result = self._hr_estimator.estimate_with_quality(hr_filtered)
 		result.heart_rate_bpm = hr_result.rate_bpm
 		result.heart_rate_confidence = hr_result.confidence
 		result.hr_snr_db = hr_result.snr_db
 
-		rr, rr_conf = self._rr_estimator.estimate(rr_filtered)
+		if self.config.rr_autocorr:
+			rr, rr_conf = self._rr_estimator.estimate_with_autocorr(rr_filtered)
+		else:
+			rr, rr_conf = self._rr_estimator.estimate(rr_filtered)
 		result.respiratory_rate_bpm = rr
 		result.respiratory_rate_confidence = rr_conf
 
@@ -210,7 +255,8 @@ class VitalsExtractor:
 
 	def reset(self) -> None:
 		self._phase_buffer.clear()
-		self._timestamp_buffer.clear()
+		self._delta_sum = 0.0
+		self._delta_sq_sum = 0.0
 		self._hr_estimator.reset()
 		self._rr_estimator.reset()
 		self._hr_filter.reset()
@@ -242,11 +288,13 @@ class ChirpVitalsProcessor:
 		self.config = config or VitalsConfig()
 		self._buffer_size = int(self.config.window_seconds * self.config.sample_rate_hz)
 
-		# Phase tracking
+		# Phase tracking (fixed-size windows, O(1) appends)
 		self._unwrapper = PhaseUnwrapper()
-		self._phase_buffer: list[float] = []
-		self._timestamp_buffer: list[float] = []
-		self._magnitude_buffer: list[float] = []
+		self._phase_buffer = RingBuffer(self._buffer_size, dtype=np.float32)
+		self._magnitude_buffer = RingBuffer(self._buffer_size, dtype=np.float32)
+		# Last full estimate, reused for estimate_interval - 1 samples
+		self._last_estimate: VitalSigns | None = None
+		self._since_estimate = 0
 
 		# Rate estimators
 		self._hr_estimator = HeartRateEstimator(
@@ -301,10 +349,16 @@ class ChirpVitalsProcessor:
 		if phase is None:
 			return result
 
+		# Valid-bin count, motion votes and magnitude sum in one pass
+		n_valid = motion_count = magnitude_sum = 0
+		for b in phase_output.bins:
+			if b.is_valid:
+				n_valid += 1
+				motion_count += b.has_motion
+				magnitude_sum += b.magnitude
+
 		# Check for motion - require majority of valid bins to report motion
-		valid_bins = [b for b in phase_output.bins if b.is_valid]
-		motion_count = sum(1 for b in valid_bins if b.has_motion)
-		has_motion = motion_count > len(valid_bins) // 2 if valid_bins else False
+		has_motion = motion_count > n_valid // 2 if n_valid else False
 		result.motion_detected = has_motion
 
 		# Skip estimation during motion (configurable)
@@ -312,30 +366,113 @@ class ChirpVitalsProcessor:
 			return result
 
 		# Compute average magnitude for signal quality
-		if valid_bins:
-			avg_magnitude = sum(b.magnitude for b in valid_bins) / len(valid_bins)
-			self._magnitude_buffer.append(avg_magnitude)
-			if len(self._magnitude_buffer) > self._buffer_size:
-				self._magnitude_buffer = self._magnitude_buffer[-self._buffer_size:]
+		if n_valid:
+			self._magnitude_buffer.append(magnitude_sum / n_valid)
+
+		return self._process_phase(phase, result)
+
+	def process_chirp_phase_raw(
+		self,
+		phase_rad: float,
+		flags: int,
+		timestamp: float,
+		magnitude: float | None = None,
+	) -> VitalSigns:
+		"""Process one already-decoded center-bin phase sample.
+
+		Fast path for callers that read the phase straight from the TLV
+		payload, skipping the ChirpPhaseOutput and per-bin objects.
 
+		Args:
+			phase_rad: Wrapped phase of the target bin in radians
+			flags: PHASE_OUTPUT bin flags (bit 0 = motion, bit 1 = valid)
+			timestamp: Sample timestamp in seconds
+			magnitude: Optional bin magnitude for signal quality tracking
+
+		Returns:
+			VitalSigns with extracted heart rate and respiratory rate
+		"""
+		result = VitalSigns(timestamp=timestamp, source="chirp")
+		if not flags & 2:
+			return result
+
+		result.motion_detected = bool(flags & 1)
+		if result.motion_detected and self.config.motion_skip_estimation:
+			return result
+
+		if magnitude is not None:
+			self._magnitude_buffer.append(magnitude)
+		return self._process_phase(phase_rad, result)
+
+	def process_phase_block(
+		self, phases: NDArray, timestamp: float, magnitudes: NDArray | None = None
+	) -> VitalSigns:
+		"""Buffer a block of consecutive phase samples, then estimate once.
+
+		For replaying recorded sessions: the block is unwrapped with one
+		unwrap_array call and written with one ring-buffer extend, and the
+		result describes the window after the last sample. Samples are taken
+		as valid and motion-free; filter the block beforehand if needed.
+
+		Args:
+			phases: Wrapped center-bin phases (radians), oldest first
+			timestamp: Timestamp of the last sample
+			magnitudes: Optional per-sample magnitudes
+
+		Returns:
+			VitalSigns for the window ending at the last sample
+		"""
+		result = VitalSigns(timestamp=timestamp, source="chirp")
+		if len(phases) == 0:
+			return result
+
+		unwrapped = self._unwrapper.unwrap_array(phases)
+		result.unwrapped_phase = float(unwrapped[-1])
+		self._phase_buffer.extend(unwrapped)
+		if magnitudes is not None:
+			self._magnitude_buffer.extend(magnitudes)
+		return self._estimate(result, force=True)
+
+	def _process_phase(self, phase: float, result: VitalSigns) -> VitalSigns:
+		"""Unwrap and buffer one phase sample, then estimate once the window is ready."""
 		# Unwrap phase and buffer
 		unwrapped = self._unwrapper.unwrap_sample(phase)
 		result.unwrapped_phase = unwrapped
 
 		self._phase_buffer.append(unwrapped)
-		self._timestamp_buffer.append(timestamp)
+		return self._estimate(result)
 
-		if len(self._phase_buffer) > self._buffer_size:
-			self._phase_buffer = self._phase_buffer[-self._buffer_size:]
-			self._timestamp_buffer = self._timestamp_buffer[-self._buffer_size:]
+	def _estimate(self, result: VitalSigns, force: bool = False) -> VitalSigns:
+		"""Fill HR/RR and quality metrics from the current phase window.
 
+		With estimate_interval > 1, only every Nth sample runs the filters
+		and FFTs; the samples in between carry the last estimate forward.
+		"""
 		# Need minimum samples
 		min_samples = int(self.config.sample_rate_hz * 5)
 		if len(self._phase_buffer) < min_samples:
 			return result
 
-		# Extract phase signal
-		phase_signal = np.array(self._phase_buffer, dtype=np.float32)
+		self._since_estimate += 1
+		last = self._last_estimate
+		if last is not None and not force and self._since_estimate < self.config.estimate_interval:
+			result.heart_rate_bpm = last.heart_rate_bpm
+			result.heart_rate_confidence = last.heart_rate_confidence
+			result.heart_rate_waveform = last.heart_rate_waveform
+			result.respiratory_rate_bpm = last.respiratory_rate_bpm
+			result.respiratory_rate_confidence = last.respiratory_rate_confidence
+			result.respiratory_waveform = last.respiratory_waveform
+			result.phase_signal = last.phase_signal
+			result.signal_quality = last.signal_quality
+			result.hr_snr_db = last.hr_snr_db
+			result.rr_snr_db = last.rr_snr_db
+			result.phase_stability = last.phase_stability
+			return result
+		self._since_estimate = 0
+		self._last_estimate = result
+
+		# Extract phase signal (a copy: the ring view changes with the next sample)
+		phase_signal = self._phase_buffer.view().copy()
 		result.phase_signal = phase_signal
 
 		# Filter for heart rate and respiratory bands
@@ -345,17 +482,23 @@ class ChirpVitalsProcessor:
 		rr_filtered = self._rr_filter.process(phase_signal)
 		result.respiratory_waveform = rr_filtered
 
-		# Calculate phase stability (variance of phase deltas)
-		phase_deltas = np.diff(phase_signal)
-		result.phase_stability = float(np.std(phase_deltas))
+		# Calculate phase stability (std of phase deltas)
+		result.phase_stability = _phase_delta_std(phase_signal)
 
 		# Use enhanced estimation with quality metrics
-		hr_result = self._hr_estimator.estimate_with_quality(hr_filtered)
+		if self.config.hr_welch:
+			hr_result = self._hr_estimator.estimate_with_welch(hr_filtered)
+		else:
+			hr_result = self._hr_estimator.estimate_with_quality(hr_filtered)
 		result.heart_rate_bpm = hr_result.rate_bpm
 		result.heart_rate_confidence = hr_result.confidence
 		result.hr_snr_db = hr_result.snr_db
 
-		rr_result = self._rr_estimator.estimate_with_quality(rr_filtered)
+		if self.config.rr_autocorr:
+			rr_bpm, rr_conf = self._rr_estimator.estimate_with_autocorr(rr_filtered)
+			rr_result = RREstimationResult(rate_bpm=rr_bpm, confidence=rr_conf)
+		else:
+			rr_result = self._rr_estimator.estimate_with_quality(rr_filtered)
 		result.respiratory_rate_bpm = rr_result.rate_bpm
 		result.respiratory_rate_confidence = rr_result.confidence
 		result.rr_snr_db = rr_result.snr_db
@@ -385,9 +528,10 @@ class ChirpVitalsProcessor:
 	def reset(self) -> None:
 		"""Reset processor state."""
 		self._phase_buffer.clear()
-		self._timestamp_buffer.clear()
 		self._magnitude_buffer.clear()
 		self._unwrapper.reset()
+		self._last_estimate = None
+		self._since_estimate = 0
 		self._hr_estimator.reset()
 		self._rr_estimator.reset()
 		self._hr_filter.reset()
@@ -443,11 +587,12 @@ class ChirpVitalsProcessor:
 			order=self.config.rr_filter_order,
 		)
 
-		# Clear buffers (old data collected at different rate)
-		self._phase_buffer.clear()
-		self._timestamp_buffer.clear()
-		self._magnitude_buffer.clear()
+		# Resize and clear buffers (old data collected at different rate)
+		self._phase_buffer = RingBuffer(self._buffer_size, dtype=np.float32)
+		self._magnitude_buffer = RingBuffer(self._buffer_size, dtype=np.float32)
 		self._unwrapper.reset()
+		self._last_estimate = None
+		self._since_estimate = 0
 
 		logger.info(
 			"chirp_vitals_sample_rate_updated",
@@ -685,10 +830,10 @@ class MultiPatientVitalsManager:
 				return VitalSigns(
 					heart_rate_bpm=patient.heart_rate_bpm,
 					heart_rate_confidence=0.8 if patient.status == "present" else 0.5,
-					heart_rate_waveform=np.array(list(patient.heart_waveform), dtype=np.float32),
+					heart_rate_waveform=np.fromiter(patient.heart_waveform, dtype=np.float32, count=len(patient.heart_waveform)),
 					respiratory_rate_bpm=patient.breathing_rate_bpm,
 					respiratory_rate_confidence=0.8 if patient.status == "present" else 0.0,
-					respiratory_waveform=np.array(list(patient.breath_waveform), dtype=np.float32),
+					respiratory_waveform=np.fromiter(patient.breath_waveform, dtype=np.float32, count=len(patient.breath_waveform)),
 					signal_quality=0.8 if patient.status == "present" else 0.3,
 					motion_detected=False,
 					source="firmware",
@@ -3,15 +3,71 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from collections import deque
+from functools import lru_cache
+from math import ceil
 
 import numpy as np
 import structlog
 from numpy.typing import NDArray
 from scipy import signal as sp_signal
+from scipy.ndimage import median_filter
 
 logger = structlog.get_logger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _design_bandpass(
+	sample_rate_hz: float, low_freq_hz: float, high_freq_hz: float, order: int
+) -> tuple[NDArray[np.float64], NDArray[np.float64], tuple[tuple[float, ...], ...]]:
+	"""Design Butterworth bandpass SOS coefficients, unit-step zi and sections.
+
+	Cached per (fs, band, order) so repeated filter construction (resets,
+	sample-rate changes) skips the scipy design step. The arrays are shared
+	between instances and must not be modified in place (sos stays writable
+	only because scipy's sosfilt takes a writable buffer); sections holds each
+	(b0, b1, b2, a1, a2) as Python floats for the streaming path.
+	"""
+	nyquist = sample_rate_hz / 2
+	low = max(0.001, min(0.999, low_freq_hz / nyquist))
+	high = max(0.001, min(0.999, high_freq_hz / nyquist))
+
+	if low >= high:
+		raise ValueError(f"Invalid frequency range: {low_freq_hz}-{high_freq_hz} Hz")
+
+	sos = sp_signal.butter(order, [low, high], btype="band", output="sos")
+	zi = sp_signal.sosfilt_zi(sos)
+	sections = tuple((b0, b1, b2, a1, a2) for b0, b1, b2, _, a1, a2 in sos.tolist())
+	zi.setflags(write=False)
+	return sos, zi, sections
+
+
+@lru_cache(maxsize=16)
+def _centered_ramp(n: int) -> tuple[NDArray[np.float32], float]:
+	"""Zero-mean sample index ramp and its sum of squares, for linear fits."""
+	ramp = np.arange(n, dtype=np.float32) - np.float32((n - 1) / 2)
+	ramp.setflags(write=False)
+	return ramp, n * (n * n - 1) / 12.0
+
+
+def _moving_average(signal: NDArray[np.float32], window: int) -> NDArray[np.float32]:
+	"""Boxcar moving average in O(N) via a running sum.
+
+	Matches np.convolve(signal, np.ones(window) / window, mode="same"),
+	including the zero padding at the edges, for len(signal) >= window.
+	The running sum is float64 (it would drift in float32); the result
+	is cast back to the input dtype.
+	"""
+	n = len(signal)
+	padded = np.zeros(n + 2 * window, dtype=np.float64)
+	padded[window:window + n] = signal
+	csum = np.cumsum(padded)
+	off = (window - 1) // 2
+	averaged = (csum[window + off:window + off + n] - csum[off:off + n]) / window
+	return averaged.astype(signal.dtype, copy=False)
+
+
 class Filter(ABC):
 	@abstractmethod
 	def process(self, signal: NDArray) -> NDArray:
@@ -37,34 +93,39 @@ class BandpassFilter(Filter):
 		self.high_freq_hz = high_freq_hz
 		self.order = order
 
-		nyquist = sample_rate_hz / 2
-		low = max(0.001, min(0.999, low_freq_hz / nyquist))
-		high = max(0.001, min(0.999, high_freq_hz / nyquist))
-
-		if low >= high:
-			raise ValueError(f"Invalid frequency range: {low_freq_hz}-{high_freq_hz} Hz")
-
-		self._sos = sp_signal.butter(order, [low, high], btype="band", output="sos")
-		self._zi: NDArray | None = None
+		self._sos, self._zi_template, self._sections = _design_bandpass(
+			sample_rate_hz, low_freq_hz, high_freq_hz, order
+		)
+		self._zi: list[list[float]] | None = None
 
 	def process(self, signal: NDArray) -> NDArray:
 		if len(signal) < 3 * self.order:
-			return np.zeros_like(signal)
+			return np.zeros_like(signal, dtype=np.float32)
 
 		try:
 			filtered = sp_signal.sosfiltfilt(self._sos, signal)
 		except ValueError:
 			filtered = sp_signal.sosfilt(self._sos, signal)
 
-		return filtered.astype(np.float32)
+		# Coefficients stay float64: float32 SOS measured slower in sosfiltfilt
+		return filtered.astype(np.float32, copy=False)
 
 	def process_sample(self, sample: float) -> float:
-		"""Real-time single-sample filtering."""
+		"""Real-time single-sample filtering.
+
+		Runs the transposed direct-form II recurrence of each section
+		directly, matching sosfilt without its per-call dispatch overhead.
+		"""
 		if self._zi is None:
-			self._zi = sp_signal.sosfilt_zi(self._sos) * sample
+			self._zi = (self._zi_template * sample).tolist()
 
-		filtered, self._zi = sp_signal.sosfilt(self._sos, [sample], zi=self._zi)
-		return float(filtered[0])
+		y = float(sample)
+		for (b0, b1, b2, a1, a2), z in zip(self._sections, self._zi):
+			out = b0 * y + z[0]
+			z[0] = b1 * y - a1 * out + z[1]
+			z[1] = b2 * y - a2 * out
+			y = out
+		return y
 
 	def reset(self) -> None:
 		self._zi = None
@@ -77,19 +138,35 @@ class PhaseFilter(Filter):
 		self.remove_dc = remove_dc
 		self.detrend = detrend
 		self.smooth_window = smooth_window
+		# Boxcar kernel for signals shorter than the smoothing window (unused when
+		# smooth_window <= 1); float32 like the filtered signal
+		width = max(1, smooth_window)
+		self._kernel: NDArray[np.float32] = np.full(width, 1.0 / width, dtype=np.float32)
 
 	def process(self, signal: NDArray) -> NDArray:
-		result = signal.astype(np.float64)
+		result = np.asarray(signal, dtype=np.float32)
+		n = len(result)
+
+		if n > 1 and self.detrend:
+			# Least-squares line against a centered ramp: mean + slope * ramp.
+			# Removing it also removes DC, so one subtraction covers both.
+			ramp, ramp_ss = _centered_ramp(n)
+			slope = float(np.dot(ramp, result)) / ramp_ss
+			result = result - np.float32(np.mean(result)) - np.float32(slope) * ramp
+		elif n > 0 and self.remove_dc:
+			result = result - np.float32(np.mean(result))
+		else:
+			result = result.copy()
 
-		if self.remove_dc:
-			result = result - np.mean(result)
-		if self.detrend:
-			result = sp_signal.detrend(result)
 		if self.smooth_window > 1:
-			kernel = np.ones(self.smooth_window) / self.smooth_window
-			result = np.convolve(result, kernel, mode="same")
+			# The running-sum average is O(N) whatever the window length, so it
+			# beats both direct and FFT/overlap-add convolution here.
+			if n >= self.smooth_window:
+				result = _moving_average(result, self.smooth_window)
+			else:
+				result = np.convolve(result, self._kernel, mode="same")
 
-		return result.astype(np.float32)
+		return result.astype(np.float32, copy=False)
 
 	def reset(self) -> None:
 		pass
@@ -100,12 +177,30 @@ class MedianFilter(Filter):
 
 	def __init__(self, window_size: int = 5) -> None:
 		self.window_size = window_size | 1  # ensure odd
+		# Streaming state: arrival order plus the same samples kept sorted
+		self._window: deque[float] = deque()
+		self._sorted: list[float] = []
 
 	def process(self, signal: NDArray) -> NDArray:
-		return sp_signal.medfilt(signal, self.window_size).astype(np.float32)
+		return median_filter(signal, size=self.window_size, mode="nearest").astype(np.float32, copy=False)
+
+	def process_sample(self, sample: float) -> float:
+		"""Real-time median of the last window_size samples."""
+		if len(self._window) == self.window_size:
+			oldest = self._window.popleft()
+			del self._sorted[bisect_left(self._sorted, oldest)]
+		self._window.append(sample)
+		insort(self._sorted, sample)
+
+		n = len(self._sorted)
+		mid = n // 2
+		if n % 2:
+			return self._sorted[mid]
+		return (self._sorted[mid - 1] + self._sorted[mid]) / 2
 
 	def reset(self) -> None:
-		pass
+		self._window.clear()
+		self._sorted.clear()
 
 
 class ExponentialSmoother(Filter):
@@ -114,16 +209,18 @@ class ExponentialSmoother(Filter):
 	def __init__(self, alpha: float = 0.1) -> None:
 		self.alpha = alpha
 		self._value: float | None = None
+		# First-order IIR form of the EMA recurrence, for batch processing
+		self._b = np.array([alpha], dtype=np.float32)
+		self._a = np.array([1.0, alpha - 1.0], dtype=np.float32)
 
 	def process(self, signal: NDArray) -> NDArray:
 		if len(signal) == 0:
 			return np.zeros_like(signal, dtype=np.float32)
 
-		result = np.zeros_like(signal, dtype=np.float32)
-		result[0] = signal[0]
-		for i in range(1, len(signal)):
-			result[i] = self.alpha * signal[i] + (1 - self.alpha) * result[i - 1]
-		return result
+		# Seeding the state with (1-a)*x[0] makes y[0] = x[0]
+		zi = np.array([(1 - self.alpha) * signal[0]], dtype=np.float32)
+		result, _ = sp_signal.lfilter(self._b, self._a, signal, zi=zi)
+		return result.astype(np.float32, copy=False)
 
 	def update(self, sample: float) -> float:
 		"""Process single sample."""
@@ -137,6 +234,45 @@ class ExponentialSmoother(Filter):
 		self._value = None
 
 
+def _unwrap_kernel(
+	phases: NDArray,
+	last_phase: float | None,
+	wrap_count: int,
+	max_jump: float = np.pi,
+	work: NDArray[np.float64] | None = None,
+) -> tuple[NDArray[np.float64], int]:
+	"""Vectorized unwrap_sample loop: (unwrapped, final wrap count).
+
+	Corrections are counted in whole periods and scaled by 2π once, so
+	the cumsum carries no floating-point rounding error (integer-valued
+	float64 is exact up to 2**53). One buffer (work, if given) is reused
+	for every step and returned.
+	"""
+	p = np.asarray(phases, dtype=np.float64)
+	wraps = np.empty_like(p) if work is None else work
+	wraps[0] = 0.0 if last_phase is None else p[0] - last_phase
+	np.subtract(p[1:], p[:-1], out=wraps[1:])
+	# ceil(max(d - max_jump, 0) / 2π) - ceil(max(-d - max_jump, 0) / 2π):
+	# the same period count as unwrap_sample, zero within ±max_jump
+	inv_two_pi = 1.0 / (2 * np.pi)
+	up = wraps - max_jump
+	np.maximum(up, 0.0, out=up)
+	up *= inv_two_pi
+	np.ceil(up, out=up)
+	np.negative(wraps, out=wraps)
+	wraps -= max_jump
+	np.maximum(wraps, 0.0, out=wraps)
+	wraps *= inv_two_pi
+	np.ceil(wraps, out=wraps)
+	np.subtract(up, wraps, out=wraps)
+	np.cumsum(wraps, out=wraps)
+	wraps += wrap_count
+	final_count = int(wraps[-1])
+	wraps *= -2 * np.pi
+	wraps += p
+	return wraps, final_count
+
+
 class PhaseUnwrapper:
 	"""Phase unwrapping for continuous phase tracking.
 
@@ -148,11 +284,18 @@ class PhaseUnwrapper:
 		"""
 		Args:
 			max_jump: Maximum expected phase jump between samples (radians).
-				Values above this trigger unwrapping. Default π.
+				A larger step is treated as a wrap and corrected by the fewest
+				whole periods of 2π that bring it back to ±max_jump.
 		"""
-		self.max_jump = max_jump
+		if max_jump <= 0:
+			raise ValueError(f"max_jump must be positive, got {max_jump}")
+		self.max_jump = float(max_jump)
+		self._two_pi = 2 * np.pi
+		self._inv_two_pi = 1.0 / (2 * np.pi)
 		self._last_phase: float | None = None
-		self._cumulative_offset: float = 0.0
+		self._wrap_count = 0  # whole periods removed so far; exact at any session length
+		self._offset = 0.0  # -2π * wrap_count, kept in step with it
+		self._work: NDArray[np.float64] | None = None  # unwrap_array scratch, reused per block size
 
 	def unwrap_sample(self, phase: float) -> float:
 		"""Unwrap a single phase sample.
@@ -165,38 +308,62 @@ class PhaseUnwrapper:
 		"""
 		if self._last_phase is None:
 			self._last_phase = phase
-			return phase + self._cumulative_offset
+			return phase + self._offset
 
 		delta = phase - self._last_phase
+		self._last_phase = phase
 
-		# Detect and correct 2π discontinuities
-		if delta > self.max_jump:
-			self._cumulative_offset -= 2 * np.pi
-		elif delta < -self.max_jump:
-			self._cumulative_offset += 2 * np.pi
+		# Vitals displacement rarely moves the phase by max_jump between
+		# samples, so the common case keeps the wrap count (and its offset) as is
+		max_jump = self.max_jump
+		if -max_jump <= delta <= max_jump:
+			return phase + self._offset
 
-		self._last_phase = phase
-		return phase + self._cumulative_offset
+		if delta > max_jump:
+			self._wrap_count += ceil((delta - max_jump) * self._inv_two_pi)
+		else:
+			self._wrap_count -= ceil((-delta - max_jump) * self._inv_two_pi)
+		self._offset = -self._two_pi * self._wrap_count
+		return phase + self._offset
 
-	def unwrap_array(self, phases: NDArray) -> NDArray[np.float32]:
+	def unwrap_array(self, phases: NDArray, out: NDArray | None = None) -> NDArray:
 		"""Unwrap an array of phase values.
 
+		Continues from the state left by earlier calls (and unwrap_sample),
+		so consecutive chunks unwrap the same as one long stream.
+
 		Args:
 			phases: Array of wrapped phases in radians
+			out: Optional float array of len(phases) to write the result into,
+				so a fixed-size block can be unwrapped without allocating
 
 		Returns:
-			Unwrapped phase array
+			Unwrapped phase array (out if given, else a new float32 array)
 		"""
-		if len(phases) == 0:
-			return np.array([], dtype=np.float32)
-		return np.unwrap(phases).astype(np.float32)
+		n = len(phases)
+		if out is not None and len(out) != n:
+			raise ValueError(f"out has length {len(out)}, expected {n}")
+		if n == 0:
+			return out if out is not None else np.array([], dtype=np.float32)
+		if self._work is None or len(self._work) != n:
+			self._work = np.empty(n, dtype=np.float64)
+		unwrapped, self._wrap_count = _unwrap_kernel(
+			phases, self._last_phase, self._wrap_count, self.max_jump, self._work
+		)
+		self._offset = -self._two_pi * self._wrap_count
+		self._last_phase = float(phases[-1])
+		if out is None:
+			return unwrapped.astype(np.float32)
+		np.copyto(out, unwrapped, casting="same_kind")
+		return out
 
 	def reset(self) -> None:
 		"""Reset unwrapper state."""
 		self._last_phase = None
-		self._cumulative_offset = 0.0
+		self._wrap_count = 0
+		self._offset = 0.0
 
 	@property
 	def cumulative_phase(self) -> float:
 		"""Total accumulated phase offset."""
-		return self._cumulative_offset
+		return self._offset
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import math
+from collections import deque
 from dataclasses import dataclass
 
 import numpy as np
 import structlog
 from numpy.typing import NDArray
 
+from ambient.vitals.spectrum import VitalsSpectrum, _autocorrelation, _band_indices, _FFTScratch
+
 logger = structlog.get_logger(__name__)
 
 
@@ -21,6 +25,29 @@ class EstimationResult:
 	peak_prominence: float = 0.0
 
 
+def _band_statistics(band: NDArray[np.float32]) -> tuple[float, float, float, float]:
+	"""Mean, median, 25th percentile and energy of a band in one sort.
+
+	Percentiles use the same linear interpolation as np.percentile /
+	np.median. Vitals bands are ~100 bins, where a full np.sort is
+	cheaper than np.partition with several kth, and sum() / n is
+	cheaper than mean().
+	"""
+	n = len(band)
+	ordered = np.sort(band)
+
+	def _interp(pos: float) -> float:
+		lo = int(pos)
+		frac = pos - lo
+		if frac == 0:
+			return float(ordered[lo])
+		return float(ordered[lo]) + frac * (float(ordered[lo + 1]) - float(ordered[lo]))
+
+	mean = float(band.sum()) / n
+	energy = float(np.dot(band, band))
+	return mean, _interp(0.5 * (n - 1)), _interp(0.25 * (n - 1)), energy
+
+
 def _find_peak_with_smoothing(
 	spectrum: NDArray[np.float32],
 	start_idx: int = 0,
@@ -49,16 +76,9 @@ def _find_peak_with_smoothing(
 		local_idx = int(np.argmax(spectrum[start_idx:end_idx]))
 		return start_idx + local_idx, float(spectrum[start_idx + local_idx])
 
-	best_idx = start_idx + 1
-	best_value = 0.0
-
-	for i in range(start_idx + 1, end_idx - 1):
-		value = spectrum[i - 1] + spectrum[i] + spectrum[i + 1]
-		if value > best_value:
-			best_value = value
-			best_idx = i
-
-	return best_idx, best_value
+	smoothed = spectrum[start_idx:end_idx - 2] + spectrum[start_idx + 1:end_idx - 1] + spectrum[start_idx + 2:end_idx]
+	local_idx = int(np.argmax(smoothed))
+	return start_idx + 1 + local_idx, float(smoothed[local_idx])
 
 
 class HeartRateEstimator:
@@ -83,7 +103,9 @@ class HeartRateEstimator:
 		self.fft_padding_factor = fft_padding_factor
 		self.use_harmonic_product = use_harmonic_product
 		self._last_hr: float | None = None
-		self._hr_history: list[float] = []
+		self._hr_history: deque[float] = deque(maxlen=10)
+		self._power: NDArray[np.float32] | None = None  # reused |rFFT|^2 buffer
+		self._fft_scratch = _FFTScratch()
 
 	def estimate(self, signal: NDArray[np.float32]) -> tuple[float | None, float]:
 		"""Returns (heart_rate_bpm, confidence)."""
@@ -107,20 +129,28 @@ class HeartRateEstimator:
 		if len(signal) < 20:
 			return EstimationResult(rate_bpm=None, confidence=0.0)
 
-		n_fft = len(signal) * self.fft_padding_factor
-		fft_result = np.fft.rfft(signal, n=n_fft)
-		freqs = np.fft.rfftfreq(n_fft, 1.0 / self.sample_rate_hz)
-		magnitude = np.abs(fft_result)
+		spectrum = VitalsSpectrum(signal, self.sample_rate_hz, self.fft_padding_factor, out=self._power, scratch=self._fft_scratch)
+		self._power = spectrum.power
+		return self.estimate_from_spectrum(spectrum, use_harmonic)
 
-		# Find frequency band indices
-		freq_mask = (freqs >= self.freq_min_hz) & (freqs <= self.freq_max_hz)
-		band_indices = np.where(freq_mask)[0]
+	def estimate_from_spectrum(
+		self,
+		spectrum: VitalsSpectrum,
+		use_harmonic: bool | None = None,
+	) -> EstimationResult:
+		"""Estimate heart rate from a precomputed spectrum.
 
-		if len(band_indices) == 0:
+		Allows one VitalsSpectrum to be shared with the RR estimator.
+		"""
+		if spectrum.n_samples < 20:
 			return EstimationResult(rate_bpm=None, confidence=0.0)
 
-		start_idx = band_indices[0]
-		end_idx = band_indices[-1] + 1
+		freqs, start_idx, end_idx = _band_indices(
+			spectrum.n_fft, spectrum.sample_rate_hz, self.freq_min_hz, self.freq_max_hz
+		)
+		if end_idx == start_idx:
+			return EstimationResult(rate_bpm=None, confidence=0.0)
+		magnitude = spectrum.magnitude
 
 		# Decide whether to use harmonic product spectrum
 		should_use_harmonic = use_harmonic if use_harmonic is not None else self.use_harmonic_product
@@ -144,16 +174,16 @@ class HeartRateEstimator:
 
 		# Calculate quality metrics using the HR band
 		band_magnitude = magnitude[start_idx:end_idx]
-		mean_mag = np.mean(band_magnitude)
-		median_mag = np.median(band_magnitude)
+		mean_mag, median_mag, noise_floor, total_energy = _band_statistics(band_magnitude)
+
+		# Work in the energy domain: peak and noise-floor power
+		peak_energy = float(peak_mag) ** 2
+		noise_energy = noise_floor * noise_floor
 
 		# SNR: peak power vs noise floor (25th percentile)
-		noise_floor = np.percentile(band_magnitude, 25)
-		snr_db = 20 * np.log10(peak_mag / noise_floor) if noise_floor > 0 else 0.0
+		snr_db = 10 * math.log10(peak_energy / noise_energy) if noise_energy > 0 and peak_energy > 0 else 0.0
 
 		# Spectral purity: energy concentration at peak (0-1, higher=better)
-		total_energy = np.sum(band_magnitude ** 2)
-		peak_energy = peak_mag ** 2
 		spectral_purity = peak_energy / total_energy if total_energy > 0 else 0.0
 
 		# Peak prominence: peak vs median ratio
@@ -172,8 +202,6 @@ class HeartRateEstimator:
 
 		self._last_hr = heart_rate_bpm
 		self._hr_history.append(heart_rate_bpm)
-		if len(self._hr_history) > 10:
-			self._hr_history = self._hr_history[-10:]
 
 		return EstimationResult(
 			rate_bpm=heart_rate_bpm,
@@ -224,18 +252,37 @@ class HeartRateEstimator:
 		"""
 		return self.estimate_with_quality(signal, use_harmonic=True)
 
+	def estimate_with_welch(
+		self,
+		signal: NDArray[np.float32],
+		segment_len: int | None = None,
+		average: str = "mean",
+	) -> EstimationResult:
+		"""Estimate from a Welch-averaged spectrum (50%-overlapping Hann segments).
+
+		Segments default to half the window, giving three averaged
+		periodograms: a steadier HR-band peak at the cost of coarser
+		resolution than the single padded FFT.
+		"""
+		if len(signal) < 20:
+			return EstimationResult(rate_bpm=None, confidence=0.0)
+		if segment_len is None:
+			segment_len = max(20, len(signal) // 2)
+		spectrum = VitalsSpectrum.welch(signal, self.sample_rate_hz, segment_len, self.fft_padding_factor, average)
+		return self.estimate_from_spectrum(spectrum)
+
 	def estimate_with_autocorr(self, signal: NDArray[np.float32]) -> tuple[float | None, float]:
 		"""Alternative autocorrelation-based estimation."""
 		if len(signal) < 40:
 			return None, 0.0
 
-		autocorr = np.correlate(signal, signal, mode="full")
-		autocorr = autocorr[len(autocorr) // 2:]
-		autocorr = autocorr / autocorr[0]
-
 		min_lag = int(self.sample_rate_hz / self.freq_max_hz)
 		max_lag = int(self.sample_rate_hz / self.freq_min_hz)
 
+		autocorr = _autocorrelation(signal, max_lag)
+		if autocorr is None:
+			return None, 0.0
+
 		search = autocorr[min_lag:min(max_lag, len(autocorr))]
 		if len(search) == 0:
 			return None, 0.0
@@ -249,7 +296,7 @@ class HeartRateEstimator:
 	def get_smoothed_hr(self, window: int = 5) -> float | None:
 		if len(self._hr_history) < window:
 			return None
-		return float(np.median(self._hr_history[-window:]))
+		return float(np.median(list(self._hr_history)[-window:]))
 
 	def reset(self) -> None:
 		self._last_hr = None
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import math
+from collections import deque
 from dataclasses import dataclass
 
 import numpy as np
@@ -9,7 +11,16 @@ import structlog
 from numpy.typing import NDArray
 from scipy import signal as sp_signal
 
-from ambient.vitals.heart_rate import _find_peak_with_smoothing
+from ambient.vitals.heart_rate import _band_statistics, _find_peak_with_smoothing
+from ambient.vitals.spectrum import (
+	_BAND_DFT_MAX_TERMS,
+	VitalsSpectrum,
+	_autocorrelation,
+	_band_indices,
+	_band_power,
+	_fft_length,
+	_FFTScratch,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -24,11 +35,21 @@ class RREstimationResult:
 	peak_prominence: float = 0.0
 
 
+def _noise_floor_mean(band: NDArray[np.float32]) -> float:
+	"""Mean of the lowest quarter (at least 4 bins) of a band, via np.partition."""
+	k = min(len(band), max(4, len(band) // 4))
+	return float(np.partition(band, k - 1)[:k].mean())
+
+
 class RespiratoryRateEstimator:
 	"""FFT-based respiratory rate estimation (0.1-0.6 Hz band).
 
 	Implements TI's algorithm enhancement:
 	- 3-sample smoothed peak detection to reduce noise sensitivity
+
+	With use_noise_floor_confidence, confidence compares the peak to the
+	mean of the quietest quarter of the band rather than the whole-band
+	mean, which the peak itself inflates.
 	"""
 
 	def __init__(
@@ -38,14 +59,20 @@ class RespiratoryRateEstimator:
 		freq_max_hz: float = 0.6,
 		fft_padding_factor: int = 4,
 		use_smoothed_peak: bool = True,
+		min_variance: float = 1e-6,
+		use_noise_floor_confidence: bool = False,
 	) -> None:
 		self.sample_rate_hz = sample_rate_hz
 		self.freq_min_hz = freq_min_hz
 		self.freq_max_hz = freq_max_hz
 		self.fft_padding_factor = fft_padding_factor
 		self.use_smoothed_peak = use_smoothed_peak
+		self.min_variance = min_variance  # quieter windows skip the FFT
+		self.use_noise_floor_confidence = use_noise_floor_confidence
 		self._last_rr: float | None = None
-		self._rr_history: list[float] = []
+		self._rr_history: deque[float] = deque(maxlen=10)
+		self._power: NDArray[np.float32] | None = None  # reused |rFFT|^2 buffer
+		self._fft_scratch = _FFTScratch()
 
 	def estimate(self, signal: NDArray[np.float32]) -> tuple[float | None, float]:
 		"""Returns (respiratory_rate_bpm, confidence)."""
@@ -57,51 +84,77 @@ class RespiratoryRateEstimator:
 		if len(signal) < 20:
 			return RREstimationResult(rate_bpm=None, confidence=0.0)
 
-		n_fft = len(signal) * self.fft_padding_factor
-		fft_result = np.fft.rfft(signal, n=n_fft)
-		freqs = np.fft.rfftfreq(n_fft, 1.0 / self.sample_rate_hz)
-		magnitude = np.abs(fft_result)
+		# A flat window cannot carry a breathing peak; skip the padded FFT
+		if float(np.var(signal)) < self.min_variance:
+			return RREstimationResult(rate_bpm=None, confidence=0.0)
+
+		# The RR band is a few dozen bins of the padded spectrum: evaluate
+		# just those directly instead of the full rFFT
+		n_fft = _fft_length(len(signal), self.fft_padding_factor)
+		freqs, start_idx, end_idx = _band_indices(n_fft, self.sample_rate_hz, self.freq_min_hz, self.freq_max_hz)
+		if end_idx == start_idx:
+			return RREstimationResult(rate_bpm=None, confidence=0.0)
+		if (end_idx - start_idx) * len(signal) <= _BAND_DFT_MAX_TERMS:
+			band_magnitude = np.sqrt(_band_power(signal, n_fft, start_idx, end_idx))
+			return self._estimate_from_band(freqs, start_idx, band_magnitude)
+
+		spectrum = VitalsSpectrum(signal, self.sample_rate_hz, self.fft_padding_factor, out=self._power, scratch=self._fft_scratch)
+		self._power = spectrum.power
+		return self.estimate_from_spectrum(spectrum)
 
-		# Find frequency band indices
-		freq_mask = (freqs >= self.freq_min_hz) & (freqs <= self.freq_max_hz)
-		band_indices = np.where(freq_mask)[0]
+	def estimate_from_spectrum(self, spectrum: VitalsSpectrum) -> RREstimationResult:
+		"""Estimate respiratory rate from a precomputed spectrum.
 
-		if len(band_indices) == 0:
+		Allows one VitalsSpectrum to be shared with the HR estimator.
+		"""
+		if spectrum.n_samples < 20:
 			return RREstimationResult(rate_bpm=None, confidence=0.0)
 
-		start_idx = band_indices[0]
-		end_idx = band_indices[-1] + 1
+		freqs, start_idx, end_idx = _band_indices(
+			spectrum.n_fft, spectrum.sample_rate_hz, self.freq_min_hz, self.freq_max_hz
+		)
+		if end_idx == start_idx:
+			return RREstimationResult(rate_bpm=None, confidence=0.0)
+		# Only the RR band needs magnitudes
+		return self._estimate_from_band(freqs, start_idx, spectrum.band_magnitude(start_idx, end_idx))
 
+	def _estimate_from_band(
+		self, freqs: NDArray[np.float64], start_idx: int, band_magnitude: NDArray[np.float32]
+	) -> RREstimationResult:
+		"""Rate and quality metrics from the RR-band magnitudes starting at bin start_idx."""
 		# Use 3-sample smoothed peak detection (TI algorithm) or simple argmax
 		if self.use_smoothed_peak:
-			peak_idx, _ = _find_peak_with_smoothing(magnitude, start_idx, end_idx)
+			local_idx, _ = _find_peak_with_smoothing(band_magnitude)
 		else:
-			band_magnitude = magnitude[start_idx:end_idx]
-			peak_idx = start_idx + int(np.argmax(band_magnitude))
+			local_idx = int(np.argmax(band_magnitude))
 
+		peak_idx = start_idx + local_idx
 		peak_freq = freqs[peak_idx]
-		peak_mag = magnitude[peak_idx]
+		peak_mag = band_magnitude[local_idx]
 		rr_bpm = peak_freq * 60.0
 
 		# Calculate quality metrics using the RR band
-		band_magnitude = magnitude[start_idx:end_idx]
-		mean_mag = np.mean(band_magnitude)
-		median_mag = np.median(band_magnitude)
+		mean_mag, median_mag, noise_floor, total_energy = _band_statistics(band_magnitude)
+
+		# Work in the energy domain: peak and noise-floor power
+		peak_energy = float(peak_mag) ** 2
+		noise_energy = noise_floor * noise_floor
 
 		# SNR: peak power vs noise floor (25th percentile)
-		noise_floor = np.percentile(band_magnitude, 25)
-		snr_db = 20 * np.log10(peak_mag / noise_floor) if noise_floor > 0 else 0.0
+		snr_db = 10 * math.log10(peak_energy / noise_energy) if noise_energy > 0 and peak_energy > 0 else 0.0
 
 		# Spectral purity: energy concentration at peak
-		total_energy = np.sum(band_magnitude ** 2)
-		peak_energy = peak_mag ** 2
 		spectral_purity = peak_energy / total_energy if total_energy > 0 else 0.0
 
 		# Peak prominence
 		peak_prominence = (peak_mag / median_mag - 1) if median_mag > 0 else 0.0
 
 		# Confidence calculation
-		confidence = min(1.0, (peak_mag / mean_mag - 1) / 3.0) if mean_mag > 0 else 0.0
+		if self.use_noise_floor_confidence:
+			reference = _noise_floor_mean(band_magnitude)
+		else:
+			reference = mean_mag
+		confidence = min(1.0, (peak_mag / reference - 1) / 3.0) if reference > 0 else 0.0
 
 		# Boost confidence if SNR is good
 		if snr_db > 10:
@@ -112,8 +165,6 @@ class RespiratoryRateEstimator:
 
 		self._last_rr = rr_bpm
 		self._rr_history.append(rr_bpm)
-		if len(self._rr_history) > 10:
-			self._rr_history = self._rr_history[-10:]
 
 		return RREstimationResult(
 			rate_bpm=rr_bpm,
@@ -123,6 +174,45 @@ class RespiratoryRateEstimator:
 			peak_prominence=peak_prominence,
 		)
 
+	def estimate_with_welch(self, signal: NDArray[np.float32], segment_len: int = 256) -> RREstimationResult:
+		"""Estimate from a Welch-averaged spectrum (50%-overlapping Hann segments).
+
+		Steadier than a single padded FFT on long windows; short windows
+		degrade to one tapered segment.
+		"""
+		if len(signal) < 20:
+			return RREstimationResult(rate_bpm=None, confidence=0.0)
+		if float(np.var(signal)) < self.min_variance:
+			return RREstimationResult(rate_bpm=None, confidence=0.0)
+
+		spectrum = VitalsSpectrum.welch(signal, self.sample_rate_hz, segment_len, self.fft_padding_factor)
+		return self.estimate_from_spectrum(spectrum)
+
+	def estimate_with_autocorr(self, signal: NDArray[np.float32]) -> tuple[float | None, float]:
+		"""Autocorrelation-based estimation over the breathing lag range.
+
+		Resolution is one sample of lag rather than one (padded) FFT bin.
+		find_peaks only accepts local maxima, so the decaying edge at the
+		shortest lag is never taken for the period.
+		"""
+		if len(signal) < 40:
+			return None, 0.0
+
+		min_lag = max(1, int(self.sample_rate_hz / self.freq_max_hz))
+		max_lag = int(self.sample_rate_hz / self.freq_min_hz)
+
+		autocorr = _autocorrelation(signal, max_lag + 1)
+		if autocorr is None or len(autocorr) <= min_lag:
+			return None, 0.0
+
+		search = autocorr[min_lag:]
+		peaks, _ = sp_signal.find_peaks(search, distance=max(1, min_lag // 2))
+		if len(peaks) == 0:
+			return None, 0.0
+
+		lag = int(peaks[np.argmax(search[peaks])]) + min_lag
+		return 60.0 * self.sample_rate_hz / lag, max(0.0, float(autocorr[lag]))
+
 	def estimate_with_peak_counting(self, signal: NDArray[np.float32]) -> tuple[float | None, float]:
 		"""Alternative peak-counting method."""
 		if len(signal) < 40:
@@ -134,14 +224,21 @@ class RespiratoryRateEstimator:
 		if len(peaks) < 2:
 			return None, 0.0
 
-		intervals = np.diff(peaks) / self.sample_rate_hz
-		mean_interval = np.mean(intervals)
+		# Interval statistics over a handful of peaks: plain Python beats
+		# the dispatch cost of np.diff/np.mean/np.std here.
+		idx = peaks.tolist()
+		n_intervals = len(idx) - 1
+		mean_interval = (idx[-1] - idx[0]) / n_intervals / self.sample_rate_hz
 
 		if mean_interval <= 0:
 			return None, 0.0
 
 		rr_bpm = 60.0 / mean_interval
-		cv = np.std(intervals) / mean_interval if len(intervals) > 1 else 0.7
+		if n_intervals > 1:
+			mean_sq = sum((b - a) ** 2 for a, b in zip(idx, idx[1:])) / n_intervals / self.sample_rate_hz ** 2
+			cv = math.sqrt(max(0.0, mean_sq - mean_interval * mean_interval)) / mean_interval
+		else:
+			cv = 0.7
 		confidence = max(0.0, 1.0 - cv)
 
 		return rr_bpm, confidence
@@ -149,7 +246,7 @@ class RespiratoryRateEstimator:
 	def get_smoothed_rr(self, window: int = 5) -> float | None:
 		if len(self._rr_history) < window:
 			return None
-		return float(np.median(self._rr_history[-window:]))
+		return float(np.median(list(self._rr_history)[-window:]))
 
 	def reset(self) -> None:
 		self._last_rr = None
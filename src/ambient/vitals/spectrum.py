@@ -0,0 +1,229 @@
+"""Shared rFFT magnitude spectrum for rate estimation."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy import fft as sp_fft
+from scipy import signal as sp_signal
+
+
+@lru_cache(maxsize=16)
+def _fft_length(n_samples: int, padding_factor: int) -> int:
+	"""Padded FFT length rounded up to a 5-smooth size pocketfft handles fast.
+
+	A plain n_samples * padding_factor can carry a large prime factor
+	(201 * 4 = 804 = 2^2 * 3 * 67).
+	"""
+	return sp_fft.next_fast_len(max(1, n_samples * padding_factor), real=True)
+
+
+@lru_cache(maxsize=16)
+def _rfft_freqs(n_fft: int, sample_rate_hz: float) -> NDArray[np.float64]:
+	"""Read-only rFFT frequency axis, shared across estimators."""
+	freqs = sp_fft.rfftfreq(n_fft, 1.0 / sample_rate_hz)
+	freqs.setflags(write=False)
+	return freqs
+
+
+@lru_cache(maxsize=16)
+def _band_indices(
+	n_fft: int, sample_rate_hz: float, freq_min_hz: float, freq_max_hz: float
+) -> tuple[NDArray[np.float64], int, int]:
+	"""rFFT frequency axis and [start, end) bin bounds of a frequency band."""
+	freqs = _rfft_freqs(n_fft, sample_rate_hz)
+	# freqs is ascending, so the inclusive band is a contiguous slice
+	start = int(np.searchsorted(freqs, freq_min_hz, side="left"))
+	end = int(np.searchsorted(freqs, freq_max_hz, side="right"))
+	if end <= start:
+		return freqs, 0, 0
+	return freqs, start, end
+
+
+@lru_cache(maxsize=8)
+def _hann_window(n: int) -> NDArray[np.float32]:
+	"""Read-only periodic Hann window, shared across calls."""
+	window = sp_signal.get_window("hann", n).astype(np.float32)
+	window.setflags(write=False)
+	return window
+
+
+# Largest band-bins x samples product evaluated by direct DFT (basis <= 512 KiB)
+_BAND_DFT_MAX_TERMS = 1 << 16
+
+
+@lru_cache(maxsize=8)
+def _band_dft_basis(n_samples: int, n_fft: int, start: int, end: int) -> NDArray[np.float32]:
+	"""Read-only stacked cos/sin rows for rFFT bins [start, end) of an n_fft-padded window."""
+	k = np.arange(start, end)
+	angle = (2 * np.pi / n_fft) * np.outer(k, np.arange(n_samples))
+	basis = np.concatenate([np.cos(angle), np.sin(angle)]).astype(np.float32)
+	basis.setflags(write=False)
+	return basis
+
+
+def _band_power(signal: NDArray, n_fft: int, start: int, end: int) -> NDArray[np.float32]:
+	"""|rFFT|^2 of bins [start, end) only, by direct DFT.
+
+	Equivalent to a bank of Goertzel filters evaluated as one matrix
+	product; for a narrow band this is cheaper than the full padded rFFT.
+	"""
+	k = end - start
+	y = _band_dft_basis(len(signal), n_fft, start, end) @ np.asarray(signal, dtype=np.float32)
+	y *= y
+	return y[:k] + y[k:]
+
+
+def _autocorrelation(signal: NDArray, n_lags: int) -> NDArray[np.float64] | None:
+	"""Normalized autocorrelation at lags [0, n_lags), or None for a zero signal.
+
+	Positive lags only, via the power spectrum (Wiener-Khinchin); padding
+	to >= 2N-1 keeps the correlation linear, not circular.
+	"""
+	n = len(signal)
+	n_fft = sp_fft.next_fast_len(2 * n - 1, real=True)
+	spectrum = sp_fft.rfft(signal, n=n_fft, workers=-1)
+	power = spectrum.real * spectrum.real + spectrum.imag * spectrum.imag
+	autocorr = sp_fft.irfft(power, n=n_fft, workers=-1)[:max(1, min(n_lags, n))]
+	if autocorr[0] <= 0:
+		return None
+	np.divide(autocorr, autocorr[0], out=autocorr)
+	return autocorr
+
+
+class _FFTScratch:
+	"""Reusable zero-padded float32 FFT input buffer.
+
+	Only the signal prefix is rewritten per call; the padding stays zero,
+	so rfft needs no internal pad-and-copy.
+	"""
+
+	def __init__(self) -> None:
+		self._buffer: NDArray[np.float32] | None = None
+		self._filled = 0
+
+	def load(self, signal: NDArray, n_fft: int) -> NDArray[np.float32]:
+		n = len(signal)
+		if self._buffer is None or len(self._buffer) != n_fft:
+			self._buffer = np.zeros(n_fft, dtype=np.float32)
+		elif self._filled > n:
+			self._buffer[n:self._filled] = 0.0
+		self._buffer[:n] = signal
+		self._filled = n
+		return self._buffer
+
+
+class VitalsSpectrum:
+	"""Zero-padded rFFT power spectrum of a phase window, computed once.
+
+	Lets the HR and RR estimators share one FFT when they analyse the
+	same signal; each reads its own band via band(). Magnitudes are
+	derived from the power lazily, so a narrow band only pays for the
+	square roots it actually uses.
+
+	Example:
+		spectrum = VitalsSpectrum(phase_signal, sample_rate_hz=20.0)
+		hr = hr_estimator.estimate_from_spectrum(spectrum)
+		rr = rr_estimator.estimate_from_spectrum(spectrum)
+	"""
+
+	def __init__(
+		self,
+		signal: NDArray[np.float32],
+		sample_rate_hz: float,
+		padding_factor: int = 4,
+		out: NDArray[np.float32] | None = None,
+		scratch: _FFTScratch | None = None,
+	) -> None:
+		"""
+		Args:
+			signal: Time-domain input window
+			sample_rate_hz: Sample rate of the signal
+			padding_factor: Zero-padding factor (rounded up to a fast FFT length)
+			out: Optional float32 buffer reused for the power if its size fits
+			scratch: Optional reusable zero-padded input buffer
+		"""
+		self.sample_rate_hz = sample_rate_hz
+		self.n_samples = len(signal)
+		self.n_fft = _fft_length(self.n_samples, padding_factor)
+
+		# float32 input keeps scipy.fft in single precision (complex64 output).
+		if scratch is not None and self.n_fft >= self.n_samples:
+			fft_result = sp_fft.rfft(scratch.load(signal, self.n_fft), workers=-1)
+		else:
+			# When the cast made a private copy, pocketfft may work in it
+			x = np.asarray(signal, dtype=np.float32)
+			fft_result = sp_fft.rfft(x, n=self.n_fft, workers=-1, overwrite_x=x is not signal)
+		if out is None or len(out) != len(fft_result):
+			out = np.empty(len(fft_result), dtype=np.float32)
+
+		# |X|^2 without the square root of np.abs/np.hypot
+		re, im = fft_result.real, fft_result.imag
+		np.multiply(re, re, out=out)
+		out += im * im
+		self.power: NDArray[np.float32] = out
+		self._magnitude: NDArray[np.float32] | None = None
+
+	@classmethod
+	def welch(
+		cls,
+		signal: NDArray[np.float32],
+		sample_rate_hz: float,
+		segment_len: int = 256,
+		padding_factor: int = 4,
+		average: str = "mean",
+	) -> VitalsSpectrum:
+		"""Welch-averaged spectrum: Hann-windowed, 50%-overlapping segments.
+
+		All segments go through one batched rfft; averaging their power
+		lowers the variance of the spectrum compared with a single FFT.
+		average="median" takes the per-bin median instead, which rejects a
+		segment spoiled by a motion burst (unscaled; only band shape matters).
+		"""
+		if average not in ("mean", "median"):
+			raise ValueError(f"average must be 'mean' or 'median', got {average!r}")
+		x = np.asarray(signal, dtype=np.float32)
+		seg = max(1, min(segment_len, len(x)))
+		hop = max(1, seg // 2)
+		segments = np.lib.stride_tricks.sliding_window_view(x, seg)[::hop]
+		# Constant detrend per segment, then taper (one new array)
+		tapered = segments - segments.mean(axis=1, keepdims=True)
+		tapered *= _hann_window(seg)
+
+		n_fft = _fft_length(seg, padding_factor)
+		fft_result = sp_fft.rfft(tapered, n=n_fft, axis=1, workers=-1, overwrite_x=True)
+		power = fft_result.real * fft_result.real + fft_result.imag * fft_result.imag
+		power = np.median(power, axis=0) if average == "median" else power.mean(axis=0)
+
+		spectrum = cls.__new__(cls)
+		spectrum.sample_rate_hz = sample_rate_hz
+		spectrum.n_samples = len(x)
+		spectrum.n_fft = n_fft
+		spectrum.power = power.astype(np.float32, copy=False)
+		spectrum._magnitude = None
+		return spectrum
+
+	@property
+	def freqs(self) -> NDArray[np.float64]:
+		"""Frequency (Hz) of each spectrum bin."""
+		return _rfft_freqs(self.n_fft, self.sample_rate_hz)
+
+	@property
+	def magnitude(self) -> NDArray[np.float32]:
+		"""Full magnitude spectrum, computed on first access."""
+		if self._magnitude is None:
+			self._magnitude = np.sqrt(self.power)
+		return self._magnitude
+
+	def band(self, freq_min_hz: float, freq_max_hz: float) -> tuple[int, int]:
+		"""[start, end) bin indices covering freq_min_hz..freq_max_hz inclusive."""
+		_, start, end = _band_indices(self.n_fft, self.sample_rate_hz, freq_min_hz, freq_max_hz)
+		return start, end
+
+	def band_magnitude(self, start: int, end: int) -> NDArray[np.float32]:
+		"""Magnitude of bins [start, end) without computing the full spectrum."""
+		if self._magnitude is not None:
+			return self._magnitude[start:end]
+		return np.sqrt(self.power[start:end])
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-from collections import deque
+import math
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
+from types import ModuleType
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import structlog
 
+from ambient.utils.ring_buffer import RingBuffer
+
 if TYPE_CHECKING:
 	from matplotlib.axes import Axes
 	from matplotlib.figure import Figure
@@ -19,7 +25,25 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def _pyplot() -> ModuleType:
+	"""matplotlib.pyplot, imported once on first use.
+
+	matplotlib is the optional ``viz`` extra, so importing ambient.viz
+	must not require it.
+	"""
+	try:
+		import matplotlib.pyplot as plt
+	except ImportError as e:
+		raise ImportError("Plotting requires matplotlib: pip install 'ambient[viz]'") from e
+	return plt
+
+
+VITALS_RATE_HZ = 10  # vitals updates buffered per second
+PHASE_RATE_HZ = 20  # phase samples per second
+
+
+@dataclass(frozen=True, slots=True)
 class PlotConfig:
 	vitals_window_seconds: float = 60.0
 	waveform_window_seconds: float = 10.0
@@ -32,6 +56,65 @@ class PlotConfig:
 	rr_color: str = "#3498db"
 	phase_color: str = "#2ecc71"
 
+	@property
+	def vitals_samples(self) -> int:
+		"""HR/RR history length for vitals_window_seconds."""
+		return int(self.vitals_window_seconds * VITALS_RATE_HZ)
+
+	@property
+	def phase_samples(self) -> int:
+		"""Phase history length for waveform_window_seconds."""
+		return int(self.waveform_window_seconds * PHASE_RATE_HZ)
+
+
+class _Blitter:
+	"""Redraw only the data artists while the axes layout is unchanged.
+
+	A full draw renders everything but the (animated) data artists and
+	caches that as the background; later frames restore it, draw the
+	artists and blit. Falls back to draw_idle on backends without blit.
+	"""
+
+	def __init__(self, fig: Figure, artists: list[Any]) -> None:
+		self._fig = fig
+		self._artists = artists
+		self._background: Any = None
+		self._layout: tuple | None = None
+		self.enabled = bool(getattr(fig.canvas, "supports_blit", False))
+		# Blit-capable canvases (Agg-based) add these beyond FigureCanvasBase
+		self._copy_from_bbox: Callable[[Any], Any] | None = getattr(fig.canvas, "copy_from_bbox", None)
+		self._restore_region: Callable[[Any], None] | None = getattr(fig.canvas, "restore_region", None)
+		self.enabled = self.enabled and self._copy_from_bbox is not None and self._restore_region is not None
+		if self.enabled:
+			for artist in artists:
+				artist.set_animated(True)
+			# Any full draw (including resizes) refreshes the background
+			fig.canvas.mpl_connect("draw_event", self._on_draw)
+
+	def _on_draw(self, event: Any) -> None:
+		if self._copy_from_bbox is not None:
+			self._background = self._copy_from_bbox(self._fig.bbox)
+		self._draw_artists()
+
+	def _draw_artists(self) -> None:
+		for artist in self._artists:
+			self._fig.draw_artist(artist)
+
+	def draw(self, layout: tuple) -> None:
+		"""Blit if `layout` (axis limits, titles) matches the cached background."""
+		canvas = self._fig.canvas
+		if not self.enabled or self._restore_region is None:
+			canvas.draw_idle()
+		elif self._background is None or layout != self._layout:
+			self._layout = layout
+			canvas.draw()
+			canvas.blit(self._fig.bbox)
+		else:
+			self._restore_region(self._background)
+			self._draw_artists()
+			canvas.blit(self._fig.bbox)
+		canvas.flush_events()
+
 
 class RealtimePlotter:
 	"""Live radar data visualization: range profile, scatter, range-Doppler."""
@@ -42,9 +125,13 @@ class RealtimePlotter:
 		self._axes: dict[str, Axes] = {}
 		self._lines: dict[str, Any] = {}
 		self._initialized = False
+		self._last_draw = 0.0
+		self._blitter: _Blitter | None = None
+		self._scatter_buf = np.empty((0, 2))  # reused (N, 2) offsets, grown on demand
+		self._pending_rd: np.ndarray | None = None  # latest heatmap not yet drawn
 
 	def setup(self, figsize: tuple[int, int] = (12, 8)) -> None:
-		import matplotlib.pyplot as plt
+		plt = _pyplot()
 
 		self._fig, axes = plt.subplots(2, 2, figsize=figsize)
 		self._fig.suptitle("Radar Monitor")
@@ -77,6 +164,7 @@ class RealtimePlotter:
 		self._lines["rd"] = self._axes["rd"].imshow(np.zeros((64, 64)), aspect="auto", cmap="viridis", origin="lower")
 
 		plt.tight_layout()
+		self._blitter = _Blitter(self._fig, list(self._lines.values()))
 		self._initialized = True
 		logger.info("realtime_plotter_setup")
 
@@ -85,37 +173,66 @@ class RealtimePlotter:
 			self.setup()
 
 		if frame.range_profile is not None:
-			self._lines["range"].set_data(np.arange(len(frame.range_profile)), frame.range_profile)
-			self._axes["range"].relim()
-			self._axes["range"].autoscale_view()
+			profile = frame.range_profile
+			self._lines["range"].set_data(np.arange(len(profile)), profile)
+			# Rescale only when the data leaves the view or shrinks well inside
+			# it, so steady frames keep the layout and can be blitted.
+			ax = self._axes["range"]
+			lo, hi = ax.get_ylim()
+			p_min, p_max = float(np.min(profile)), float(np.max(profile))
+			if (
+				ax.get_xlim()[1] < len(profile) - 1
+				or p_min < lo
+				or p_max > hi
+				or p_max - p_min < 0.25 * (hi - lo)
+			):
+				ax.relim()
+				ax.autoscale_view()
 
 		if frame.detected_points:
-			x = [p.x for p in frame.detected_points]
-			y = [p.y for p in frame.detected_points]
-			self._lines["scatter"].set_offsets(np.column_stack([x, y]))
+			points = frame.detected_points
+			n = len(points)
+			if len(self._scatter_buf) < n:
+				self._scatter_buf = np.empty((max(n, 2 * len(self._scatter_buf)), 2))
+			offsets = self._scatter_buf[:n]
+			offsets[:, 0] = [p.x for p in points]
+			offsets[:, 1] = [p.y for p in points]
+			self._lines["scatter"].set_offsets(offsets)
 
 		if frame.range_doppler_heatmap is not None:
 			rd = frame.range_doppler_heatmap
 			if rd.ndim == 1:
-				size = int(np.sqrt(len(rd)))
-				rd = rd[:size * size].reshape(size, size)
-			self._lines["rd"].set_data(rd)
-			self._lines["rd"].set_clim(rd.min(), rd.max())
-
-		if self._fig:
-			self._fig.canvas.draw_idle()
-			self._fig.canvas.flush_events()
+				size = math.isqrt(len(rd))
+				rd = rd[:size * size].reshape(size, size)  # a view, no copy
+			# Colour limits are applied at the next redraw (see _maybe_redraw)
+			self._pending_rd = rd
+
+		self._maybe_redraw()
+
+	def _maybe_redraw(self) -> None:
+		"""Redraw at most once per update_interval_ms; artists update every frame."""
+		now = time.monotonic()
+		if self._fig and self._blitter and (now - self._last_draw) * 1000 >= self.config.update_interval_ms:
+			if self._pending_rd is not None:
+				# Only the heatmap that is actually drawn needs its min/max
+				# reductions; throttled-away frames skip them.
+				rd = self._pending_rd
+				self._lines["rd"].set_data(rd)
+				self._lines["rd"].set_clim(float(rd.min()), float(rd.max()))
+				self._pending_rd = None
+			ax = self._axes["range"]
+			self._blitter.draw((ax.get_xlim(), ax.get_ylim()))
+			self._last_draw = now
 
 	def show(self) -> None:
-		import matplotlib.pyplot as plt
 		if self._fig:
-			plt.show()
+			_pyplot().show()
 
 	def close(self) -> None:
-		import matplotlib.pyplot as plt
 		if self._fig:
-			plt.close(self._fig)
+			_pyplot().close(self._fig)
 			self._fig = None
+			self._blitter = None
 			self._initialized = False
 
 
@@ -128,19 +245,24 @@ class VitalsPlotter:
 		self._axes: dict[str, Axes] = {}
 		self._lines: dict[str, Any] = {}
 
-		buf_size = int(self.config.vitals_window_seconds * 10)
-		self._hr_buffer: deque[float] = deque(maxlen=buf_size)
-		self._rr_buffer: deque[float] = deque(maxlen=buf_size)
-		self._time_buffer: deque[float] = deque(maxlen=buf_size)
+		buf_size = self.config.vitals_samples
+		self._hr_buffer = RingBuffer(buf_size)
+		self._rr_buffer = RingBuffer(buf_size)
+		self._time_buffer = RingBuffer(buf_size)
 
-		wave_size = int(self.config.waveform_window_seconds * 20)
-		self._phase_buffer: deque[float] = deque(maxlen=wave_size)
+		wave_size = self.config.phase_samples
+		self._phase_buffer = RingBuffer(wave_size)
+		# Sample times relative to the newest phase sample, and an output
+		# buffer for the shifted axis, so update() does a single add
+		self._phase_ages = np.arange(1 - wave_size, 1) * (1 / PHASE_RATE_HZ)
+		self._phase_times = np.empty(wave_size)
 
 		self._initialized = False
 		self._start_time: float | None = None
+		self._last_draw = 0.0
 
 	def setup(self, figsize: tuple[int, int] = (12, 8)) -> None:
-		import matplotlib.pyplot as plt
+		plt = _pyplot()
 
 		self._fig, axes = plt.subplots(3, 1, figsize=figsize)
 		self._fig.suptitle("Vital Signs")
@@ -183,19 +305,20 @@ class VitalsPlotter:
 		self._rr_buffer.append(vitals.respiratory_rate_bpm if vitals.respiratory_rate_bpm else np.nan)
 
 		if vitals.phase_signal is not None:
-			for p in vitals.phase_signal[-10:]:
-				self._phase_buffer.append(p)
+			self._phase_buffer.extend(vitals.phase_signal[-10:])
 
-		times = list(self._time_buffer)
-		self._lines["hr"].set_data(times, list(self._hr_buffer))
+		times = self._time_buffer.view()
+		self._lines["hr"].set_data(times, self._hr_buffer.view())
 		self._axes["hr"].set_xlim(max(0, t - self.config.vitals_window_seconds), t)
 
-		self._lines["rr"].set_data(times, list(self._rr_buffer))
+		self._lines["rr"].set_data(times, self._rr_buffer.view())
 		self._axes["rr"].set_xlim(max(0, t - self.config.vitals_window_seconds), t)
 
 		if self._phase_buffer:
-			pt = np.linspace(t - len(self._phase_buffer) / 20, t, len(self._phase_buffer))
-			self._lines["phase"].set_data(pt, list(self._phase_buffer))
+			# The newest phase sample is at time t
+			n = len(self._phase_buffer)
+			pt = np.add(self._phase_ages[-n:], t, out=self._phase_times[:n])
+			self._lines["phase"].set_data(pt, self._phase_buffer.view())
 			self._axes["phase"].relim()
 			self._axes["phase"].autoscale_view()
 
@@ -204,19 +327,23 @@ class VitalsPlotter:
 		if vitals.respiratory_rate_bpm:
 			self._axes["rr"].set_title(f"Respiratory Rate: {vitals.respiratory_rate_bpm:.0f} BPM")
 
-		if self._fig:
+		self._maybe_redraw()
+
+	def _maybe_redraw(self) -> None:
+		"""Redraw at most once per update_interval_ms; artists update every frame."""
+		now = time.monotonic()
+		if self._fig and (now - self._last_draw) * 1000 >= self.config.update_interval_ms:
 			self._fig.canvas.draw_idle()
 			self._fig.canvas.flush_events()
+			self._last_draw = now
 
 	def show(self) -> None:
-		import matplotlib.pyplot as plt
 		if self._fig:
-			plt.show()
+			_pyplot().show()
 
 	def close(self) -> None:
-		import matplotlib.pyplot as plt
 		if self._fig:
-			plt.close(self._fig)
+			_pyplot().close(self._fig)
 			self._fig = None
 			self._initialized = False
 
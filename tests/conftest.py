@@ -23,9 +23,9 @@ def sample_frame_bytes() -> bytes:
 		0,          # subframe_number
 	)
 	tlv = struct.pack("<II", 1, 48)  # type=1, length=48 (3 points * 16 bytes)
-	points = b""
-	for i in range(3):
-		points += struct.pack("<ffff", 1.0 + i, 0.5 + i * 0.2, 0.1, 0.0)
+	# x, y, z, velocity per point, built as one float32 block
+	i = np.arange(3)
+	points = np.stack([1.0 + i, 0.5 + i * 0.2, np.full(3, 0.1), np.zeros(3)], axis=1).astype("<f4").tobytes()
 	return magic + header + tlv + points
 
 
@@ -11,6 +11,7 @@ from ambient.sensor.frame import (
 	TLV_CHIRP_PHASE_OUTPUT,
 	ChirpComplexRangeFFT,
 	ChirpMotionStatus,
+	ChirpPhaseBatch,
 	ChirpPhaseOutput,
 	ChirpPresence,
 	ChirpTargetInfo,
@@ -20,26 +21,32 @@ from ambient.sensor.frame import (
 )
 from ambient.vitals import ChirpVitalsProcessor, VitalsConfig
 from ambient.vitals.filters import PhaseUnwrapper
+from ambient.vitals.respiratory import RespiratoryRateEstimator
 
 # Fixtures for chirp TLV data
 
+# Little-endian wire layouts of the per-bin TLV records
+PHASE_BIN_DTYPE = np.dtype([("bin_index", "<u2"), ("phase", "<i2"), ("magnitude", "<u2"), ("flags", "<u2")])
+IQ_BIN_DTYPE = np.dtype([("bin_index", "<u2"), ("imag", "<i2"), ("real", "<i2"), ("reserved", "<u2")])
+IQ_PAIR_DTYPE = np.dtype([("imag", "<i2"), ("real", "<i2")])
+
 
 @pytest.fixture
 def chirp_phase_tlv_data() -> bytes:
 	"""PHASE_OUTPUT TLV with 4 bins."""
 	# Header: numBins(2) + centerBin(2) + timestamp_us(4) = 8 bytes
-	header = struct.pack("<HHI", 4, 20, 1000000)
+	buf = bytearray(8 + 4 * PHASE_BIN_DTYPE.itemsize)
+	struct.pack_into("<HHI", buf, 0, 4, 20, 1000000)
 
-	# 4 bins: binIndex(H) + phase(h) + magnitude(H) + flags(H) = 8 bytes each
-	bins = b""
-	for i in range(4):
-		bin_idx = 19 + i
-		phase = int(0.5 * 32768)  # ~π/2 radians (signed int16)
-		magnitude = 1000 + i * 100
-		flags = 0x02  # valid, no motion
-		bins += struct.pack("<HhHH", bin_idx, phase, magnitude, flags)
+	# 4 bins: binIndex(H) + phase(h) + magnitude(H) + flags(H) = 8 bytes each,
+	# written in place through a structured view of the payload
+	bins = np.frombuffer(buf, dtype=PHASE_BIN_DTYPE, offset=8)
+	bins["bin_index"] = 19 + np.arange(4)
+	bins["phase"] = int(0.5 * 32768)  # ~π/2 radians (signed int16)
+	bins["magnitude"] = 1000 + 100 * np.arange(4)
+	bins["flags"] = 0x02  # valid, no motion
 
-	return header + bins
+	return bytes(buf)
 
 
 @pytest.fixture
@@ -67,33 +74,32 @@ def chirp_target_info_tlv_data() -> bytes:
 def chirp_complex_range_fft_data() -> bytes:
 	"""COMPLEX_RANGE_FFT TLV with 8 range bins."""
 	# Header: numBins(2) + chirpIdx(2) + rxAnt(2) + reserved(2) = 8 bytes
-	header = struct.pack("<HHHH", 8, 0, 0, 0)
+	buf = bytearray(8 + 8 * IQ_PAIR_DTYPE.itemsize)
+	struct.pack_into("<HHHH", buf, 0, 8, 0, 0, 0)
 
 	# 8 I/Q pairs: imag(h) + real(h) = 4 bytes each
-	iq_data = b""
-	for i in range(8):
-		imag = int(100 * np.sin(2 * np.pi * i / 8) * 100)  # Sinusoidal test signal
-		real = int(100 * np.cos(2 * np.pi * i / 8) * 100)
-		iq_data += struct.pack("<hh", imag, real)
+	angle = 2 * np.pi * np.arange(8) / 8
+	iq_data = np.frombuffer(buf, dtype=IQ_PAIR_DTYPE, offset=8)
+	iq_data["imag"] = 100 * np.sin(angle) * 100  # Sinusoidal test signal
+	iq_data["real"] = 100 * np.cos(angle) * 100
 
-	return header + iq_data
+	return bytes(buf)
 
 
 @pytest.fixture
 def chirp_target_iq_data() -> bytes:
 	"""TARGET_IQ TLV with 4 bins."""
 	# Header: numBins(2) + centerBin(2) + timestamp_us(4) = 8 bytes
-	header = struct.pack("<HHI", 4, 20, 1000000)
+	buf = bytearray(8 + 4 * IQ_BIN_DTYPE.itemsize)
+	struct.pack_into("<HHI", buf, 0, 4, 20, 1000000)
 
 	# 4 bins: binIndex(H) + imag(h) + real(h) + reserved(H) = 8 bytes each
-	bins = b""
-	for i in range(4):
-		bin_idx = 19 + i
-		imag = 500 + i * 100
-		real = 800 + i * 50
-		bins += struct.pack("<HhhH", bin_idx, imag, real, 0)
+	bins = np.frombuffer(buf, dtype=IQ_BIN_DTYPE, offset=8)  # reserved stays zero
+	bins["bin_index"] = 19 + np.arange(4)
+	bins["imag"] = 500 + 100 * np.arange(4)
+	bins["real"] = 800 + 50 * np.arange(4)
 
-	return header + bins
+	return bytes(buf)
 
 
 @pytest.fixture
@@ -102,8 +108,12 @@ def chirp_frame_bytes(chirp_phase_tlv_data) -> bytes:
 	tlv_length = len(chirp_phase_tlv_data)
 	packet_length = HEADER_SIZE + 8 + tlv_length  # header + tlv header + tlv data
 
-	header = struct.pack(
+	buf = bytearray(packet_length)
+	buf[:len(MAGIC_WORD)] = MAGIC_WORD
+	struct.pack_into(
 		"<IIIIIIII",
+		buf,
+		len(MAGIC_WORD),
 		0x0102,         # version
 		packet_length,  # packet_length
 		0x6843,         # platform
@@ -114,9 +124,10 @@ def chirp_frame_bytes(chirp_phase_tlv_data) -> bytes:
 		0,              # subframe_number
 	)
 
-	tlv_header = struct.pack("<II", TLV_CHIRP_PHASE_OUTPUT, tlv_length)
+	struct.pack_into("<II", buf, HEADER_SIZE, TLV_CHIRP_PHASE_OUTPUT, tlv_length)
+	buf[HEADER_SIZE + 8:] = chirp_phase_tlv_data
 
-	return MAGIC_WORD + header + tlv_header + chirp_phase_tlv_data
+	return bytes(buf)
 
 
 # ChirpPhaseOutput Tests
@@ -175,6 +186,111 @@ class TestChirpPhaseOutput:
 		phase = result.get_center_phase()
 		assert phase is None
 
+	def test_flag_masks(self):
+		header = struct.pack("<HHI", 4, 20, 0)
+		bins = np.zeros(4, dtype=PHASE_BIN_DTYPE)
+		bins["bin_index"] = 20 + np.arange(4)
+		bins["magnitude"] = 1000
+		bins["flags"] = [0x00, 0x01, 0x02, 0x03]
+		result = ChirpPhaseOutput.from_bytes(header + bins.tobytes())
+		assert result is not None
+		np.testing.assert_array_equal(result.valid_mask, [False, False, True, True])
+		np.testing.assert_array_equal(result.motion_mask, [False, True, False, True])
+
+		# Same masks when built from bin objects rather than bytes
+		rebuilt = ChirpPhaseOutput(result.num_bins, result.center_bin, result.timestamp_us, result.bins)
+		np.testing.assert_array_equal(rebuilt.valid_mask, result.valid_mask)
+		np.testing.assert_array_equal(rebuilt.motion_mask, result.motion_mask)
+
+	def test_large_tlv_decodes_like_small(self):
+		"""Frames above the bulk-decode threshold produce the same bins and masks."""
+		bins = np.zeros(40, dtype=PHASE_BIN_DTYPE)
+		bins["bin_index"] = np.arange(40)
+		bins["phase"] = np.linspace(-32768, 32767, 40).astype(np.int16)
+		bins["magnitude"] = 7
+		bins["flags"] = np.arange(40) % 4
+		payload = bins.tobytes()
+
+		large = ChirpPhaseOutput.from_bytes(struct.pack("<HHI", 40, 6, 0) + payload)
+		assert large is not None
+		for i, b in enumerate(large.bins):
+			small = ChirpPhaseOutput.from_bytes(struct.pack("<HHI", 1, 5, 0) + payload[8 * i:8 * i + 8])
+			assert small is not None
+			assert b == small.bins[0]
+		np.testing.assert_array_equal(large.valid_mask, bins["flags"] >= 2)
+		np.testing.assert_array_equal(large.motion_mask, bins["flags"] % 2 == 1)
+		assert large.get_center_phase() == large.bins[6].phase
+		np.testing.assert_allclose(large.phases, [b.phase for b in large.bins], rtol=1e-6)
+		np.testing.assert_array_equal(large.phases, ChirpPhaseOutput(40, 6, 0, large.bins).phases)
+
+	def test_large_tlv_columns_follow_bins_not_buffer(self):
+		"""Masks and phases come from bins: they own their data and track edits."""
+		bins = np.zeros(40, dtype=PHASE_BIN_DTYPE)
+		bins["bin_index"] = np.arange(40)
+		bins["phase"] = 1000
+		bins["flags"] = 0x02
+		buffer = bytearray(struct.pack("<HHI", 40, 0, 0) + bins.tobytes())
+		result = ChirpPhaseOutput.from_bytes(buffer)
+		assert result is not None
+
+		buffer[:] = bytes(len(buffer))
+		assert result.valid_mask.sum() == 40
+		assert result.phases[0] == pytest.approx(result.get_center_phase())
+
+		result.bins[0].is_valid = False
+		result.bins[0].phase = 0.5
+		assert not result.valid_mask[0]
+		assert result.phases[0] == pytest.approx(0.5)
+
+	def test_batch_matches_per_frame_decode(self):
+		rng = np.random.default_rng(5)
+		payloads = []
+		for i in range(30):
+			bins = np.zeros(4, dtype=PHASE_BIN_DTYPE)
+			bins["bin_index"] = 10 + np.arange(4)
+			bins["phase"] = rng.integers(-32768, 32767, 4)
+			bins["magnitude"] = rng.integers(0, 5000, 4)
+			bins["flags"] = rng.integers(0, 4, 4) if i % 7 else 0  # some frames have no valid bin
+			payloads.append(struct.pack("<HHI", 4, 11 + i % 2, 1000 * i) + bins.tobytes())
+
+		for batch in (ChirpPhaseBatch.from_payloads(payloads), ChirpPhaseBatch.from_payloads(payloads + [payloads[0][:16]])):
+			outputs = [ChirpPhaseOutput.from_bytes(p) for p in payloads]
+			phases, found = batch.center_phases()
+			assert len(batch) >= len(outputs)
+			for i, output in enumerate(outputs):
+				assert batch.timestamp_us[i] == output.timestamp_us
+				expected = output.get_center_phase()
+				assert found[i] == (expected is not None)
+				if expected is not None:
+					assert phases[i] == pytest.approx(expected, abs=1e-6)
+				else:
+					assert np.isnan(phases[i])
+
+		# Frames without bins decode to NaN, like get_center_phase's None
+		empty = [struct.pack("<HHI", 0, 0, 0)] * 2
+		assert ChirpPhaseOutput.from_bytes(empty[0]).get_center_phase() is None
+		for batch in (ChirpPhaseBatch.from_payloads(empty), ChirpPhaseBatch.from_payloads([])):
+			phases, found = batch.center_phases()
+			assert len(phases) == len(batch) and not found.any()
+			assert np.isnan(phases).all()
+
+		# The truncated frame in the ragged batch keeps only its first bin
+		ragged = ChirpPhaseBatch.from_payloads([payloads[1], payloads[1][:16]])
+		assert ragged.flags.shape == (2, 4)
+		np.testing.assert_array_equal(ragged.flags[1, 1:], 0)
+
+	def test_truncated_bins_are_dropped(self):
+		"""A partial trailing bin is ignored rather than failing the parse."""
+		header = struct.pack("<HHI", 3, 10, 0)
+		bins = struct.pack("<HhHH", 10, -16384, 7, 0x03) + struct.pack("<HhHH", 11, 0, 8, 0)
+		result = ChirpPhaseOutput.from_bytes(header + bins + b"\x0c\x00\x00")
+		assert result is not None
+		assert result.num_bins == 3
+		assert [b.bin_index for b in result.bins] == [10, 11]
+		assert result.bins[0].phase == pytest.approx(-np.pi / 2)
+		assert result.bins[0].has_motion and result.bins[0].is_valid
+		assert isinstance(result.bins[0].bin_index, int)
+
 	def test_invalid_data(self):
 		result = ChirpPhaseOutput.from_bytes(b"\x00\x00")
 		assert result is None
@@ -254,6 +370,14 @@ class TestChirpComplexRangeFFT:
 		first = result.iq_data[0]
 		assert first.real != 0 or first.imag != 0
 
+	def test_iq_pair_order(self):
+		"""Each pair is (imag, real); a truncated trailing pair is dropped."""
+		header = struct.pack("<HHHH", 3, 1, 2, 0)
+		pairs = struct.pack("<4h", -5, 7, 300, -32768)
+		result = ChirpComplexRangeFFT.from_bytes(header + pairs + b"\x01\x00")
+		assert result is not None
+		np.testing.assert_array_equal(result.iq_data, np.array([7 - 5j, -32768 + 300j], dtype=np.complex64))
+
 	def test_invalid_data(self):
 		result = ChirpComplexRangeFFT.from_bytes(b"\x00\x00")
 		assert result is None
@@ -322,9 +446,8 @@ class TestPhaseUnwrapper:
 	def test_no_jump(self):
 		unwrapper = PhaseUnwrapper()
 		# Small changes don't trigger unwrapping
-		assert unwrapper.unwrap_sample(0.0) == pytest.approx(0.0)
-		assert unwrapper.unwrap_sample(0.1) == pytest.approx(0.1)
-		assert unwrapper.unwrap_sample(0.2) == pytest.approx(0.2)
+		inputs = [0.0, 0.1, 0.2]
+		np.testing.assert_allclose([unwrapper.unwrap_sample(x) for x in inputs], inputs, atol=1e-9)
 
 	def test_positive_wrap(self):
 		unwrapper = PhaseUnwrapper()
@@ -355,7 +478,99 @@ class TestPhaseUnwrapper:
 		unwrapped = unwrapper.unwrap_array(wrapped)
 		# Should be monotonically changing
 		diffs = np.diff(unwrapped)
-		assert all(abs(d) < np.pi for d in diffs)
+		assert (np.abs(diffs) < np.pi).all()
+
+	def test_unwrap_array_batch(self):
+		unwrapper = PhaseUnwrapper()
+		unwrapped = unwrapper.unwrap_array(np.array([0.0, 0.1, 0.2, 3.0, -3.0]))
+		np.testing.assert_allclose(unwrapped, [0.0, 0.1, 0.2, 3.0, -3.0 + 2 * np.pi], atol=1e-6)
+
+	def test_unwrap_array_into_out(self):
+		wrapped = np.array([0.0, 0.1, 0.2, 3.0, -3.0])
+		out = np.empty(5, dtype=np.float32)
+		result = PhaseUnwrapper().unwrap_array(wrapped, out=out)
+		assert result is out
+		np.testing.assert_allclose(out, PhaseUnwrapper().unwrap_array(wrapped))
+		with pytest.raises(ValueError):
+			PhaseUnwrapper().unwrap_array(wrapped, out=np.empty(4))
+
+	def test_unwrap_array_matches_unwrap_sample(self):
+		rng = np.random.default_rng(3)
+		true_phase = np.cumsum(rng.uniform(-2.5, 2.5, 300))
+		wrapped = np.angle(np.exp(1j * true_phase))
+
+		by_sample = PhaseUnwrapper()
+		expected = np.array([by_sample.unwrap_sample(float(p)) for p in wrapped])
+
+		# Chunked calls carry state across the boundary
+		by_array = PhaseUnwrapper()
+		unwrapped = np.concatenate([by_array.unwrap_array(wrapped[:120]), by_array.unwrap_array(wrapped[120:])])
+		np.testing.assert_allclose(unwrapped, expected, atol=1e-4)
+		assert by_array.cumulative_phase == pytest.approx(by_sample.cumulative_phase)
+
+	def test_exact_pi_jump_rounds_the_same_in_both_paths(self):
+		phases = [0.0, np.pi, 0.0, -np.pi]
+		by_sample = PhaseUnwrapper()
+		expected = [by_sample.unwrap_sample(p) for p in phases]
+		np.testing.assert_allclose(PhaseUnwrapper().unwrap_array(np.array(phases)), expected, atol=1e-6)
+
+	def test_max_jump_sets_wrap_threshold(self):
+		# A 2.5 rad step is a wrap for max_jump=2.0 but not for the default π
+		phases = [0.0, 2.5, 2.6]
+		default = PhaseUnwrapper()
+		assert [default.unwrap_sample(p) for p in phases] == pytest.approx(phases)
+		tight = PhaseUnwrapper(max_jump=2.0)
+		expected = [0.0, 2.5 - 2 * np.pi, 2.6 - 2 * np.pi]
+		assert [tight.unwrap_sample(p) for p in phases] == pytest.approx(expected)
+		np.testing.assert_allclose(PhaseUnwrapper(max_jump=2.0).unwrap_array(np.array(phases)), expected, atol=1e-6)
+
+	def test_custom_max_jump_array_matches_sample(self):
+		rng = np.random.default_rng(5)
+		wrapped = np.angle(np.exp(1j * np.cumsum(rng.uniform(-3.0, 3.0, 300))))
+		for max_jump in (1.5, 2.5, 4.0):
+			by_sample = PhaseUnwrapper(max_jump=max_jump)
+			expected = [by_sample.unwrap_sample(float(p)) for p in wrapped]
+			by_array = PhaseUnwrapper(max_jump=max_jump)
+			np.testing.assert_allclose(by_array.unwrap_array(wrapped), expected, atol=1e-4)
+			assert by_array.cumulative_phase == pytest.approx(by_sample.cumulative_phase)
+
+	def test_max_jump_must_be_positive(self):
+		with pytest.raises(ValueError, match="max_jump"):
+			PhaseUnwrapper(max_jump=0.0)
+
+	def test_small_steps_keep_offset_after_wrap(self):
+		unwrapper = PhaseUnwrapper()
+		unwrapper.unwrap_sample(3.0)
+		assert unwrapper.unwrap_sample(-3.0) == pytest.approx(-3.0 + 2 * np.pi)
+		# Sub-π steps after the wrap reuse the stored offset
+		assert unwrapper.unwrap_sample(-2.9) == pytest.approx(-2.9 + 2 * np.pi)
+		assert unwrapper.cumulative_phase == pytest.approx(2 * np.pi)
+
+	def test_unwrap_array_matches_np_unwrap(self):
+		rng = np.random.default_rng(11)
+		wrapped = np.angle(np.exp(1j * np.cumsum(rng.uniform(-3.0, 3.0, 500))))
+		unwrapped = PhaseUnwrapper().unwrap_array(wrapped)
+		np.testing.assert_allclose(unwrapped, np.unwrap(wrapped), atol=1e-4)
+
+	def test_cumulative_phase_is_whole_periods(self):
+		# 200k samples stepping 3 rad, fed as 200-sample chunks: ~95k wraps
+		true_phase = 3.0 * np.arange(200_000)
+		wrapped = np.angle(np.exp(1j * true_phase))
+		unwrapper = PhaseUnwrapper()
+		for chunk in np.split(wrapped, 1000):
+			unwrapper.unwrap_array(chunk)
+		periods = unwrapper.cumulative_phase / (2 * np.pi)
+		assert periods == round(periods)
+		assert wrapped[-1] + unwrapper.cumulative_phase == pytest.approx(true_phase[-1], abs=1e-6)
+
+	def test_long_stream_has_no_offset_drift(self):
+		# 20000 samples at 3 rad/step: thousands of wraps without accumulated error
+		true_phase = 3.0 * np.arange(20000)
+		wrapped = np.angle(np.exp(1j * true_phase))
+		unwrapper = PhaseUnwrapper()
+		for p in wrapped:
+			last = unwrapper.unwrap_sample(float(p))
+		assert last == pytest.approx(true_phase[-1], abs=1e-6)
 
 
 # ChirpVitalsProcessor Tests
@@ -395,6 +610,19 @@ class TestChirpVitalsProcessor:
 
 		assert processor.buffer_fullness > 0.5
 
+	def test_phase_window_is_bounded(self, chirp_phase_tlv_data):
+		config = VitalsConfig(sample_rate_hz=20.0, window_seconds=5.0)
+		processor = ChirpVitalsProcessor(config)
+		phase_output = ChirpPhaseOutput.from_bytes(chirp_phase_tlv_data)
+		assert phase_output is not None
+
+		for i in range(150):
+			vitals = processor.process_chirp_phase(phase_output, timestamp=i * 0.05)
+
+		assert processor.buffer_fullness == 1.0
+		assert vitals.phase_signal is not None
+		assert len(vitals.phase_signal) == 100
+
 	def test_reset(self, chirp_phase_tlv_data):
 		processor = ChirpVitalsProcessor()
 		phase_output = ChirpPhaseOutput.from_bytes(chirp_phase_tlv_data)
@@ -436,48 +664,72 @@ class TestChirpVitalsProcessor:
 # Integration Tests
 
 
+def _single_bin_phase_outputs(t: np.ndarray, phases: np.ndarray) -> list[ChirpPhaseOutput]:
+	"""One PHASE_OUTPUT TLV per sample: a single valid center bin (20) at 1000 magnitude."""
+	tlvs = np.zeros(len(t), dtype=[("num_bins", "<u2"), ("center_bin", "<u2"), ("timestamp_us", "<u4"), ("bin", PHASE_BIN_DTYPE)])
+	tlvs["num_bins"] = 1
+	tlvs["center_bin"] = 20
+	tlvs["timestamp_us"] = t * 1e6
+	# Signed Q15 phase, truncated toward zero
+	tlvs["bin"]["phase"] = np.clip(np.trunc(phases / np.pi * 32768), -32768, 32767)
+	tlvs["bin"]["bin_index"] = 20
+	tlvs["bin"]["magnitude"] = 1000
+	tlvs["bin"]["flags"] = 0x02
+	raw = tlvs.tobytes()
+	size = tlvs.dtype.itemsize
+	return [ChirpPhaseOutput.from_bytes(raw[i:i + size]) for i in range(0, len(raw), size)]
+
+
+@pytest.fixture(scope="module")
+def window_time() -> np.ndarray:
+	"""10 seconds at 20 Hz."""
+	return np.linspace(0, 10, 200)
+
+
+@pytest.fixture(scope="module")
+def breathing_phase_outputs(window_time) -> list[ChirpPhaseOutput]:
+	"""15 BPM breathing (0.25 Hz)."""
+	return _single_bin_phase_outputs(window_time, 0.5 * np.sin(2 * np.pi * 0.25 * window_time))
+
+
+@pytest.fixture(scope="module")
+def heart_phase_outputs(window_time) -> list[ChirpPhaseOutput]:
+	"""72 BPM heartbeat (1.2 Hz)."""
+	return _single_bin_phase_outputs(window_time, 0.1 * np.sin(2 * np.pi * 1.2 * window_time))
+
+
+@pytest.fixture(scope="module")
+def combined_phase_outputs(window_time) -> list[ChirpPhaseOutput]:
+	"""Breathing plus heartbeat."""
+	phases = 0.5 * np.sin(2 * np.pi * 0.25 * window_time) + 0.1 * np.sin(2 * np.pi * 1.2 * window_time)
+	return _single_bin_phase_outputs(window_time, phases)
+
+
 class TestChirpVitalsProcessorQualityMetrics:
 	"""Tests for enhanced quality metrics in ChirpVitalsProcessor."""
 
-	def test_phase_stability_calculated(self):
+	def test_phase_stability_calculated(self, window_time, breathing_phase_outputs):
 		"""Test that phase_stability is populated after sufficient samples."""
 		config = VitalsConfig(sample_rate_hz=20.0, window_seconds=5.0)
 		processor = ChirpVitalsProcessor(config)
 
-		# Feed samples with some variation
-		t = np.linspace(0, 6, 120)  # 6 seconds at 20 Hz
-		phases = 0.5 * np.sin(2 * np.pi * 0.25 * t)  # Breathing signal
-
+		# Feed 6 seconds of breathing signal
 		vitals = None
-		for i, phase in enumerate(phases):
-			phase_int = int((phase / np.pi) * 32768)
-			phase_int = max(-32768, min(32767, phase_int))
-			header = struct.pack("<HHI", 1, 20, int(t[i] * 1e6))
-			bin_data = struct.pack("<HhHH", 20, phase_int, 1000, 0x02)
-			phase_output = ChirpPhaseOutput.from_bytes(header + bin_data)
-			vitals = processor.process_chirp_phase(phase_output, timestamp=t[i])
+		for ts, phase_output in zip(window_time[:120], breathing_phase_outputs[:120]):
+			vitals = processor.process_chirp_phase(phase_output, timestamp=ts)
 
 		assert vitals is not None
 		assert vitals.phase_stability >= 0  # Should be calculated
 
-	def test_snr_metrics_populated(self):
+	def test_snr_metrics_populated(self, window_time, combined_phase_outputs):
 		"""Test that hr_snr_db and rr_snr_db are populated."""
 		config = VitalsConfig(sample_rate_hz=20.0, window_seconds=10.0)
 		processor = ChirpVitalsProcessor(config)
 
-		# Feed clean signal
-		t = np.linspace(0, 10, 200)
-		# Combined breathing + heart signal
-		phases = 0.5 * np.sin(2 * np.pi * 0.25 * t) + 0.1 * np.sin(2 * np.pi * 1.2 * t)
-
+		# Feed clean combined breathing + heart signal
 		vitals = None
-		for i, phase in enumerate(phases):
-			phase_int = int((phase / np.pi) * 32768)
-			phase_int = max(-32768, min(32767, phase_int))
-			header = struct.pack("<HHI", 1, 20, int(t[i] * 1e6))
-			bin_data = struct.pack("<HhHH", 20, phase_int, 1000, 0x02)
-			phase_output = ChirpPhaseOutput.from_bytes(header + bin_data)
-			vitals = processor.process_chirp_phase(phase_output, timestamp=t[i])
+		for ts, phase_output in zip(window_time, combined_phase_outputs):
+			vitals = processor.process_chirp_phase(phase_output, timestamp=ts)
 
 		assert vitals is not None
 		# SNR should be calculated for a clean signal
@@ -488,56 +740,101 @@ class TestChirpVitalsProcessorQualityMetrics:
 class TestChirpVitalsIntegration:
 	"""Integration tests simulating real vital signs scenarios."""
 
-	def test_respiratory_rate_estimation(self):
+	def test_respiratory_rate_estimation(self, window_time, breathing_phase_outputs):
 		"""Test RR estimation with simulated breathing signal."""
 		config = VitalsConfig(sample_rate_hz=20.0, window_seconds=10.0)
 		processor = ChirpVitalsProcessor(config)
 
-		# Simulate 10 seconds of data at 20 Hz with 15 BPM breathing
-		t = np.linspace(0, 10, 200)
-		phases = 0.5 * np.sin(2 * np.pi * 0.25 * t)  # 0.25 Hz = 15 BPM
-
+		# 10 seconds of data at 20 Hz with 15 BPM breathing
 		vitals = None
-		for i, phase in enumerate(phases):
-			# Create phase output (phase is signed int16)
-			phase_int = int((phase / np.pi) * 32768)
-			phase_int = max(-32768, min(32767, phase_int))
-			header = struct.pack("<HHI", 1, 20, int(t[i] * 1e6))
-			# binIndex(H), phase(h), magnitude(H), flags(H) per TLV spec
-			bin_data = struct.pack("<HhHH", 20, phase_int, 1000, 0x02)
-			phase_output = ChirpPhaseOutput.from_bytes(header + bin_data)
-
-			vitals = processor.process_chirp_phase(phase_output, timestamp=t[i])
+		for ts, phase_output in zip(window_time, breathing_phase_outputs):
+			vitals = processor.process_chirp_phase(phase_output, timestamp=ts)
 
 		# Should have valid respiratory rate
 		assert vitals is not None
 		if vitals.respiratory_rate_bpm is not None:
 			assert 10 < vitals.respiratory_rate_bpm < 25
 
-	def test_heart_rate_estimation(self):
+	def test_respiratory_rate_autocorr(self, window_time, breathing_phase_outputs):
+		"""rr_autocorr switches the RR estimate to the autocorrelation path."""
+		processor = ChirpVitalsProcessor(VitalsConfig(sample_rate_hz=20.0, window_seconds=10.0, rr_autocorr=True))
+
+		vitals = None
+		for ts, phase_output in zip(window_time, breathing_phase_outputs):
+			vitals = processor.process_chirp_phase(phase_output, timestamp=ts)
+
+		assert vitals is not None and vitals.respiratory_waveform is not None
+		estimator = RespiratoryRateEstimator(sample_rate_hz=20.0)
+		rr_bpm, rr_conf = estimator.estimate_with_autocorr(vitals.respiratory_waveform)
+		assert vitals.respiratory_rate_bpm == pytest.approx(rr_bpm)
+		assert vitals.respiratory_rate_confidence == pytest.approx(rr_conf)
+		assert vitals.respiratory_rate_bpm == pytest.approx(15.0, abs=1.5)
+
+	def test_heart_rate_estimation(self, window_time, heart_phase_outputs):
 		"""Test HR estimation with simulated heart signal."""
 		config = VitalsConfig(sample_rate_hz=20.0, window_seconds=10.0)
 		processor = ChirpVitalsProcessor(config)
 
-		# Simulate 10 seconds at 20 Hz with 72 BPM heart rate
-		t = np.linspace(0, 10, 200)
-		phases = 0.1 * np.sin(2 * np.pi * 1.2 * t)  # 1.2 Hz = 72 BPM
-
+		# 10 seconds at 20 Hz with 72 BPM heart rate
 		vitals = None
-		for i, phase in enumerate(phases):
-			phase_int = int((phase / np.pi) * 32768)
-			phase_int = max(-32768, min(32767, phase_int))
-			header = struct.pack("<HHI", 1, 20, int(t[i] * 1e6))
-			# binIndex(H), phase(h), magnitude(H), flags(H) per TLV spec
-			bin_data = struct.pack("<HhHH", 20, phase_int, 1000, 0x02)
-			phase_output = ChirpPhaseOutput.from_bytes(header + bin_data)
-
-			vitals = processor.process_chirp_phase(phase_output, timestamp=t[i])
+		for ts, phase_output in zip(window_time, heart_phase_outputs):
+			vitals = processor.process_chirp_phase(phase_output, timestamp=ts)
 
 		assert vitals is not None
 		if vitals.heart_rate_bpm is not None:
 			assert 50 < vitals.heart_rate_bpm < 100
 
+	def test_raw_phase_path_matches_tlv_path(self, window_time, combined_phase_outputs):
+		"""process_chirp_phase_raw gives the same vitals as the parsed-TLV path."""
+		via_tlv = ChirpVitalsProcessor(VitalsConfig(sample_rate_hz=20.0, window_seconds=10.0))
+		via_raw = ChirpVitalsProcessor(VitalsConfig(sample_rate_hz=20.0, window_seconds=10.0))
+
+		for ts, phase_output in zip(window_time, combined_phase_outputs):
+			expected = via_tlv.process_chirp_phase(phase_output, timestamp=ts)
+			vitals = via_raw.process_chirp_phase_raw(phase_output.bins[0].phase, 0x02, ts, magnitude=1000)
+
+		assert vitals.heart_rate_bpm == expected.heart_rate_bpm
+		assert vitals.respiratory_rate_bpm == expected.respiratory_rate_bpm
+		np.testing.assert_array_equal(vitals.phase_signal, expected.phase_signal)
+
+	def test_phase_block_matches_per_sample_path(self, window_time, combined_phase_outputs):
+		"""One process_phase_block call ends with the same window as per-frame calls."""
+		per_frame = ChirpVitalsProcessor(VitalsConfig(sample_rate_hz=20.0, window_seconds=10.0))
+		for ts, phase_output in zip(window_time, combined_phase_outputs):
+			expected = per_frame.process_chirp_phase(phase_output, timestamp=ts)
+
+		block = ChirpVitalsProcessor(VitalsConfig(sample_rate_hz=20.0, window_seconds=10.0))
+		phases = np.concatenate([p.phases for p in combined_phase_outputs])
+		vitals = block.process_phase_block(phases, float(window_time[-1]))
+
+		np.testing.assert_allclose(vitals.phase_signal, expected.phase_signal, atol=1e-6)
+		assert vitals.unwrapped_phase == pytest.approx(expected.unwrapped_phase, abs=1e-6)
+		assert vitals.heart_rate_bpm == expected.heart_rate_bpm
+		assert vitals.respiratory_rate_bpm == expected.respiratory_rate_bpm
+
+	def test_estimate_interval_carries_forward(self, window_time, combined_phase_outputs):
+		every = ChirpVitalsProcessor(VitalsConfig(sample_rate_hz=20.0, window_seconds=10.0))
+		hopped = ChirpVitalsProcessor(VitalsConfig(sample_rate_hz=20.0, window_seconds=10.0, estimate_interval=5))
+		estimated = 0
+		for ts, phase_output in zip(window_time, combined_phase_outputs):
+			full = every.process_chirp_phase(phase_output, timestamp=ts)
+			vitals = hopped.process_chirp_phase(phase_output, timestamp=ts)
+			assert vitals.unwrapped_phase == full.unwrapped_phase
+			if vitals.phase_signal is None:
+				assert full.phase_signal is None
+			elif np.array_equal(vitals.phase_signal, full.phase_signal):
+				estimated += 1
+				assert vitals.heart_rate_bpm == full.heart_rate_bpm
+				assert vitals.respiratory_rate_bpm == full.respiratory_rate_bpm
+		ready = len(window_time) - (int(20.0 * 5) - 1)
+		assert estimated == -(-ready // 5)
+
+	def test_raw_phase_path_flags(self):
+		processor = ChirpVitalsProcessor()
+		assert processor.process_chirp_phase_raw(0.1, 0x00, 0.0).unwrapped_phase is None  # not valid
+		assert processor.process_chirp_phase_raw(0.1, 0x03, 0.0).motion_detected
+		assert processor.buffer_fullness == 0.0
+
 
 # Chirp Firmware Detection Tests
 
@@ -617,6 +914,38 @@ class TestChirpFirmwareDetection:
 		assert not result.is_chirp
 		assert result.error is not None
 
+	def test_matched_pattern_is_listed_pattern(self):
+		"""matched_pattern names the pattern, not the matched text."""
+		from ambient.api.state import CHIRP_DETECTION_PATTERNS, detect_chirp_firmware
+
+		result = detect_chirp_firmware("CHIRP: ready")
+		assert result.matched_pattern == r"chirp:"
+		assert result.matched_pattern in CHIRP_DETECTION_PATTERNS
+
+		result = detect_chirp_firmware("UNKNOWN COMMAND")
+		assert result.error == "Error response: unknown command"
+
+	def test_earliest_match_in_response_is_reported(self):
+		"""Among several matches, the earliest in the response wins, not list order."""
+		from ambient.api.state import detect_chirp_firmware
+
+		result = detect_chirp_firmware("PHASE output enabled\nChirp Status: Active")
+		assert result.matched_pattern == r"PHASE"
+
+		result = detect_chirp_firmware("invalid argument: error 3")
+		assert result.error == "Error response: invalid"
+
+	def test_repeated_response_is_cached(self):
+		"""Identical probe responses reuse the same immutable result."""
+		import dataclasses
+
+		from ambient.api.state import detect_chirp_firmware
+
+		first = detect_chirp_firmware("Chirp Status: Active")
+		assert detect_chirp_firmware("Chirp Status: Active") is first
+		with pytest.raises(dataclasses.FrozenInstanceError):
+			first.is_chirp = False
+
 	def test_empty_response(self):
 		"""Empty response indicates connection issue or standard firmware."""
 		from ambient.api.state import detect_chirp_firmware
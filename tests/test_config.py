@@ -72,6 +72,15 @@ class TestAppConfig:
 		assert config.api.port == 9000
 		assert config.api.log_level == "DEBUG"
 
+	def test_from_env_empty_values_keep_defaults(self, monkeypatch):
+		monkeypatch.setenv("AMBIENT_API_PORT", "")
+		monkeypatch.setenv("AMBIENT_API_HOST", "")
+		monkeypatch.setenv("AMBIENT_AUTO_RECONNECT", "TRUE")
+		config = AppConfig.from_env()
+		assert config.api.port == 8000
+		assert config.api.host == "0.0.0.0"
+		assert config.sensor.auto_reconnect is True
+
 	def test_from_file(self, tmp_path):
 		test_data_dir = tmp_path / "ambient_data"
 		config_data = {
@@ -403,6 +403,14 @@ class TestParsedConfig:
         # Range res = c / (2 * BW) = 3e8 / 8e9 = 0.0375 m
         assert np.isclose(cfg.range_resolution_m, 0.0375)
 
+    def test_derived_values_follow_later_edits(self):
+        cfg = ParsedConfig()
+        before = cfg.range_resolution_m
+        cfg.profile.ramp_end_time_us *= 2
+        assert np.isclose(cfg.range_resolution_m, before / 2)
+        cfg.profile = ProfileCfg(idle_time_us=10.0, ramp_end_time_us=40.0)
+        assert np.isclose(cfg.profile.chirp_time_s, 50e-6)
+
     def test_range_resolution_m_zero_bandwidth(self):
         cfg = ParsedConfig()
         cfg.profile.freq_slope_mhz_us = 0.0
@@ -491,6 +499,21 @@ class TestParsedConfig:
         assert any("chirpCfg" in cmd for cmd in commands)
         assert any("frameCfg" in cmd for cmd in commands)
 
+    def test_to_commands_round_trip(self):
+        cfg = parse_config_content("""
+        profileCfg 0 60.25 7 3 39 0 0 100 1 256 7200 0 0 30
+        chirpCfg 0 0 0 0 0 0 0 1
+        cfarCfg -1 1 0 4 2 3 1 15.0 1
+        cfarFovCfg -1 0 0.25 9.0
+        compRangeBiasAndRxChanPhase 0.05 1 0 -1 0 1 0 -1 0 1 0 -1 0 1 0 -1 0 1 0 -1 0 1 0 -1 0
+        vitalSignsCfg 0.3 1.2 20 20 1
+        """)
+        reparsed = parse_config_content("\n".join(cfg.to_commands()))
+
+        assert reparsed.to_commands() == cfg.to_commands()
+        assert reparsed.profile == cfg.profile
+        assert reparsed.comp_range_bias == cfg.comp_range_bias
+
     def test_to_dict(self):
         cfg = ParsedConfig()
         d = cfg.to_dict()
@@ -698,6 +721,13 @@ class TestConfigParser:
         assert len(cfg.raw_commands) == 2
         assert "channelCfg 15 7 0" in cfg.raw_commands
 
+    def test_crlf_and_indented_comments(self):
+        content = "channelCfg 15 5 0\r\n\t% comment\r\n  # another\r\n\r\nadcCfg 2 1  \r\n"
+        cfg = ConfigParser().parse_content(content)
+
+        assert cfg.raw_commands == ["channelCfg 15 5 0", "adcCfg 2 1"]
+        assert cfg.channel.tx_channel_en == 5
+
     def test_parse_complete_config(self):
         content = """
         % TI mmWave Config
@@ -5,6 +5,7 @@ import pytest
 
 from ambient.processing.clutter import ClutterRemoval, MovingAverageClutter, MTIFilter
 from ambient.processing.fft import DopplerFFT, DopplerFFTConfig, RangeFFT, RangeFFTConfig
+from ambient.processing.pipeline import ProcessingPipeline
 
 
 class TestRangeFFT:
@@ -47,6 +48,11 @@ class TestMTIFilter:
 		out = mti.process(np.ones((32, 16)) * 100)
 		assert np.mean(np.abs(out)) > 50
 
+	def test_keeps_float32(self):
+		mti = MTIFilter()
+		mti.process(np.zeros(64, dtype=np.float32))
+		assert mti.process(np.ones(64, dtype=np.float32)).dtype == np.float32
+
 
 class TestMovingAverageClutter:
 	def test_removes_background(self):
@@ -60,6 +66,13 @@ class TestMovingAverageClutter:
 		out = ma.process(static)
 		assert np.mean(np.abs(out)) < 20
 
+	def test_keeps_float32(self):
+		ma = MovingAverageClutter()
+		frame = np.ones(64, dtype=np.float32)
+		for _ in range(15):
+			out = ma.process(frame)
+		assert out.dtype == np.float32
+
 
 class TestClutterRemoval:
 	def test_mti_method(self):
@@ -79,3 +92,15 @@ class TestClutterRemoval:
 		data = np.random.rand(32, 16)
 		out = cr.process(data)
 		assert out.shape == data.shape
+
+
+class TestProcessingPipeline:
+	def test_magnitude_proxy_centers_on_recent_window(self):
+		pipeline = ProcessingPipeline()
+		profile = np.zeros(64, dtype=np.float32)
+		for i in range(250):
+			profile[10] = i
+			phase = pipeline._extract_phase(profile, 10 * 0.044)
+		# Mean over the last 200 magnitudes (50..249) is 149.5
+		assert phase[0] == pytest.approx((249 - 149.5) * 0.1)
+		assert pipeline._target_bin == 10
@@ -4,7 +4,14 @@ import numpy as np
 import pytest
 
 from ambient.sensor.config import SerialConfig
-from ambient.sensor.frame import DetectedPoint, FrameBuffer, FrameHeader, RadarFrame
+from ambient.sensor.frame import (
+	DetectedPoint,
+	FrameBuffer,
+	FrameHeader,
+	RadarFrame,
+	_parse_points,
+	_parse_range_profile,
+)
 from ambient.sensor.radar import RadarSensor, SensorDisconnectedError
 
 
@@ -47,6 +54,24 @@ class TestRadarFrame:
 		assert frame.detected_points[0].x == pytest.approx(1.0)
 		assert frame.detected_points[1].x == pytest.approx(2.0)
 
+	def test_reuses_parsed_header(self, sample_frame_bytes):
+		header = FrameHeader.from_bytes(sample_frame_bytes)
+		frame = RadarFrame.from_bytes(sample_frame_bytes, header=header)
+		assert frame.header is header
+		assert len(frame.detected_points) == 3
+
+	def test_range_profile_in_db(self):
+		raw = np.array([0, 9, 99, 65535], dtype="<u2").tobytes()
+		profile = _parse_range_profile(raw + b"\x01")  # odd trailing byte ignored
+		assert profile.dtype == np.float32
+		np.testing.assert_allclose(profile, 20 * np.log10(np.array([1, 10, 100, 65536])), rtol=1e-6)
+
+	def test_points_with_side_info(self):
+		# 72 bytes: a multiple of 24 but not 16, so 24-byte records
+		raw = np.array([[1, 2, 3, 0.5, 12, 40], [4, 5, 6, -0.5, 9, 41], [7, 8, 9, 0, 6, 42]], dtype="<f4").tobytes()
+		points = _parse_points(raw)
+		assert [(p.x, p.velocity, p.snr, p.noise) for p in points] == [(1, 0.5, 12, 40), (4, -0.5, 9, 41), (7, 0, 6, 42)]
+
 
 class TestFrameBuffer:
 	def test_extract_frame(self, sample_frame_bytes):
@@ -79,6 +104,14 @@ class TestFrameBuffer:
 		frame = buf.extract_frame()
 		assert frame is not None
 
+	def test_back_to_back_frames(self, sample_frame_bytes):
+		buf = FrameBuffer()
+		buf.append(sample_frame_bytes + b"\xff" * 5 + sample_frame_bytes + sample_frame_bytes[:30])
+		assert buf.extract_frame() is not None
+		assert buf.extract_frame() is not None
+		assert buf.extract_frame() is None
+		assert len(buf) == 30  # partial third frame is kept
+
 	def test_clear(self, sample_frame_bytes):
 		buf = FrameBuffer()
 		buf.append(sample_frame_bytes)
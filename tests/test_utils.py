@@ -0,0 +1,44 @@
+"""Tests for utility helpers."""
+
+import numpy as np
+
+from ambient.utils.ring_buffer import RingBuffer
+
+
+class TestRingBuffer:
+	def test_view_before_wrap(self):
+		buf = RingBuffer(4)
+		for v in (1.0, 2.0, 3.0):
+			buf.append(v)
+		assert len(buf) == 3
+		np.testing.assert_array_equal(buf.view(), [1.0, 2.0, 3.0])
+
+	def test_view_is_chronological_after_wrap(self):
+		buf = RingBuffer(4)
+		for v in range(1, 8):
+			buf.append(float(v))
+		assert len(buf) == 4
+		np.testing.assert_array_equal(buf.view(), [4.0, 5.0, 6.0, 7.0])
+
+	def test_extend_matches_append(self):
+		appended, extended = RingBuffer(7), RingBuffer(7)
+		rng = np.random.default_rng(0)
+		for k in (3, 5, 0, 9, 4):
+			block = rng.standard_normal(k)
+			for v in block:
+				appended.append(v)
+			extended.extend(block)
+			np.testing.assert_array_equal(extended.view(), appended.view())
+
+	def test_clear(self):
+		buf = RingBuffer(4)
+		buf.append(1.0)
+		buf.clear()
+		assert len(buf) == 0
+		assert buf.view().size == 0
+
+	def test_dtype(self):
+		buf = RingBuffer(3, dtype=np.float32)
+		buf.append(1.5)
+		assert buf.view().dtype == np.float32
+		assert buf.capacity == 3
@@ -3,10 +3,18 @@
 import numpy as np
 import pytest
 
-from ambient.vitals.extractor import VitalsExtractor, VitalSigns
-from ambient.vitals.filters import BandpassFilter, ExponentialSmoother, MedianFilter
-from ambient.vitals.heart_rate import HeartRateEstimator
+from ambient.vitals.extractor import VitalsConfig, VitalsExtractor, VitalSigns, _phase_delta_std
+from ambient.vitals.filters import (
+	BandpassFilter,
+	ExponentialSmoother,
+	MedianFilter,
+	PhaseFilter,
+	_centered_ramp,
+	_moving_average,
+)
+from ambient.vitals.heart_rate import HeartRateEstimator, _band_statistics
 from ambient.vitals.respiratory import RespiratoryRateEstimator, RREstimationResult
+from ambient.vitals.spectrum import VitalsSpectrum, _band_power, _FFTScratch
 
 
 class TestBandpassFilter:
@@ -24,6 +32,47 @@ class TestBandpassFilter:
 		with pytest.raises(ValueError):
 			BandpassFilter(sample_rate_hz=20.0, low_freq_hz=5.0, high_freq_hz=3.0)
 
+	def test_process_sample_matches_sosfilt(self, sample_phase_signal):
+		from scipy import signal as sp_signal
+
+		f = BandpassFilter(sample_rate_hz=20.0, low_freq_hz=0.8, high_freq_hz=3.0)
+		streamed = [f.process_sample(x) for x in sample_phase_signal[:200]]
+		zi = f._zi_template * sample_phase_signal[0]
+		expected, _ = sp_signal.sosfilt(f._sos, sample_phase_signal[:200], zi=zi)
+		np.testing.assert_allclose(streamed, expected, rtol=1e-9, atol=1e-9)
+
+	def test_coefficients_shared(self):
+		a = BandpassFilter(sample_rate_hz=20.0, low_freq_hz=0.8, high_freq_hz=3.0)
+		b = BandpassFilter(sample_rate_hz=20.0, low_freq_hz=0.8, high_freq_hz=3.0)
+		assert a._sos is b._sos
+		assert a._sections is b._sections
+		assert not a._zi_template.flags.writeable
+
+
+class TestPhaseFilter:
+	def test_detrend_matches_scipy(self, sample_phase_signal):
+		from scipy import signal as sp_signal
+
+		drifting = sample_phase_signal + 0.05 * np.arange(len(sample_phase_signal), dtype=np.float32)
+		out = PhaseFilter().process(drifting)
+		expected = sp_signal.detrend(drifting.astype(np.float64))
+		assert out.dtype == np.float32
+		np.testing.assert_allclose(out, expected, atol=1e-4)
+
+	def test_smoothing_matches_convolve(self, sample_phase_signal):
+		out = PhaseFilter(remove_dc=False, detrend=False, smooth_window=11).process(sample_phase_signal)
+		expected = np.convolve(sample_phase_signal, np.ones(11) / 11, mode="same")
+		np.testing.assert_allclose(out, expected, atol=1e-5)
+
+	def test_moving_average_keeps_float32(self, sample_phase_signal):
+		signal = sample_phase_signal.astype(np.float32)
+		assert _moving_average(signal, 11).dtype == np.float32
+
+	def test_centered_ramp_is_read_only(self):
+		ramp, _ = _centered_ramp(50)
+		assert ramp is _centered_ramp(50)[0]
+		assert not ramp.flags.writeable
+
 
 class TestMedianFilter:
 	def test_removes_spike(self):
@@ -32,6 +81,13 @@ class TestMedianFilter:
 		out = f.process(signal)
 		assert out[2] < 50
 
+	def test_process_sample_sliding_median(self):
+		f = MedianFilter(window_size=3)
+		out = [f.process_sample(x) for x in [1.0, 5.0, 2.0, 100.0, 3.0]]
+		assert out == [1.0, 3.0, 2.0, 5.0, 3.0]
+		f.reset()
+		assert f.process_sample(7.0) == 7.0
+
 
 class TestExponentialSmoother:
 	def test_converges(self):
@@ -44,6 +100,14 @@ class TestExponentialSmoother:
 		s = ExponentialSmoother(alpha=0.5)
 		assert s.update(100.0) == 100.0
 
+	def test_process_matches_update(self):
+		signal = np.random.randn(50).astype(np.float32)
+		batch = ExponentialSmoother(alpha=0.2).process(signal)
+		s = ExponentialSmoother(alpha=0.2)
+		streamed = [s.update(float(x)) for x in signal]
+		assert batch.dtype == np.float32
+		np.testing.assert_allclose(batch, streamed, rtol=1e-5, atol=1e-6)
+
 
 class TestHeartRateEstimator:
 	def test_detects_60bpm(self, sample_phase_signal):
@@ -55,6 +119,31 @@ class TestHeartRateEstimator:
 		assert hr is not None
 		assert 50 <= hr <= 70  # expect ~60 BPM
 
+	def test_autocorr_detects_60bpm(self, sample_phase_signal):
+		f = BandpassFilter(sample_rate_hz=20.0, low_freq_hz=0.8, high_freq_hz=3.0)
+		hr, conf = HeartRateEstimator(sample_rate_hz=20.0).estimate_with_autocorr(f.process(sample_phase_signal))
+		assert hr is not None
+		assert 50 <= hr <= 70
+		assert 0 < conf <= 1
+
+	def test_autocorr_zero_signal(self):
+		assert HeartRateEstimator().estimate_with_autocorr(np.zeros(100, dtype=np.float32)) == (None, 0.0)
+
+	@pytest.mark.parametrize("n", [1, 2, 7, 110])
+	def test_band_statistics_match_numpy(self, n):
+		band = np.random.default_rng(n).random(n).astype(np.float32)
+		expected = (band.mean(), np.median(band), np.percentile(band, 25), np.dot(band, band))
+		np.testing.assert_allclose(_band_statistics(band), expected, rtol=1e-6)
+
+	def test_welch_detects_72bpm(self):
+		t = np.arange(400) / 20.0
+		rng = np.random.default_rng(1)
+		signal = (np.sin(2 * np.pi * 1.2 * t) + 0.5 * rng.standard_normal(len(t))).astype(np.float32)
+		for average in ("mean", "median"):
+			result = HeartRateEstimator(sample_rate_hz=20.0).estimate_with_welch(signal, average=average)
+			assert result.rate_bpm is not None
+			assert 66 <= result.rate_bpm <= 78
+
 	def test_returns_none_for_short_signal(self):
 		est = HeartRateEstimator()
 		hr, conf = est.estimate(np.zeros(10))
@@ -81,6 +170,59 @@ class TestRespiratoryRateEstimator:
 		assert result.snr_db >= 0
 		assert 0 <= result.spectral_purity <= 1
 
+	def test_peak_counting_detects_15bpm(self, sample_phase_signal):
+		f = BandpassFilter(sample_rate_hz=20.0, low_freq_hz=0.1, high_freq_hz=0.6)
+		rr, conf = RespiratoryRateEstimator(sample_rate_hz=20.0).estimate_with_peak_counting(f.process(sample_phase_signal))
+		assert rr is not None
+		assert 12 <= rr <= 18
+		assert 0 < conf <= 1
+
+	def test_autocorr_detects_15bpm(self, sample_phase_signal):
+		f = BandpassFilter(sample_rate_hz=20.0, low_freq_hz=0.1, high_freq_hz=0.6)
+		rr, conf = RespiratoryRateEstimator(sample_rate_hz=20.0).estimate_with_autocorr(f.process(sample_phase_signal))
+		assert rr is not None
+		assert 13 <= rr <= 17
+		assert 0 < conf <= 1
+
+	def test_autocorr_zero_signal(self):
+		assert RespiratoryRateEstimator().estimate_with_autocorr(np.zeros(200, dtype=np.float32)) == (None, 0.0)
+
+	def test_noise_floor_confidence(self, sample_phase_signal):
+		f = BandpassFilter(sample_rate_hz=20.0, low_freq_hz=0.1, high_freq_hz=0.6)
+		filtered = f.process(sample_phase_signal)
+		default = RespiratoryRateEstimator(sample_rate_hz=20.0).estimate_with_quality(filtered)
+		floor = RespiratoryRateEstimator(
+			sample_rate_hz=20.0, use_noise_floor_confidence=True
+		).estimate_with_quality(filtered)
+		assert floor.rate_bpm == default.rate_bpm
+		assert floor.confidence >= default.confidence
+
+	def test_welch_detects_15bpm(self):
+		t = np.arange(1200) / 20.0
+		rng = np.random.default_rng(0)
+		signal = (0.5 * np.sin(2 * np.pi * 0.25 * t) + 0.2 * rng.standard_normal(len(t))).astype(np.float32)
+		result = RespiratoryRateEstimator(sample_rate_hz=20.0).estimate_with_welch(signal)
+		assert result.rate_bpm is not None
+		assert 13 <= result.rate_bpm <= 17
+
+	def test_quiet_signal_skips_estimate(self):
+		est = RespiratoryRateEstimator(sample_rate_hz=20.0)
+		result = est.estimate_with_quality(np.full(200, 0.5, dtype=np.float32))
+		assert result.rate_bpm is None
+		assert result.confidence == 0.0
+
+	def test_history_is_bounded(self, sample_phase_signal):
+		f = BandpassFilter(sample_rate_hz=20.0, low_freq_hz=0.1, high_freq_hz=0.6)
+		filtered = f.process(sample_phase_signal)
+		est = RespiratoryRateEstimator(sample_rate_hz=20.0)
+		assert est.get_smoothed_rr() is None
+		for _ in range(12):
+			est.estimate(filtered)
+		assert len(est._rr_history) == 10
+		assert 10 <= est.get_smoothed_rr() <= 20
+		est.reset()
+		assert est.get_smoothed_rr() is None
+
 	def test_estimate_with_quality_short_signal(self):
 		est = RespiratoryRateEstimator()
 		result = est.estimate_with_quality(np.zeros(10))
@@ -88,6 +230,63 @@ class TestRespiratoryRateEstimator:
 		assert result.confidence == 0.0
 
 
+class TestVitalsSpectrum:
+	def test_shared_spectrum_matches_per_estimator_fft(self, sample_phase_signal):
+		spectrum = VitalsSpectrum(sample_phase_signal, sample_rate_hz=20.0)
+		hr_shared = HeartRateEstimator(sample_rate_hz=20.0).estimate_from_spectrum(spectrum)
+		rr_shared = RespiratoryRateEstimator(sample_rate_hz=20.0).estimate_from_spectrum(spectrum)
+		hr_direct = HeartRateEstimator(sample_rate_hz=20.0).estimate_with_quality(sample_phase_signal)
+		rr_direct = RespiratoryRateEstimator(sample_rate_hz=20.0).estimate_with_quality(sample_phase_signal)
+		assert hr_shared.rate_bpm == hr_direct.rate_bpm
+		assert rr_shared.rate_bpm == rr_direct.rate_bpm
+		assert 10 <= rr_shared.rate_bpm <= 20
+
+	def test_welch_median_rejects_burst(self):
+		t = np.arange(400) / 20.0
+		signal = np.sin(2 * np.pi * 1.2 * t).astype(np.float32)
+		signal[300:340] += 20 * np.sin(2 * np.pi * 2.5 * t[300:340]).astype(np.float32)
+		spectrum = VitalsSpectrum.welch(signal, 20.0, segment_len=100, average="median")
+		assert spectrum.freqs[np.argmax(spectrum.power)] == pytest.approx(1.2, abs=0.1)
+		with pytest.raises(ValueError):
+			VitalsSpectrum.welch(signal, 20.0, average="max")
+
+	def test_fft_length_is_5_smooth(self):
+		n_fft = VitalsSpectrum(np.ones(201, dtype=np.float32), sample_rate_hz=20.0).n_fft
+		assert n_fft >= 804
+		for p in (2, 3, 5):
+			while n_fft % p == 0:
+				n_fft //= p
+		assert n_fft == 1
+
+	def test_band_power_matches_fft_bins(self, sample_phase_signal):
+		spectrum = VitalsSpectrum(sample_phase_signal, sample_rate_hz=20.0)
+		start, end = spectrum.band(0.1, 0.6)
+		band = _band_power(sample_phase_signal, spectrum.n_fft, start, end)
+		np.testing.assert_allclose(band, spectrum.power[start:end], rtol=1e-3, atol=1e-3 * spectrum.power.max())
+
+	def test_scratch_matches_direct_fft(self, sample_phase_signal):
+		scratch = _FFTScratch()
+		# Same padded length, shorter second window: stale samples must be cleared
+		for n in (200, 199):
+			direct = VitalsSpectrum(sample_phase_signal[:n], sample_rate_hz=20.0)
+			reused = VitalsSpectrum(sample_phase_signal[:n], sample_rate_hz=20.0, scratch=scratch)
+			assert reused.n_fft == direct.n_fft
+			np.testing.assert_allclose(reused.power, direct.power, rtol=1e-5, atol=1e-6)
+
+	def test_frequency_axis_shared_and_read_only(self, sample_phase_signal):
+		a = VitalsSpectrum(sample_phase_signal, sample_rate_hz=20.0)
+		b = VitalsSpectrum(sample_phase_signal, sample_rate_hz=20.0)
+		assert a.freqs is b.freqs
+		with pytest.raises(ValueError):
+			a.freqs[0] = 1.0
+
+	def test_band_bounds(self, sample_phase_signal):
+		spectrum = VitalsSpectrum(sample_phase_signal, sample_rate_hz=20.0)
+		start, end = spectrum.band(0.8, 3.0)
+		assert spectrum.freqs[start] >= 0.8
+		assert spectrum.freqs[end - 1] <= 3.0
+
+
 class TestVitalSigns:
 	def test_is_valid(self):
 		valid = VitalSigns(heart_rate_bpm=72.0, respiratory_rate_bpm=15.0, heart_rate_confidence=0.8, respiratory_rate_confidence=0.8)
@@ -128,3 +327,35 @@ class TestVitalsExtractor:
 		ext = VitalsExtractor()
 		ext.process(0.5, timestamp=1.0)
 		assert 0 < ext.buffer_fullness < 0.1
+
+	def test_phase_stability_matches_window_std(self, sample_phase_signal):
+		ext = VitalsExtractor()
+		ext.buffer_size = 150
+		for i, p in enumerate(sample_phase_signal):
+			v = ext.process(float(p), timestamp=i * 0.05)
+		window = sample_phase_signal[-150:].astype(np.float64)
+		assert v.phase_stability == pytest.approx(np.std(np.diff(window)), rel=1e-6)
+
+	def test_buffer_resize_keeps_recent_window(self, sample_phase_signal):
+		ext = VitalsExtractor()
+		for i, p in enumerate(sample_phase_signal[:180]):
+			ext.process(float(p), timestamp=i * 0.05)
+		ext.buffer_size = 120
+		for i, p in enumerate(sample_phase_signal[180:200]):
+			v = ext.process(float(p), timestamp=i * 0.05)
+		window = sample_phase_signal[80:200].astype(np.float64)
+		assert ext.buffer_fullness == 1.0
+		assert v.phase_stability == pytest.approx(np.std(np.diff(window)), rel=1e-6)
+
+	def test_rr_autocorr_routes_rr_through_autocorrelation(self, sample_phase_signal):
+		ext = VitalsExtractor(VitalsConfig(rr_autocorr=True))
+		for i, p in enumerate(sample_phase_signal):
+			v = ext.process(float(p), timestamp=i * 0.05)
+		expected = RespiratoryRateEstimator(sample_rate_hz=20.0).estimate_with_autocorr(v.respiratory_waveform)
+		assert (v.respiratory_rate_bpm, v.respiratory_rate_confidence) == pytest.approx(expected)
+		assert v.respiratory_rate_bpm == pytest.approx(15.0, abs=1.5)
+
+	def test_phase_delta_std(self, sample_phase_signal):
+		signal = sample_phase_signal.astype(np.float32)
+		assert _phase_delta_std(signal) == pytest.approx(np.std(np.diff(signal.astype(np.float64))), rel=1e-4)
+		assert _phase_delta_std(signal[:1]) == 0.0
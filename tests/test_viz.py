@@ -0,0 +1,124 @@
+"""Tests for visualization helpers."""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from ambient.sensor.frame import RadarFrame
+from ambient.vitals.extractor import VitalSigns
+from ambient.viz import plotter as plotter_module
+from ambient.viz.plotter import PlotConfig, RealtimePlotter, VitalsPlotter
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+
+
+class TestPlotConfig:
+	def test_derived_buffer_sizes(self):
+		config = PlotConfig(vitals_window_seconds=30.0, waveform_window_seconds=5.0)
+		assert config.vitals_samples == 300
+		assert config.phase_samples == 100
+
+	def test_frozen(self):
+		with pytest.raises(dataclasses.FrozenInstanceError):
+			PlotConfig().update_interval_ms = 50
+
+
+@pytest.fixture
+def clock(monkeypatch):
+	"""Settable stand-in for time.monotonic as seen by the plotters."""
+	now = [100.0]
+	monkeypatch.setattr(plotter_module.time, "monotonic", lambda: now[0])
+	return now
+
+
+def _count_calls(monkeypatch, obj, name):
+	calls = []
+	original = getattr(obj, name)
+
+	def wrapper(*args, **kwargs):
+		calls.append(args)
+		return original(*args, **kwargs)
+
+	monkeypatch.setattr(obj, name, wrapper)
+	return calls
+
+
+def _profile(scale=1.0):
+	return (scale * (2.0 + np.sin(np.linspace(0, 6, 64)))).astype(np.float32)
+
+
+@pytest.fixture
+def realtime(clock):
+	plotter = RealtimePlotter(PlotConfig(update_interval_ms=100))
+	plotter.setup()
+	yield plotter
+	plotter.close()
+
+
+class TestRealtimePlotterRedraw:
+	def test_background_cached_after_first_draw(self, realtime):
+		assert realtime._blitter is not None and realtime._blitter.enabled
+		assert realtime._blitter._background is None
+		realtime.update(RadarFrame(range_profile=_profile()))
+		assert realtime._blitter._background is not None
+
+	def test_axis_limit_change_forces_full_draw(self, realtime, clock, monkeypatch):
+		assert realtime._fig is not None
+		full_draws = _count_calls(monkeypatch, realtime._fig.canvas, "draw")
+		realtime.update(RadarFrame(range_profile=_profile()))
+		assert len(full_draws) == 1
+
+		# Same layout: restore the background and blit
+		clock[0] += 0.2
+		realtime.update(RadarFrame(range_profile=_profile()))
+		assert len(full_draws) == 1
+
+		# Data leaves the view: autoscale changes the limits, so redraw fully
+		clock[0] += 0.2
+		realtime.update(RadarFrame(range_profile=_profile(scale=10.0)))
+		assert len(full_draws) == 2
+
+	def test_throttled_heatmap_gets_clim_on_next_drawn_frame(self, realtime, clock):
+		realtime.update(RadarFrame(range_doppler_heatmap=np.zeros((8, 8), dtype=np.float32)))
+		image = realtime._lines["rd"]
+
+		# Inside the throttle window: the heatmap is only queued
+		clock[0] += 0.01
+		heatmap = np.arange(64, dtype=np.float32).reshape(8, 8)
+		realtime.update(RadarFrame(range_doppler_heatmap=heatmap))
+		assert image.get_clim() == (0.0, 0.0)
+
+		# The next drawn frame applies it, even without a heatmap of its own
+		clock[0] += 0.2
+		realtime.update(RadarFrame())
+		assert image.get_clim() == (0.0, 63.0)
+		np.testing.assert_array_equal(image.get_array(), heatmap)
+		assert realtime._pending_rd is None
+
+	def test_update_interval_limits_draws(self, realtime, clock, monkeypatch):
+		assert realtime._blitter is not None
+		draws = _count_calls(monkeypatch, realtime._blitter, "draw")
+		for _ in range(10):
+			realtime.update(RadarFrame(range_profile=_profile()))
+			clock[0] += 0.03
+		# Updates at 0, 30, ..., 270 ms with a 100 ms interval draw at 0, 120 and 240 ms
+		assert len(draws) == 3
+
+
+class TestVitalsPlotterRedraw:
+	# The first update sets a zero-width time axis, which matplotlib widens with a warning
+	@pytest.mark.filterwarnings("ignore:Attempting to set identical")
+	def test_update_interval_limits_draws(self, clock, monkeypatch):
+		plotter = VitalsPlotter(PlotConfig(update_interval_ms=100))
+		plotter.setup()
+		try:
+			assert plotter._fig is not None
+			draws = _count_calls(monkeypatch, plotter._fig.canvas, "draw_idle")
+			for i in range(10):
+				plotter.update(VitalSigns(heart_rate_bpm=70.0, respiratory_rate_bpm=15.0, timestamp=i * 0.03))
+				clock[0] += 0.03
+			assert len(draws) == 3
+		finally:
+			plotter.close()